@@ -15,15 +15,201 @@ Environment Variables:
 import os
 import csv
 import sys
+import asyncio
 from datetime import datetime
-from typing import Dict, List, Any
-from neo4j import GraphDatabase
-from neo4j.exceptions import ServiceUnavailable, AuthError
+from itertools import islice
+from typing import Awaitable, Callable, Dict, Iterable, Iterator, List, Any
+from neo4j import AsyncGraphDatabase, AsyncSession, Query
+from neo4j.spatial import CartesianPoint
+from neo4j.exceptions import Neo4jError, ServiceUnavailable, AuthError, TransientError
 from dotenv import load_dotenv
 
 # Load environment variables from .env file
 load_dotenv()
 
+# Number of CSV rows sent to Neo4j per UNWIND call. Neo4j plans list
+# parameters best at 1k-10k rows; relationship rows do two endpoint lookups
+# and a MERGE each, so they are sent in smaller batches than node rows.
+NODE_BATCH_SIZE = 10000
+RELATIONSHIP_BATCH_SIZE = 5000
+
+# Number of rows committed per inner transaction of CALL { ... } IN TRANSACTIONS
+TRANSACTION_ROWS = 1000
+
+# Maximum number of pooled Bolt connections shared by parallel ingest stages
+MAX_CONNECTION_POOL_SIZE = 64
+
+# Seconds to wait for a free pooled connection before failing
+CONNECTION_ACQUISITION_TIMEOUT = 120
+
+# Seconds a batch is retried for after a transient error such as a deadlock
+MAX_TRANSACTION_RETRY_TIME = 30
+
+# Seconds to wait before the first retry of a batch, doubled after each attempt
+RETRY_INITIAL_DELAY = 1
+
+# Number of records requested per pull. Write batches return no records;
+# -1 would buffer whole results, and 0 is not a valid fetch size
+FETCH_SIZE = 1000
+
+# Maximum number of batches submitted to Neo4j at the same time
+MAX_IN_FLIGHT_BATCHES = 8
+
+# Maximum number of batches waiting between two stages of an ingest pipeline
+PIPELINE_QUEUE_SIZE = 4
+
+# Seconds to wait for newly created indexes to come online
+INDEX_TIMEOUT = 600
+
+# Format of the DATE_TIME columns, e.g. 2019-03-01T10:00:00.000+0100
+DATE_TIME_FORMAT = '%Y-%m-%dT%H:%M:%S.%f%z'
+
+# First server version supporting CALL { ... } IN CONCURRENT TRANSACTIONS
+CONCURRENT_TRANSACTIONS_VERSION = (5, 21)
+
+# First server version supporting CREATE OR REPLACE DATABASE (Enterprise Edition only)
+REPLACE_DATABASE_VERSION = (4, 2)
+
+# Columns read from each CSV file, in the order rows are sent to Neo4j, and the
+# type each column is converted to. Columns typed None are kept as strings.
+CSV_COLUMNS = {
+    'person.csv': {
+        'id': None, 'firstName': None, 'lastName': None, 'age': 'INTEGER',
+        'email': None, 'active': 'BOOLEAN', 'employmentType': None,
+    },
+    'company.csv': {
+        'id': None, 'companyName': None, 'foundedYear': 'INTEGER', 'industry': 'STRING', 'employeeCount': 'INTEGER',
+    },
+    'location.csv': {
+        'id': None, 'city': None, 'country': None, 'longitude': 'FLOAT', 'latitude': 'FLOAT',
+    },
+    'works_for.csv': {
+        'personFirstName': None, 'personLastName': None, 'companyName': None,
+        'startDate': 'DATE_TIME', 'position': None, 'salary': 'FLOAT',
+    },
+    'located_in.csv': {
+        'companyName': None, 'city': None, 'country': None, 'since': 'DATE_TIME',
+    },
+    'knows.csv': {
+        'person1FirstName': None, 'person1LastName': None, 'person2FirstName': None,
+        'person2LastName': None, 'relationshipType': None, 'sinceYear': 'INTEGER',
+    },
+}
+
+# Metadata attached to every write so ingestion queries are identifiable server-side
+TX_METADATA = {'app': 'cypher-guard-ingest'}
+
+# The queries below receive rows as lists laid out as in CSV_COLUMNS, with values
+# already converted to their Neo4j types. Location rows carry a single point in
+# place of the longitude and latitude columns, and relationship rows carry the
+# resolved ids of their end nodes as two extra trailing columns.
+#
+# Properties are collected into a map that is written in full when the MERGE
+# creates the entity. When it matches an existing one the map is compared with
+# the stored values first and only written if something changed, so re-ingesting
+# unchanged data does not rewrite every property.
+
+# Merges Person nodes and adds the employment type label in one pass
+PERSON_MERGE_Q = """
+UNWIND $persons AS row
+CALL {
+    WITH row
+    WITH row[1] AS firstName, row[2] AS lastName,
+         {id: row[0], age: row[3], email: row[4], active: row[5], employmentType: row[6]} AS props
+    MERGE (p:Person {firstName: firstName, lastName: lastName})
+    ON CREATE SET p += props
+    ON MATCH SET p += CASE WHEN p{.id, .age, .email, .active, .employmentType} = props THEN {} ELSE props END
+    FOREACH (_ IN CASE WHEN props.employmentType = 'Employee' THEN [1] ELSE [] END | SET p:Employee)
+    FOREACH (_ IN CASE WHEN props.employmentType = 'Contractor' THEN [1] ELSE [] END | SET p:Contractor)
+}
+"""
+
+COMPANY_MERGE_Q = """
+UNWIND $companies AS row
+CALL {
+    WITH row
+    WITH row[1] AS companyName,
+         {id: row[0], foundedYear: row[2], industry: row[3], employeeCount: row[4]} AS props
+    MERGE (c:Company {companyName: companyName})
+    ON CREATE SET c += props
+    ON MATCH SET c += CASE WHEN c{.id, .foundedYear, .industry, .employeeCount} = props THEN {} ELSE props END
+}
+"""
+
+LOCATION_MERGE_Q = """
+UNWIND $locations AS row
+CALL {
+    WITH row
+    WITH row[1] AS city, row[2] AS country,
+         {id: row[0], coordinates: row[3]} AS props
+    MERGE (l:Location {city: city, country: country})
+    ON CREATE SET l += props
+    ON MATCH SET l += CASE WHEN l{.id, .coordinates} = props THEN {} ELSE props END
+}
+"""
+
+WORKS_FOR_MERGE_Q = """
+UNWIND $works_for AS row
+CALL {
+    WITH row
+    WITH row[6] AS personId, row[7] AS companyId,
+         {startDate: row[3], position: row[4], salary: row[5]} AS props
+    MATCH (p:Person {id: personId})
+    MATCH (c:Company {id: companyId})
+    MERGE (p)-[r:WORKS_FOR]->(c)
+    ON CREATE SET r += props
+    ON MATCH SET r += CASE WHEN r{.startDate, .position, .salary} = props THEN {} ELSE props END
+}
+"""
+
+LOCATED_IN_MERGE_Q = """
+UNWIND $located_in AS row
+CALL {
+    WITH row
+    WITH row[4] AS companyId, row[5] AS locationId, {since: row[3]} AS props
+    MATCH (c:Company {id: companyId})
+    MATCH (l:Location {id: locationId})
+    MERGE (c)-[r:LOCATED_IN]->(l)
+    ON CREATE SET r += props
+    ON MATCH SET r += CASE WHEN r{.since} = props THEN {} ELSE props END
+}
+"""
+
+KNOWS_MERGE_Q = """
+UNWIND $knows AS row
+CALL {
+    WITH row
+    WITH row[6] AS person1Id, row[7] AS person2Id, {relationshipType: row[4], sinceYear: row[5]} AS props
+    MATCH (p1:Person {id: person1Id})
+    MATCH (p2:Person {id: person2Id})
+    MERGE (p1)-[r:KNOWS]->(p2)
+    ON CREATE SET r += props
+    ON MATCH SET r += CASE WHEN r{.relationshipType, .sinceYear} = props THEN {} ELSE props END
+}
+"""
+
+def _batched(iterable: Iterable[Any], n: int) -> Iterator[List[Any]]:
+    """Yield successive lists of at most n items from iterable"""
+    iterator = iter(iterable)
+    while True:
+        batch = list(islice(iterator, n))
+        if not batch:
+            return
+        yield batch
+
+
+async def _gather_or_cancel(*aws: Awaitable[Any]) -> List[Any]:
+    """Run awaitables concurrently like asyncio.gather, but when one fails cancel
+    the others and wait for them to finish before raising its error"""
+    tasks = [asyncio.ensure_future(aw) for aw in aws]
+    try:
+        return await asyncio.gather(*tasks)
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        raise
+
 
 class Neo4jIngestor:
     def __init__(self):
@@ -36,52 +222,136 @@ class Neo4jIngestor:
             raise ValueError("NEO4J_PASSWORD environment variable is required")
         
         self.driver = None
+        self.in_flight = None
+        self.server_version = ()
+        
+        # Node ids by node key, filled by the node stages for the relationship stages
+        self.person_ids: Dict[tuple, str] = {}
+        self.company_ids: Dict[tuple, str] = {}
+        self.location_ids: Dict[tuple, str] = {}
+        
+        self.serial_transactions = f"IN TRANSACTIONS OF {TRANSACTION_ROWS} ROWS"
+        self.in_transactions = self.serial_transactions
         self.csv_dir = os.path.join(os.path.dirname(__file__), 'csv')
     
-    def connect(self):
+    async def connect(self):
         """Connect to Neo4j database"""
         try:
-            self.driver = GraphDatabase.driver(self.uri, auth=(self.user, self.password))
-            # Test connection
-            with self.driver.session(database=self.database) as session:
-                result = session.run("RETURN 1 as test")
-                result.single()
-            print(f"✅ Connected to Neo4j at {self.uri}")
+            self.driver = AsyncGraphDatabase.driver(
+                self.uri,
+                auth=(self.user, self.password),
+                max_connection_pool_size=MAX_CONNECTION_POOL_SIZE,
+                connection_acquisition_timeout=CONNECTION_ACQUISITION_TIMEOUT,
+                fetch_size=FETCH_SIZE,
+            )
+            # Test connection and detect the server version
+            async with self.driver.session(database=self.database) as session:
+                result = await session.run("CALL dbms.components() YIELD versions RETURN versions[0] AS version")
+                version = (await result.single())['version']
+            print(f"✅ Connected to Neo4j {version} at {self.uri}")
         except AuthError:
             raise Exception("Authentication failed. Check NEO4J_USER and NEO4J_PASSWORD")
         except ServiceUnavailable:
             raise Exception(f"Could not connect to Neo4j at {self.uri}")
+        
+        self.server_version = self.parse_version(version)
+        if self.server_version >= CONCURRENT_TRANSACTIONS_VERSION:
+            self.in_transactions = f"IN CONCURRENT TRANSACTIONS OF {TRANSACTION_ROWS} ROWS"
     
-    def close(self):
+    @staticmethod
+    def parse_version(version: str) -> tuple:
+        """Parse a server version such as '5.21.0' or '2025.01.0' into a comparable tuple"""
+        parts = []
+        for part in version.split('.'):
+            digits = ''.join(ch for ch in part if ch.isdigit())
+            if not digits:
+                break
+            parts.append(int(digits))
+        return tuple(parts)
+    
+    def write_query(self, text: str, concurrent: bool = True) -> Query:
+        """Wrap an UNWIND subquery in the server's batched transaction clause
+        
+        Queries whose rows lock overlapping nodes pass concurrent=False, so their
+        inner transactions commit one after another and cannot deadlock each other.
+        """
+        clause = self.in_transactions if concurrent else self.serial_transactions
+        return Query(text + clause, metadata=TX_METADATA)
+    
+    async def submit(self, query: Query, **parameters) -> asyncio.Task:
+        """Start sending one batch once an in-flight slot is free and return its task"""
+        await self.in_flight.acquire()
+        task = asyncio.create_task(self._send(query, parameters))
+        # Released however the task ends, even when it is cancelled before it starts
+        task.add_done_callback(lambda _: self.in_flight.release())
+        return task
+    
+    async def _send(self, query: Query, parameters: Dict[str, Any]):
+        """Send one batch in its own session, sessions only run one query at a time
+        
+        The driver does not retry auto-commit queries, so transient errors such as
+        deadlocks are retried here until MAX_TRANSACTION_RETRY_TIME has passed. The
+        batches only MERGE, so sending one again is safe.
+        """
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + MAX_TRANSACTION_RETRY_TIME
+        delay = RETRY_INITIAL_DELAY
+        while True:
+            try:
+                async with self.driver.session(database=self.database) as session:
+                    result = await session.run(query, parameters)
+                    await result.consume()
+                return
+            except TransientError as e:
+                if loop.time() + delay > deadline:
+                    raise
+                print(f"⚠️  Transient error, retrying batch in {delay}s: {e.message}")
+                await asyncio.sleep(delay)
+                delay *= 2
+    
+    async def close(self):
         """Close Neo4j connection"""
         if self.driver:
-            self.driver.close()
+            await self.driver.close()
             print("🔌 Connection closed")
     
-    def clear_database(self):
+    async def clear_database(self):
         """Clear all nodes and relationships from the database"""
-        with self.driver.session(database=self.database) as session:
-            session.run("MATCH (n) DETACH DELETE n")
-            print("🗑️  Database cleared")
+        # Recreating the store is constant time, deleting touches every node and relationship
+        if self.server_version >= REPLACE_DATABASE_VERSION:
+            try:
+                async with self.driver.session(database='system') as session:
+                    query = f"CREATE OR REPLACE DATABASE `{self.database}` WAIT"
+                    await (await session.run(query)).consume()
+                print("🗑️  Database recreated")
+                return
+            except Neo4jError as e:
+                # Community Edition and managed services do not allow replacing databases
+                print(f"⚠️  Could not recreate database, deleting all data instead: {e.message}")
+        
+        async with self.driver.session(database=self.database) as session:
+            query = f"MATCH (n) CALL {{ WITH n DETACH DELETE n }} IN TRANSACTIONS OF {TRANSACTION_ROWS} ROWS"
+            await (await session.run(query)).consume()
+        print("🗑️  Database cleared")
     
-    def create_constraints(self):
-        """Create node key constraints for unique identification"""
+    async def create_constraints(self, session: AsyncSession):
+        """Create node key and id constraints for unique identification"""
         constraints = [
             "CREATE CONSTRAINT person_node_key IF NOT EXISTS FOR (p:Person) REQUIRE (p.firstName, p.lastName) IS NODE KEY",
             "CREATE CONSTRAINT company_node_key IF NOT EXISTS FOR (c:Company) REQUIRE c.companyName IS NODE KEY",
-            "CREATE CONSTRAINT location_node_key IF NOT EXISTS FOR (l:Location) REQUIRE (l.city, l.country) IS NODE KEY"
+            "CREATE CONSTRAINT location_node_key IF NOT EXISTS FOR (l:Location) REQUIRE (l.city, l.country) IS NODE KEY",
+            "CREATE CONSTRAINT person_id IF NOT EXISTS FOR (p:Person) REQUIRE p.id IS UNIQUE",
+            "CREATE CONSTRAINT company_id IF NOT EXISTS FOR (c:Company) REQUIRE c.id IS UNIQUE",
+            "CREATE CONSTRAINT location_id IF NOT EXISTS FOR (l:Location) REQUIRE l.id IS UNIQUE"
         ]
         
-        with self.driver.session(database=self.database) as session:
-            for constraint in constraints:
-                try:
-                    session.run(constraint)
-                    constraint_name = constraint.split('CONSTRAINT')[1].split('IF NOT EXISTS')[0].strip()
-                    print(f"✅ Created constraint: {constraint_name}")
-                except Exception as e:
-                    print(f"⚠️  Constraint may already exist: {e}")
+        # IF NOT EXISTS makes these idempotent, the backing indexes populate in the background
+        for constraint in constraints:
+            await (await session.run(constraint)).consume()
+            constraint_name = constraint.split('CONSTRAINT')[1].split('IF NOT EXISTS')[0].strip()
+            print(f"✅ Created constraint: {constraint_name}")
     
-    def create_indexes(self):
+    async def create_indexes(self, session: AsyncSession):
         """Create additional indexes for performance"""
         indexes = [
             "CREATE INDEX person_email_index IF NOT EXISTS FOR (p:Person) ON (p.email)",
@@ -90,244 +360,302 @@ class Neo4jIngestor:
             "CREATE INDEX location_coordinates_index IF NOT EXISTS FOR (l:Location) ON (l.coordinates)"
         ]
         
-        with self.driver.session(database=self.database) as session:
-            for index in indexes:
-                try:
-                    session.run(index)
-                    index_name = index.split('INDEX')[1].split('IF NOT EXISTS')[0].strip()
-                    print(f"✅ Created index: {index_name}")
-                except Exception as e:
-                    print(f"⚠️  Index may already exist: {e}")
+        # IF NOT EXISTS makes these idempotent, the indexes populate in the background
+        for index in indexes:
+            await (await session.run(index)).consume()
+            index_name = index.split('INDEX')[1].split('IF NOT EXISTS')[0].strip()
+            print(f"✅ Created index: {index_name}")
     
-    def read_csv(self, filename: str) -> List[Dict[str, Any]]:
-        """Read CSV file and return list of dictionaries"""
+    async def await_indexes(self, session: AsyncSession):
+        """Wait until all indexes are online so ingestion MERGEs are index-backed"""
+        await (await session.run("CALL db.awaitIndexes($timeout)", timeout=INDEX_TIMEOUT)).consume()
+        print("✅ All indexes online")
+    
+    def read_csv(self, filename: str) -> Iterator[List[str]]:
+        """Stream the raw values of the columns declared in CSV_COLUMNS for a CSV file"""
         filepath = os.path.join(self.csv_dir, filename)
         if not os.path.exists(filepath):
             raise FileNotFoundError(f"CSV file not found: {filepath}")
         
-        data = []
+        count = 0
         with open(filepath, 'r', newline='', encoding='utf-8') as file:
-            reader = csv.DictReader(file)
+            reader = csv.reader(file)
+            header = next(reader, [])
+            
+            # Resolve each column's position once instead of per row
+            missing = [column for column in CSV_COLUMNS[filename] if column not in header]
+            if missing:
+                raise ValueError(f"CSV file {filename} is missing columns: {', '.join(missing)}")
+            positions = [header.index(column) for column in CSV_COLUMNS[filename]]
+            
             for row in reader:
-                data.append(row)
+                count += 1
+                yield [row[position] for position in positions]
         
-        print(f"📖 Read {len(data)} records from {filename}")
-        return data
+        print(f"📖 Read {count} records from {filename}")
     
-    def convert_value(self, value: str, data_type: str) -> Any:
-        """Convert string values to appropriate data types"""
-        if value == '' or value is None:
-            return None
+    def row_converter(self, filename: str) -> Callable[[List[List[str]]], List[List[Any]]]:
+        """Return a function converting raw batches of a CSV file to typed values"""
+        # Resolve each column's converter once instead of branching per value
+        converters = [self.converter(data_type) if data_type else None for data_type in CSV_COLUMNS[filename].values()]
         
-        try:
-            if data_type == 'INTEGER':
-                return int(value)
-            elif data_type == 'FLOAT':
-                return float(value)
-            elif data_type == 'BOOLEAN':
-                return value.lower() in ('true', '1', '1.0')
-            elif data_type == 'DATE_TIME':
-                return value  # Keep as string for Neo4j
-            elif data_type == 'POINT':
-                return value  # Keep as string for Neo4j
-            else:  # STRING
-                return value
-        except (ValueError, TypeError):
-            print(f"⚠️  Could not convert '{value}' to {data_type}, using string")
-            return value
+        def convert_rows(batch: List[List[str]]) -> List[List[Any]]:
+            return [
+                [convert(value) if convert else value for value, convert in zip(row, converters)]
+                for row in batch
+            ]
+        
+        return convert_rows
     
-    def ingest_persons(self):
-        """Ingest Person nodes with employment type labels"""
-        persons = self.read_csv('person.csv')
-        
-        # Convert data types
-        for person in persons:
-            person['age'] = self.convert_value(person['age'], 'INTEGER')
-            person['active'] = self.convert_value(person['active'], 'BOOLEAN')
-        
-        with self.driver.session(database=self.database) as session:
-            # First, create/merge the base Person nodes
-            base_query = """
-            UNWIND $persons AS person
-            MERGE (p:Person {firstName: person.firstName, lastName: person.lastName})
-            SET p.id = person.id,
-                p.email = person.email,
-                p.age = person.age,
-                p.active = person.active,
-                p.employmentType = person.employmentType
-            """
-            session.run(base_query, persons=persons)
+    def converter(self, data_type: str) -> Callable[[str], Any]:
+        """Return a function converting string values to the given data type"""
+        parse = {
+            'INTEGER': int,
+            'FLOAT': float,
+            'BOOLEAN': lambda value: value.lower() in ('true', '1', '1.0'),
+            'DATE_TIME': lambda value: datetime.strptime(value, DATE_TIME_FORMAT),
+        }.get(data_type, str)  # STRING is kept as is
+        
+        def convert(value: str) -> Any:
+            if value == '' or value is None:
+                return None
             
-            # Add Employee label for employees
-            employee_query = """
-            UNWIND $persons AS person
-            MATCH (p:Person {firstName: person.firstName, lastName: person.lastName})
-            WHERE person.employmentType = 'Employee'
-            SET p:Employee
-            """
-            session.run(employee_query, persons=persons)
+            try:
+                return parse(value)
+            except (ValueError, TypeError):
+                print(f"⚠️  Could not convert '{value}' to {data_type}, using string")
+                return value
+        
+        return convert
+    
+    @staticmethod
+    def with_points(rows: List[List[Any]]) -> List[List[Any]]:
+        """Replace the trailing longitude and latitude columns of location rows with a point"""
+        return [
+            row[:3] + [CartesianPoint((row[3], row[4])) if row[3] is not None and row[4] is not None else None]
+            for row in rows
+        ]
+    
+    @staticmethod
+    def with_end_ids(rows: List[List[Any]], start_ids: Dict[tuple, str], start_key: tuple,
+                     end_ids: Dict[tuple, str], end_key: tuple) -> List[List[Any]]:
+        """Append the resolved start and end node ids to relationship rows"""
+        return [
+            row + [start_ids.get(tuple(row[i] for i in start_key)), end_ids.get(tuple(row[i] for i in end_key))]
+            for row in rows
+        ]
+    
+    @staticmethod
+    def ids_by_key(rows: List[List[Any]], key_positions: tuple) -> Dict[tuple, str]:
+        """Map the node key columns of node rows to the node id in their first column"""
+        return {tuple(row[position] for position in key_positions): row[0] for row in rows}
+    
+    async def ingest(self, filename: str, query: Query, parameter: str, batch_size: int,
+                     prepare: Callable[[List[List[Any]]], List[List[Any]]], serial: bool = False) -> int:
+        """Stream a CSV file through read, prepare and write stages and return the rows written
+        
+        The stages are connected by bounded queues so reading the file, converting a
+        batch and writing a batch to Neo4j overlap, while at most PIPELINE_QUEUE_SIZE
+        batches wait between two stages. Reading and preparing run in worker threads.
+        With serial=True a batch is only sent once the previous one has finished, for
+        stages whose batches would lock the same nodes.
+        
+        No batch is sent after one has failed, and when any stage fails the other
+        stages and the batches still in flight are cancelled before the error is raised.
+        """
+        raw = asyncio.Queue(maxsize=PIPELINE_QUEUE_SIZE)
+        prepared = asyncio.Queue(maxsize=PIPELINE_QUEUE_SIZE)
+        
+        async def read():
+            batches = _batched(self.read_csv(filename), batch_size)
+            while True:
+                batch = await asyncio.to_thread(next, batches, None)
+                await raw.put(batch)
+                if batch is None:
+                    return
+        
+        async def convert():
+            while True:
+                batch = await raw.get()
+                if batch is None:
+                    await prepared.put(None)
+                    return
+                await prepared.put(await asyncio.to_thread(prepare, batch))
+        
+        async def write() -> int:
+            tasks = []
+            failed = []
+            total = 0
             
-            # Add Contractor label for contractors
-            contractor_query = """
-            UNWIND $persons AS person
-            MATCH (p:Person {firstName: person.firstName, lastName: person.lastName})
-            WHERE person.employmentType = 'Contractor'
-            SET p:Contractor
-            """
-            session.run(contractor_query, persons=persons)
+            def record_failure(task: asyncio.Task):
+                if not task.cancelled() and task.exception() is not None:
+                    failed.append(task)
             
-            print(f"✅ Merged {len(persons)} Person nodes with employment type labels")
+            try:
+                while True:
+                    batch = await prepared.get()
+                    if batch is None:
+                        break
+                    if serial and tasks:
+                        await asyncio.wait([tasks[-1]])
+                    # Stop at the first failed batch instead of sending the rest of the file
+                    if failed:
+                        failed[0].result()
+                    task = await self.submit(query, **{parameter: batch})
+                    task.add_done_callback(record_failure)
+                    tasks.append(task)
+                    total += len(batch)
+                await asyncio.gather(*tasks)
+            except BaseException:
+                for task in tasks:
+                    task.cancel()
+                await asyncio.gather(*tasks, return_exceptions=True)
+                raise
+            return total
+        
+        _, _, total = await _gather_or_cancel(read(), convert(), write())
+        return total
     
-    def ingest_companies(self):
-        """Ingest Company nodes"""
-        companies = self.read_csv('company.csv')
+    async def ingest_persons(self):
+        """Ingest Person nodes with employment type labels"""
+        convert_rows = self.row_converter('person.csv')
         
-        query = """
-        UNWIND $companies AS company
-        MERGE (c:Company {companyName: company.companyName})
-        SET c.id = company.id,
-            c.foundedYear = company.foundedYear,
-            c.industry = company.industry,
-            c.employeeCount = company.employeeCount
-        """
+        def prepare(batch: List[List[str]]) -> List[List[Any]]:
+            rows = convert_rows(batch)
+            self.person_ids.update(self.ids_by_key(rows, (1, 2)))  # firstName, lastName
+            return rows
+        
+        total = await self.ingest('person.csv', self.write_query(PERSON_MERGE_Q), 'persons', NODE_BATCH_SIZE, prepare)
+        print(f"✅ Merged {total} Person nodes with employment type labels")
+    
+    async def ingest_companies(self):
+        """Ingest Company nodes"""
+        convert_rows = self.row_converter('company.csv')
         
-        # Convert data types
-        for company in companies:
-            company['foundedYear'] = self.convert_value(company['foundedYear'], 'INTEGER')
-            company['industry'] = self.convert_value(company['industry'], 'STRING')
-            company['employeeCount'] = self.convert_value(company['employeeCount'], 'INTEGER')
+        def prepare(batch: List[List[str]]) -> List[List[Any]]:
+            rows = convert_rows(batch)
+            self.company_ids.update(self.ids_by_key(rows, (1,)))  # companyName
+            return rows
         
-        with self.driver.session(database=self.database) as session:
-            session.run(query, companies=companies)
-            print(f"✅ Merged {len(companies)} Company nodes")
+        total = await self.ingest('company.csv', self.write_query(COMPANY_MERGE_Q), 'companies', NODE_BATCH_SIZE, prepare)
+        print(f"✅ Merged {total} Company nodes")
     
-    def ingest_locations(self):
+    async def ingest_locations(self):
         """Ingest Location nodes"""
-        locations = self.read_csv('location.csv')
+        convert_rows = self.row_converter('location.csv')
         
-        query = """
-        UNWIND $locations AS location
-        MERGE (l:Location {city: location.city, country: location.country})
-        SET l.coordinates = point({x: toFloat(location.longitude), y: toFloat(location.latitude)})
-        """
+        def prepare(batch: List[List[str]]) -> List[List[Any]]:
+            rows = convert_rows(batch)
+            self.location_ids.update(self.ids_by_key(rows, (1, 2)))  # city, country
+            return self.with_points(rows)
         
-        with self.driver.session(database=self.database) as session:
-            session.run(query, locations=locations)
-            print(f"✅ Merged {len(locations)} Location nodes")
+        total = await self.ingest('location.csv', self.write_query(LOCATION_MERGE_Q), 'locations', NODE_BATCH_SIZE, prepare)
+        print(f"✅ Merged {total} Location nodes")
     
-    def ingest_works_for(self):
+    async def ingest_works_for(self):
         """Ingest WORKS_FOR relationships"""
-        works_for = self.read_csv('works_for.csv')
-
-        query = """
-        UNWIND $works_for AS work
-        MATCH (p:Person {firstName: work.personFirstName, lastName: work.personLastName})
-        MATCH (c:Company {companyName: work.companyName})
-        MERGE (p)-[r:WORKS_FOR]->(c)
-        SET r.startDate = datetime(work.startDate),
-            r.position = work.position,
-            r.salary = toFloat(work.salary)
-        """
+        convert_rows = self.row_converter('works_for.csv')
         
-        # Convert data types
-        for work in works_for:
-            work['salary'] = self.convert_value(work['salary'], 'FLOAT')
+        def prepare(batch: List[List[str]]) -> List[List[Any]]:
+            return self.with_end_ids(convert_rows(batch), self.person_ids, (0, 1), self.company_ids, (2,))
         
-        with self.driver.session(database=self.database) as session:
-            session.run(query, works_for=works_for)
-            print(f"✅ Merged {len(works_for)} WORKS_FOR relationships")
+        total = await self.ingest('works_for.csv', self.write_query(WORKS_FOR_MERGE_Q), 'works_for', RELATIONSHIP_BATCH_SIZE, prepare)
+        print(f"✅ Merged {total} WORKS_FOR relationships")
     
-    def ingest_located_in(self):
+    async def ingest_located_in(self):
         """Ingest LOCATED_IN relationships"""
-        located_in = self.read_csv('located_in.csv')
-        print(located_in)
-        query = """
-        UNWIND $located_in AS location
-        MATCH (c:Company {companyName: location.companyName})
-        MATCH (l:Location {city: location.city, country: location.country})
-        MERGE (c)-[r:LOCATED_IN]->(l)
-        SET r.since = datetime(location.since)
-        """
+        convert_rows = self.row_converter('located_in.csv')
         
-        # No data type conversion needed for string properties
+        def prepare(batch: List[List[str]]) -> List[List[Any]]:
+            return self.with_end_ids(convert_rows(batch), self.company_ids, (0,), self.location_ids, (1, 2))
         
-        with self.driver.session(database=self.database) as session:
-            session.run(query, located_in=located_in)
-            print(f"✅ Merged {len(located_in)} LOCATED_IN relationships")
+        total = await self.ingest('located_in.csv', self.write_query(LOCATED_IN_MERGE_Q), 'located_in', RELATIONSHIP_BATCH_SIZE, prepare)
+        print(f"✅ Merged {total} LOCATED_IN relationships")
     
-    def ingest_knows(self):
+    async def ingest_knows(self):
         """Ingest KNOWS relationships"""
-        knows = self.read_csv('knows.csv')
+        convert_rows = self.row_converter('knows.csv')
+        
+        def prepare(batch: List[List[str]]) -> List[List[Any]]:
+            return self.with_end_ids(convert_rows(batch), self.person_ids, (0, 1), self.person_ids, (2, 3))
         
+        # Both ends are Person nodes, so rows of different batches and of different
+        # inner transactions lock overlapping nodes. Write them one at a time.
+        query = self.write_query(KNOWS_MERGE_Q, concurrent=False)
+        total = await self.ingest('knows.csv', query, 'knows', RELATIONSHIP_BATCH_SIZE, prepare, serial=True)
+        print(f"✅ Merged {total} KNOWS relationships")
+    
+    async def get_stats(self, session: AsyncSession):
+        """Get database statistics"""
+        # Each independent count is answered from the counts store, not by scanning
         query = """
-        UNWIND $knows AS know
-        MATCH (p1:Person {firstName: know.person1FirstName, lastName: know.person1LastName})
-        MATCH (p2:Person {firstName: know.person2FirstName, lastName: know.person2LastName})
-        MERGE (p1)-[r:KNOWS]->(p2)
-        SET r.relationshipType = know.relationshipType,
-            r.sinceYear = know.sinceYear
+        CALL { MATCH (p:Person) RETURN count(p) AS persons }
+        CALL { MATCH (c:Company) RETURN count(c) AS companies }
+        CALL { MATCH (l:Location) RETURN count(l) AS locations }
+        CALL { MATCH ()-[r:WORKS_FOR]->() RETURN count(r) AS works_for }
+        CALL { MATCH ()-[r:LOCATED_IN]->() RETURN count(r) AS located_in }
+        CALL { MATCH ()-[r:KNOWS]->() RETURN count(r) AS knows }
+        RETURN persons, companies, locations, works_for, located_in, knows
         """
+        stats = await (await session.run(query)).single()
         
-        # Convert data types
-        for know in knows:
-            know['sinceYear'] = self.convert_value(know['sinceYear'], 'INTEGER')
+        # Node counts
+        person_count = stats['persons']
+        company_count = stats['companies']
+        location_count = stats['locations']
         
-        with self.driver.session(database=self.database) as session:
-            session.run(query, knows=knows)
-            print(f"✅ Merged {len(knows)} KNOWS relationships")
-    
-    def get_stats(self):
-        """Get database statistics"""
-        with self.driver.session(database=self.database) as session:
-            # Node counts
-            person_count = session.run("MATCH (p:Person) RETURN count(p) as count").single()['count']
-            company_count = session.run("MATCH (c:Company) RETURN count(c) as count").single()['count']
-            location_count = session.run("MATCH (l:Location) RETURN count(l) as count").single()['count']
-            
-            # Relationship counts
-            works_for_count = session.run("MATCH ()-[r:WORKS_FOR]->() RETURN count(r) as count").single()['count']
-            located_in_count = session.run("MATCH ()-[r:LOCATED_IN]->() RETURN count(r) as count").single()['count']
-            knows_count = session.run("MATCH ()-[r:KNOWS]->() RETURN count(r) as count").single()['count']
-            
-            print("\n📊 Database Statistics:")
-            print(f"   Nodes: {person_count + company_count + location_count}")
-            print(f"   - Person: {person_count}")
-            print(f"   - Company: {company_count}")
-            print(f"   - Location: {location_count}")
-            print(f"   Relationships: {works_for_count + located_in_count + knows_count}")
-            print(f"   - WORKS_FOR: {works_for_count}")
-            print(f"   - LOCATED_IN: {located_in_count}")
-            print(f"   - KNOWS: {knows_count}")
+        # Relationship counts
+        works_for_count = stats['works_for']
+        located_in_count = stats['located_in']
+        knows_count = stats['knows']
+        
+        print("\n📊 Database Statistics:")
+        print(f"   Nodes: {person_count + company_count + location_count}")
+        print(f"   - Person: {person_count}")
+        print(f"   - Company: {company_count}")
+        print(f"   - Location: {location_count}")
+        print(f"   Relationships: {works_for_count + located_in_count + knows_count}")
+        print(f"   - WORKS_FOR: {works_for_count}")
+        print(f"   - LOCATED_IN: {located_in_count}")
+        print(f"   - KNOWS: {knows_count}")
     
     def run_ingestion(self, clear_db: bool = True):
         """Run the complete ingestion process"""
+        asyncio.run(self._run_ingestion(clear_db))
+    
+    async def _run_ingestion(self, clear_db: bool):
+        """Run the ingestion steps on the asyncio event loop"""
         print("🚀 Starting Neo4j data ingestion...")
         print(f"📁 CSV directory: {self.csv_dir}")
         
         try:
-            self.connect()
+            await self.connect()
+            self.in_flight = asyncio.Semaphore(MAX_IN_FLIGHT_BATCHES)
             
             if clear_db:
-                self.clear_database()
+                await self.clear_database()
             
-            # Create constraints and indexes
-            self.create_constraints()
-            self.create_indexes()
+            async with self.driver.session(database=self.database) as session:
+                # Create constraints and indexes
+                await self.create_constraints(session)
+                await self.create_indexes(session)
+                await self.await_indexes(session)
             
-            # Ingest nodes
+            # Ingest nodes, the labels are independent of each other. Each stage also
+            # records the node ids by node key for the relationship stages.
             print("\n📥 Ingesting nodes...")
-            self.ingest_persons()
-            self.ingest_companies()
-            self.ingest_locations()
+            await _gather_or_cancel(self.ingest_persons(), self.ingest_companies(), self.ingest_locations())
             
-            # Ingest relationships
+            # Ingest relationships. LOCATED_IN and KNOWS touch disjoint labels and
+            # run together; WORKS_FOR shares Person and Company with them, so it
+            # runs on its own to avoid lock contention on the same nodes.
             print("\n🔗 Ingesting relationships...")
-            self.ingest_works_for()
-            self.ingest_located_in()
-            self.ingest_knows()
+            await _gather_or_cancel(self.ingest_located_in(), self.ingest_knows())
+            await self.ingest_works_for()
             
             # Show statistics
-            self.get_stats()
+            async with self.driver.session(database=self.database) as session:
+                await self.get_stats(session)
             
             print("\n✅ Data ingestion completed successfully!")
             
@@ -335,8 +663,7 @@ class Neo4jIngestor:
             print(f"❌ Error during ingestion: {e}")
             raise
         finally:
-            self.close()
-
+            await self.close()
 
 def main():
     """Main function"""
@@ -45,7 +45,7 @@ impl CypherGuardError {
     }
 }
 
-#[derive(Debug, Error)]
+#[derive(Debug, Clone, Error)]
 pub enum CypherGuardValidationError {
     #[error("Invalid property name: {0}")]
     InvalidPropertyName(String),
@@ -91,6 +91,23 @@ pub enum CypherGuardValidationError {
 }
 
 impl CypherGuardValidationError {
+    /// Name of the error variant, e.g. `InvalidNodeLabel`
+    pub fn code(&self) -> &'static str {
+        match self {
+            Self::InvalidPropertyName(_) => "InvalidPropertyName",
+            Self::TypeMismatch { .. } => "TypeMismatch",
+            Self::InvalidRelationship(_) => "InvalidRelationship",
+            Self::InvalidLabel(_) => "InvalidLabel",
+            Self::InvalidNodeLabel(_) => "InvalidNodeLabel",
+            Self::InvalidRelationshipType(_) => "InvalidRelationshipType",
+            Self::InvalidNodeProperty { .. } => "InvalidNodeProperty",
+            Self::InvalidRelationshipProperty { .. } => "InvalidRelationshipProperty",
+            Self::InvalidPropertyAccess { .. } => "InvalidPropertyAccess",
+            Self::InvalidPropertyType { .. } => "InvalidPropertyType",
+            Self::UndefinedVariable(_) => "UndefinedVariable",
+        }
+    }
+
     pub fn invalid_property_name(name: impl Into<String>) -> Self {
         Self::InvalidPropertyName(name.into())
     }
@@ -340,9 +357,7 @@ impl CypherGuardParsingError {
     }
 
     pub fn undefined_variable(var: impl Into<String>) -> Self {
-        let var_name = var.into();
-        eprintln!("🔥 CREATING UndefinedVariable ERROR for: '{}'", var_name);
-        Self::UndefinedVariable(var_name)
+        Self::UndefinedVariable(var.into())
     }
 
     // Query structure errors
@@ -1067,6 +1082,18 @@ mod tests {
         assert_eq!(label_error.label_name(), Some("Person"));
     }
 
+    #[test]
+    fn test_validation_error_codes() {
+        assert_eq!(
+            CypherGuardValidationError::invalid_node_label("User").code(),
+            "InvalidNodeLabel"
+        );
+        assert_eq!(
+            CypherGuardValidationError::type_mismatch("String", "Integer").code(),
+            "TypeMismatch"
+        );
+    }
+
     #[test]
     fn test_parsing_error_messages() {
         let token_error = CypherGuardParsingError::expected_token("MATCH", "WITH");
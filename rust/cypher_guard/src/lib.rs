@@ -29,15 +29,8 @@ pub fn validate_cypher(_query: &str) -> Result<bool> {
 
 /// Parse a Cypher query with custom error handling
 pub fn parse_query(query: &str) -> std::result::Result<Query, CypherGuardParsingError> {
-    println!("DEBUG: lib.rs parse_query called with: {}", query);
     match parser::clauses::parse_query(query) {
-        Ok((remaining, ast)) => {
-            println!(
-                "DEBUG: lib.rs parse_query succeeded, remaining: '{}', AST: {:?}",
-                remaining, ast
-            );
-            Ok(ast)
-        }
+        Ok((_, ast)) => Ok(ast),
         Err(nom::Err::Error(e)) => {
             // Check if this is a validation error by looking at the error kind
             // If it's a Tag error, it might be a validation error
@@ -116,20 +109,13 @@ pub fn parse_query(query: &str) -> std::result::Result<Query, CypherGuardParsing
     }
 }
 
-use crate::validation::{extract_query_elements, validate_query_elements};
+use crate::validation::{extract_query_elements, has_validation_errors, validate_query_elements};
 
 /// Validate full query with schema: returns true if valid, or error on parse failure
 pub fn validate_cypher_with_schema(query: &str, schema: &DbSchema) -> Result<bool> {
-    println!(
-        "DEBUG: validate_cypher_with_schema called with query: {}",
-        query
-    );
     let ast = parse_query(query)?;
-    println!("DEBUG: Parsed AST successfully: {:#?}", ast);
     let elements = extract_query_elements(&ast);
-    eprintln!("DEBUG: Extracted elements successfully");
     let errors = validate_query_elements(&elements, schema);
-    eprintln!("DEBUG: Validation completed with {} errors", errors.len());
     if errors.is_empty() {
         Ok(true)
     } else {
@@ -142,28 +128,70 @@ pub fn validate_cypher_with_schema(query: &str, schema: &DbSchema) -> Result<boo
 
 /// Get validation errors for a query (for Python/JS bindings)
 pub fn get_cypher_validation_errors(query: &str, schema: &DbSchema) -> Vec<String> {
-    println!("🔍 get_cypher_validation_errors called with: {}", query);
-    match parse_query(query) {
-        Ok(ast) => {
-            println!("🔍 Parse succeeded, AST: {:?}", ast);
-            let elements = extract_query_elements(&ast);
-            println!(
-                "🔍 Extracted elements: referenced={:?}, defined={:?}",
-                elements.referenced_variables, elements.defined_variables
-            );
-            let errors = validate_query_elements(&elements, schema);
-            println!(
-                "🔍 Validation completed with {} errors: {:?}",
-                errors.len(),
-                errors
-            );
-            errors.into_iter().map(|e| e.to_string()).collect()
-        }
-        Err(e) => {
-            println!("🔍 Parse failed with error: {:?}", e);
-            vec!["Invalid Cypher syntax".to_string()]
+    match collect_cypher_validation_errors(query, schema) {
+        Ok(errors) => errors.into_iter().map(|e| e.to_string()).collect(),
+        Err(_) => vec!["Invalid Cypher syntax".to_string()],
+    }
+}
+
+/// Parse a query and collect its validation errors without formatting them
+pub fn collect_cypher_validation_errors(
+    query: &str,
+    schema: &DbSchema,
+) -> std::result::Result<Vec<CypherGuardValidationError>, CypherGuardParsingError> {
+    let ast = parse_query(query)?;
+    Ok(validate_parsed_query(&ast, schema))
+}
+
+/// Collect the validation errors of an already parsed query
+pub fn validate_parsed_query(ast: &Query, schema: &DbSchema) -> Vec<CypherGuardValidationError> {
+    let elements = extract_query_elements(ast);
+    validate_query_elements(&elements, schema)
+}
+
+/// Cheap check for queries that cannot parse: brackets that do not pair up
+/// outside string literals. A false result says nothing about the query.
+fn has_unbalanced_brackets(query: &str) -> bool {
+    let mut open = Vec::new();
+    let mut bytes = query.bytes();
+    while let Some(b) = bytes.next() {
+        match b {
+            b'(' => open.push(b')'),
+            b'[' => open.push(b']'),
+            b'{' => open.push(b'}'),
+            b')' | b']' | b'}' => {
+                if open.pop() != Some(b) {
+                    return true;
+                }
+            }
+            // String literals have no escapes, they end at the next matching quote
+            b'\'' | b'"' => {
+                if !bytes.any(|c| c == b) {
+                    // Leave unterminated strings to the parser
+                    return false;
+                }
+            }
+            _ => {}
         }
     }
+    !open.is_empty()
+}
+
+/// Check whether a query fails to parse, without building the error
+pub fn has_cypher_parsing_errors(query: &str) -> bool {
+    has_unbalanced_brackets(query) || parse_query(query).is_err()
+}
+
+/// Check whether a query has any validation errors, stopping at the first one.
+/// Queries that fail to parse count as having errors.
+pub fn has_cypher_validation_errors(query: &str, schema: &DbSchema) -> bool {
+    if has_unbalanced_brackets(query) {
+        return true;
+    }
+    match parse_query(query) {
+        Ok(ast) => has_validation_errors(&extract_query_elements(&ast), schema),
+        Err(_) => true,
+    }
 }
 
 #[cfg(test)]
@@ -192,6 +220,38 @@ mod tests {
         assert!(matches!(error, CypherGuardParsingError::Nom(_)));
     }
 
+    #[test]
+    fn test_has_cypher_parsing_errors() {
+        for query in [
+            "MATCH (a:Person) RETURN a",
+            "MATCH ((a:Person)-[r:KNOWS]->(b:Person)){1,3} RETURN a.name",
+        ] {
+            assert!(!has_unbalanced_brackets(query), "{query}");
+            assert!(!has_cypher_parsing_errors(query), "{query}");
+        }
+        // Brackets and other quotes inside string literals are not counted
+        assert!(!has_unbalanced_brackets(
+            "MATCH (a:Person) WHERE a.name = ')' RETURN a"
+        ));
+        assert!(!has_unbalanced_brackets(
+            "MATCH (a:Person) WHERE a.name = \"it's (\" RETURN a"
+        ));
+        assert!(!has_unbalanced_brackets("MATCH (a:Person {name: 'a("));
+        for query in [
+            "MATCH (n RETURN n",
+            "MATCH (n:Person",
+            "MATCH (n)-[r:KNOWS->(m) RETURN n",
+            "MATCH (n)) RETURN n",
+        ] {
+            assert!(has_unbalanced_brackets(query), "{query}");
+            assert!(has_cypher_parsing_errors(query), "{query}");
+            assert!(parse_query(query).is_err(), "{query}");
+        }
+        // Errors the bracket scan cannot see still come from the parser
+        assert!(!has_unbalanced_brackets("MATCH (n:Person) WHERE"));
+        assert!(has_cypher_parsing_errors("MATCH (n:Person) WHERE"));
+    }
+
     #[test]
     fn test_validate_cypher_with_schema_uses_custom_errors() {
         let schema = DbSchema::new();
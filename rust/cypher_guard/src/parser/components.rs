@@ -99,26 +99,13 @@ pub fn relationship_type(input: &str) -> IResult<&str, String> {
         input = next_input;
     }
     let rel_type = types.join("|");
-    println!(
-        "Parsed relationship type: {}, remaining input: {}",
-        rel_type, input
-    );
     Ok((input, rel_type))
 }
 
 // Variable length relationship parser
 pub fn variable_length_relationship(input: &str) -> IResult<&str, (String, Quantifier, bool)> {
-    println!(
-        "DEBUG: Starting variable_length_relationship with input: {}",
-        input
-    );
     let (input, rel_type) = relationship_type(input)?;
-    println!("DEBUG: Parsed relationship type: {}", rel_type);
     let (input, (quantifier, is_optional)) = quantifier(input)?;
-    println!(
-        "DEBUG: Parsed quantifier: {:?}, optional: {}",
-        quantifier, is_optional
-    );
     Ok((input, (rel_type, quantifier, is_optional)))
 }
 
@@ -140,34 +127,24 @@ pub fn length_range(input: &str) -> IResult<&str, LengthRange> {
 
 // Shared relationship details parser
 pub fn relationship_details(input: &str) -> IResult<&str, RelationshipDetails> {
-    println!("DEBUG: Starting relationship_details with input: {}", input);
     let (input, _) = char('[')(input)?;
-    println!("DEBUG: After opening bracket: {}", input);
     let (input, variable) = opt(identifier)(input)?;
-    println!("DEBUG: Parsed variable: {:?}", variable);
 
     // Try to parse as variable length relationship first
     let (input, rel_type_quantifier_optional) =
         if let Ok((input, (rel_type, quantifier, is_optional))) =
             variable_length_relationship(input)
         {
-            println!(
-                "DEBUG: Parsed as variable length relationship: {:?}, {:?}, optional: {}",
-                rel_type, quantifier, is_optional
-            );
             (input, (Some(rel_type), Some(quantifier), is_optional))
         } else {
             // Fall back to regular relationship type
             let (input, rel_type) = opt(relationship_type)(input)?;
-            println!("DEBUG: Parsed as regular relationship type: {:?}", rel_type);
             (input, (rel_type, None, false))
         };
 
     let (input, _) = multispace0(input)?;
     let (input, properties) = opt(property_map)(input)?;
-    println!("DEBUG: Parsed properties: {:?}", properties);
     let (input, _) = char(']')(input)?;
-    println!("DEBUG: After closing bracket: {}", input);
 
     Ok((
         input,
@@ -186,7 +163,6 @@ pub fn relationship_details(input: &str) -> IResult<&str, RelationshipDetails> {
 
 // Parse quantifiers like *, +, {n}, {n,m}, and allow ? after quantifier
 pub fn quantifier(input: &str) -> IResult<&str, (Quantifier, bool)> {
-    println!("DEBUG: Starting quantifier with input: {}", input);
     let mut input = input;
     let mut quant = None;
     // Try to parse *n..m
@@ -237,13 +213,8 @@ pub fn quantifier(input: &str) -> IResult<&str, (Quantifier, bool)> {
             } else {
                 (input, false)
             };
-        println!(
-            "DEBUG: Parsed quantifier: {:?}, optional: {}",
-            q, is_optional
-        );
         return Ok((input, (q, is_optional)));
     }
-    println!("DEBUG: No quantifier found");
     Err(nom::Err::Error(nom::error::Error::new(
         input,
         nom::error::ErrorKind::Char,
@@ -251,21 +222,16 @@ pub fn quantifier(input: &str) -> IResult<&str, (Quantifier, bool)> {
 }
 
 pub fn relationship_pattern(input: &str) -> IResult<&str, RelationshipPattern> {
-    println!("DEBUG: Starting relationship_pattern with input: {}", input);
     let (input, _) = multispace0(input)?;
-    println!("DEBUG: After whitespace: {}", input);
 
     // Parse the left side of the relationship
     let (input, left) = alt((tag("<-"), tag("-")))(input)?;
-    println!("DEBUG: Parsed left side: {}", left);
 
     // Parse relationship details
     let (input, mut details) = relationship_details(input)?;
-    println!("DEBUG: Parsed relationship details: {:?}", details);
 
     // Parse the right side of the relationship
     let (input, right) = alt((tag("->"), tag("-")))(input)?;
-    println!("DEBUG: Parsed right side: {}", right);
 
     // Set direction based on arrows, ensuring it's set even for variable length relationships
     details.direction = match (left, right) {
@@ -274,15 +240,6 @@ pub fn relationship_pattern(input: &str) -> IResult<&str, RelationshipPattern> {
         ("-", "-") => Direction::Undirected,
         _ => Direction::Undirected,
     };
-    println!("DEBUG: Set direction to: {:?}", details.direction);
-
-    // For variable length relationships, ensure direction is properly set
-    if details.quantifier.is_some() {
-        println!(
-            "DEBUG: Variable length relationship with direction: {:?}",
-            details.direction
-        );
-    }
 
     if details.is_optional {
         return Ok((input, RelationshipPattern::OptionalRelationship(details)));
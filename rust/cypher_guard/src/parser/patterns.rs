@@ -37,46 +37,24 @@ pub fn node_pattern(input: &str) -> IResult<&str, NodePattern> {
 
 pub fn relationship_details(input: &str) -> IResult<&str, RelationshipDetails> {
     let (input, _) = char('[')(input)?;
-    println!("After parsing '[': {}", input);
     let (input, variable) = opt(identifier)(input)?;
-    println!(
-        "After parsing variable: {:?}, remaining input: {}",
-        variable, input
-    );
 
     // Try to parse as variable length relationship first
     let (input, rel_type_quantifier_optional) =
         if let Ok((input, (rel_type, quantifier, is_optional))) =
             variable_length_relationship(input)
         {
-            println!(
-                "Parsed as variable length relationship: {:?}, {:?}, optional: {}",
-                rel_type, quantifier, is_optional
-            );
             (input, (Some(rel_type), Some(quantifier), is_optional))
         } else {
             // Fall back to regular relationship type
             let (input, rel_type) = opt(relationship_type)(input)?;
-            println!(
-                "After parsing rel_type: {:?}, remaining input: {}",
-                rel_type, input
-            );
             (input, (rel_type, None, false))
         };
 
     let (input, _) = multispace0(input)?;
     let (input, properties) = opt(property_map)(input)?;
-    println!(
-        "After parsing properties: {:?}, remaining input: {}",
-        properties, input
-    );
     let (input, _) = char(']')(input)?;
-    println!("After parsing ']': {}", input);
     let (input, length) = opt(length_range)(input)?;
-    println!(
-        "After parsing length: {:?}, remaining input: {}",
-        length, input
-    );
 
     // Create relationship details with initial direction
     let details = RelationshipDetails {
@@ -90,30 +68,20 @@ pub fn relationship_details(input: &str) -> IResult<&str, RelationshipDetails> {
         is_optional: rel_type_quantifier_optional.2,
     };
 
-    // For variable length relationships, ensure we can handle direction
-    if details.quantifier.is_some() {
-        println!("DEBUG: Variable length relationship detected in details");
-    }
-
     Ok((input, details))
 }
 
 pub fn relationship_pattern(input: &str) -> IResult<&str, RelationshipPattern> {
-    println!("DEBUG: Starting relationship_pattern with input: {}", input);
     let (input, _) = multispace0(input)?;
-    println!("DEBUG: After whitespace: {}", input);
 
     // Parse the left side of the relationship (either '-' or '<-')
     let (input, left_dir) = alt((tag("<-"), tag("-")))(input)?;
-    println!("DEBUG: Parsed left direction: {}", left_dir);
 
     // Parse relationship details
     let (input, mut details) = relationship_details(input)?;
-    println!("DEBUG: Parsed relationship details: {:?}", details);
 
     // Parse the right side of the relationship (either '->' or '-')
     let (input, right_dir) = alt((tag("->"), tag("-")))(input)?;
-    println!("DEBUG: Parsed right direction: {}", right_dir);
 
     // Set direction based on arrows
     details.direction = match (left_dir, right_dir) {
@@ -122,7 +90,6 @@ pub fn relationship_pattern(input: &str) -> IResult<&str, RelationshipPattern> {
         ("-", "-") => Direction::Undirected,
         _ => Direction::Undirected,
     };
-    println!("DEBUG: Set direction to: {:?}", details.direction);
 
     if details.is_optional {
         return Ok((input, RelationshipPattern::OptionalRelationship(details)));
@@ -134,10 +101,6 @@ pub fn pattern_element_sequence(
     input: &str,
     allow_qpp: bool,
 ) -> IResult<&str, Vec<PatternElement>> {
-    println!(
-        "[pattern_element_sequence] >>> ENTER: input='{}', allow_qpp={}",
-        input, allow_qpp
-    );
     let mut elements = Vec::new();
     let mut current_input = input;
     let mut loop_count = 0;
@@ -146,15 +109,9 @@ pub fn pattern_element_sequence(
     loop {
         loop_count += 1;
         if loop_count > MAX_LOOPS {
-            println!("[pattern_element_sequence] MAX_LOOPS exceeded, breaking");
             break;
         }
 
-        println!(
-            "[pattern_element_sequence] LOOP {}: input='{}'",
-            loop_count, current_input
-        );
-
         // Check if we've reached a clause boundary
         let trimmed_input = current_input.trim_start();
         if trimmed_input.is_empty()
@@ -173,10 +130,6 @@ pub fn pattern_element_sequence(
             || trimmed_input.starts_with("SET")
             || trimmed_input.starts_with("MERGE")
         {
-            println!(
-                "[pattern_element_sequence] Stopping at clause boundary: '{}'",
-                current_input
-            );
             break;
         }
 
@@ -204,10 +157,6 @@ pub fn pattern_element_sequence(
                     || after_paren_trim.starts_with('+')
                     || after_paren_trim.starts_with('*')
                 {
-                    println!(
-                        "[pattern_element_sequence] Detected QPP at input='{}'",
-                        current_input
-                    );
                     // Calculate the actual index in the original input
                     let whitespace_len = current_input.len() - trimmed_input.len();
                     let _actual_idx = whitespace_len + idx;
@@ -215,10 +164,6 @@ pub fn pattern_element_sequence(
 
                     match quantified_path_pattern(qpp_input) {
                         Ok((after, pattern)) => {
-                            println!(
-                                "[pattern_element_sequence] Parsed QPP: {:?}, after='{}'",
-                                pattern, after
-                            );
                             elements.push(pattern);
                             // Calculate the remaining input after the QPP
                             let after_qpp =
@@ -226,11 +171,7 @@ pub fn pattern_element_sequence(
                             current_input = after_qpp.trim_start();
                             continue;
                         }
-                        Err(e) => {
-                            println!(
-                                "[pattern_element_sequence] quantified_path_pattern failed: {:?}",
-                                e
-                            );
+                        Err(_) => {
                             // If QPP parsing fails, fall back to regular parsing
                             // Don't break, just continue with normal parsing
                         }
@@ -242,47 +183,27 @@ pub fn pattern_element_sequence(
         let input_before_parsing = current_input;
         match node_pattern(current_input) {
             Ok((rest, node)) => {
-                println!(
-                    "[pattern_element_sequence] Parsed node: {:?}, rest='{}'",
-                    node, rest
-                );
                 elements.push(PatternElement::Node(node));
                 current_input = rest;
             }
-            Err(e) => {
-                println!("[pattern_element_sequence] node_pattern failed: {:?}", e);
+            Err(_) => {
                 // If we can't parse a node, try to parse a relationship
                 match relationship_pattern(current_input) {
                     Ok((rest, rel)) => {
-                        println!(
-                            "[pattern_element_sequence] Parsed relationship: {:?}, rest='{}'",
-                            rel, rest
-                        );
                         elements.push(PatternElement::Relationship(rel));
                         current_input = rest;
                     }
-                    Err(e) => {
-                        println!(
-                            "[pattern_element_sequence] relationship_pattern failed: {:?}",
-                            e
-                        );
-                        break;
-                    }
+                    Err(_) => break,
                 }
             }
         }
 
         // Check if we made progress
         if current_input == input_before_parsing {
-            println!("[pattern_element_sequence] No progress made, breaking");
             break;
         }
     }
 
-    println!(
-        "[pattern_element_sequence] <<< EXIT: elements={:?}, input='{}'",
-        elements, current_input
-    );
     Ok((current_input, elements))
 }
 
@@ -292,10 +213,6 @@ pub fn match_element(input: &str) -> IResult<&str, MatchElement> {
         tuple((multispace0, char('='), multispace0)),
     ))(input)?;
     let (input, pattern) = pattern_element_sequence(input, true)?;
-    println!(
-        "[match_element] After pattern_element_sequence: pattern={:?}, input='{}'",
-        pattern, input
-    );
     Ok((
         input,
         MatchElement {
@@ -310,26 +227,15 @@ pub fn pattern(input: &str) -> IResult<&str, Vec<PatternElement>> {
 }
 
 pub fn path_variable(input: &str) -> IResult<&str, String> {
-    println!("[path_variable] ENTER: input='{}'", input);
     let (input, var) = terminated(identifier, tuple((multispace0, char('='), multispace0)))(input)?;
-    println!("[path_variable] EXIT: var='{}', input='{}'", var, input);
     Ok((input, var.to_string()))
 }
 
 pub fn quantified_path_pattern(input: &str) -> IResult<&str, PatternElement> {
-    println!("[quantified_path_pattern] >>> ENTER: input='{}'", input);
     let (input, _) = char('(')(input)?;
-    println!(
-        "[quantified_path_pattern] After opening parenthesis: input='{}'",
-        input
-    );
 
     // Parse optional path variable using the new parser
     let (input, path_var) = opt(path_variable)(input)?;
-    println!(
-        "[quantified_path_pattern] After path variable: {:?}, input='{}'",
-        path_var, input
-    );
 
     // Find the matching closing parenthesis for the QPP
     let mut depth = 1;
@@ -353,25 +259,9 @@ pub fn quantified_path_pattern(input: &str) -> IResult<&str, PatternElement> {
     }
     let inner_pattern_str = &input[..idx];
     let after_paren = &input[idx + 1..];
-    println!(
-        "[quantified_path_pattern] Extracted inner pattern substring: '{}'",
-        inner_pattern_str
-    );
-    println!(
-        "[quantified_path_pattern] After closing parenthesis: '{}'",
-        after_paren
-    );
 
     // Parse the inner pattern using the existing pattern_element_sequence function
     let (remaining_inner, mut inner_pattern) = pattern_element_sequence(inner_pattern_str, false)?;
-    println!(
-        "[quantified_path_pattern] Parsed inner pattern: {:?}",
-        inner_pattern
-    );
-    println!(
-        "[quantified_path_pattern] Remaining after inner pattern: '{}'",
-        remaining_inner
-    );
 
     // Strip quantifiers from relationships inside the QPP
     for element in &mut inner_pattern {
@@ -386,21 +276,13 @@ pub fn quantified_path_pattern(input: &str) -> IResult<&str, PatternElement> {
     }
 
     // Parse optional WHERE clause using the where_clause parser, from remaining_inner
-    let (where_input, where_clause) = if let Ok((rest, clause)) = where_clause(remaining_inner) {
-        println!(
-            "[quantified_path_pattern] Successfully parsed WHERE clause: {:?}",
-            clause
-        );
+    let (_where_input, where_clause) = if let Ok((rest, clause)) = where_clause(remaining_inner) {
         (rest, Some(clause))
     } else {
         (remaining_inner, None)
     };
-    println!(
-        "[quantified_path_pattern] After WHERE clause parsing: where_input='{}'",
-        where_input
-    );
 
-    // Now, where_input should be empty, and after_paren is the input after the closing parenthesis
+    // Now, _where_input should be empty, and after_paren is the input after the closing parenthesis
     let mut input = after_paren;
     // Skip any whitespace between ) and quantifier
     let (rest, _) = multispace0(input)?;
@@ -417,10 +299,6 @@ pub fn quantified_path_pattern(input: &str) -> IResult<&str, PatternElement> {
     } else {
         // Try to parse {min,max} format
         let (input, _) = char('{')(input)?;
-        println!(
-            "[quantified_path_pattern] After opening brace: input='{}'",
-            input
-        );
 
         // Parse min value
         let (rest, min_str) = digit1::<&str, nom::error::Error<&str>>(input)?;
@@ -446,11 +324,6 @@ pub fn quantified_path_pattern(input: &str) -> IResult<&str, PatternElement> {
         (input, ' ')
     };
 
-    println!(
-        "[quantified_path_pattern] After quantifier parsing: input='{}'",
-        input
-    );
-
     // Create the quantified pattern
     let quantified_pattern = QuantifiedPathPattern {
         pattern: inner_pattern,
@@ -459,10 +332,6 @@ pub fn quantified_path_pattern(input: &str) -> IResult<&str, PatternElement> {
         where_clause,
         path_variable: path_var,
     };
-    println!(
-        "[quantified_path_pattern] <<< EXIT: {:?}",
-        quantified_pattern
-    );
     Ok((
         input,
         PatternElement::QuantifiedPathPattern(quantified_pattern),
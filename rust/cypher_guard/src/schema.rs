@@ -1,12 +1,17 @@
 use crate::errors::{CypherGuardError, CypherGuardSchemaError};
 use crate::Result;
-use serde::{Deserialize, Serialize};
-use std::collections::HashMap;
+use serde::de::{self, MapAccess, Visitor};
+use serde::{Deserialize, Deserializer, Serialize};
+use std::collections::hash_map::Entry;
+use std::collections::{HashMap, HashSet};
 use std::fmt;
+use std::hash::{BuildHasherDefault, Hasher};
+use std::sync::OnceLock;
 
 /// Enumeration of supported property types in Neo4j
-#[derive(Debug, Clone, Serialize, Deserialize, PartialEq)]
+#[derive(Debug, Clone, Copy, Serialize, Deserialize, PartialEq, Eq, Hash)]
 #[allow(non_camel_case_types)]
+#[repr(u8)]
 pub enum PropertyType {
     STRING,
     INTEGER,
@@ -17,37 +22,54 @@ pub enum PropertyType {
     LIST,
 }
 
+/// Canonical name of each PropertyType, indexed by discriminant
+const PROPERTY_TYPE_NAMES: [&str; 7] = [
+    "STRING",
+    "INTEGER",
+    "FLOAT",
+    "BOOLEAN",
+    "POINT",
+    "DATE_TIME",
+    "LIST",
+];
+
+/// Accepted spellings of each PropertyType, matched case-insensitively
+const PROPERTY_TYPE_ALIASES: [(&str, PropertyType); 10] = [
+    ("STRING", PropertyType::STRING),
+    ("STR", PropertyType::STRING),
+    ("INTEGER", PropertyType::INTEGER),
+    ("INT", PropertyType::INTEGER),
+    ("FLOAT", PropertyType::FLOAT),
+    ("BOOLEAN", PropertyType::BOOLEAN),
+    ("BOOL", PropertyType::BOOLEAN),
+    ("POINT", PropertyType::POINT),
+    ("DATE_TIME", PropertyType::DATE_TIME),
+    ("LIST", PropertyType::LIST),
+];
+
 impl fmt::Display for PropertyType {
     fn fmt(&self, f: &mut fmt::Formatter<'_>) -> fmt::Result {
-        match self {
-            PropertyType::STRING => write!(f, "STRING"),
-            PropertyType::INTEGER => write!(f, "INTEGER"),
-            PropertyType::FLOAT => write!(f, "FLOAT"),
-            PropertyType::BOOLEAN => write!(f, "BOOLEAN"),
-            PropertyType::POINT => write!(f, "POINT"),
-            PropertyType::DATE_TIME => write!(f, "DATE_TIME"),
-            PropertyType::LIST => write!(f, "LIST"),
-        }
+        f.write_str(self.as_str())
     }
 }
 
 impl PropertyType {
     pub fn from_string(s: &str) -> Result<Self> {
-        match s.to_uppercase().as_str() {
-            "STRING" | "STR" => Ok(PropertyType::STRING),
-            "INTEGER" | "INT" => Ok(PropertyType::INTEGER),
-            "FLOAT" => Ok(PropertyType::FLOAT),
-            "BOOLEAN" | "BOOL" => Ok(PropertyType::BOOLEAN),
-            "POINT" => Ok(PropertyType::POINT),
-            "DATE_TIME" => Ok(PropertyType::DATE_TIME),
-            "LIST" => Ok(PropertyType::LIST),
-            _ => Err(CypherGuardError::Schema(
-                CypherGuardSchemaError::InvalidPropertyType(format!(
+        PROPERTY_TYPE_ALIASES
+            .iter()
+            .find(|(name, _)| name.eq_ignore_ascii_case(s))
+            .map(|&(_, property_type)| property_type)
+            .ok_or_else(|| {
+                CypherGuardError::Schema(CypherGuardSchemaError::InvalidPropertyType(format!(
                     "Invalid property type: {}",
                     s
-                )),
-            )),
-        }
+                )))
+            })
+    }
+
+    /// Canonical name of the type, as used in schema JSON
+    pub fn as_str(self) -> &'static str {
+        PROPERTY_TYPE_NAMES[self as usize]
     }
 }
 
@@ -231,12 +253,15 @@ impl DbSchemaIndex {
 }
 
 /// Structure containing metadata about constraints and indexes.
+///
+/// The lists are fixed once loaded, so they are stored as boxed slices
+/// without spare capacity.
 #[derive(Debug, Clone, Serialize, Deserialize, PartialEq)]
 pub struct DbSchemaMetadata {
     /// List of constraints in the database
-    pub constraint: Vec<DbSchemaConstraint>,
+    pub constraint: Box<[DbSchemaConstraint]>,
     /// List of indexes in the database
-    pub index: Vec<DbSchemaIndex>,
+    pub index: Box<[DbSchemaIndex]>,
 }
 
 impl Default for DbSchemaMetadata {
@@ -248,24 +273,278 @@ impl Default for DbSchemaMetadata {
 impl DbSchemaMetadata {
     pub fn new() -> Self {
         Self {
-            constraint: Vec::new(),
-            index: Vec::new(),
+            constraint: Box::default(),
+            index: Box::default(),
         }
     }
 }
 
 /// Main schema structure representing the complete database schema.
 /// Follows the Neo4j GraphRAG library standard format.
-#[derive(Debug, Clone, Serialize, Deserialize, PartialEq)]
+///
+/// Lookups go through an index built from the fields on first use. The schema
+/// methods rebuild it after every change, so modify a schema through them
+/// rather than through its fields once it has been queried.
+#[derive(Debug, Clone, Serialize, Deserialize)]
 pub struct DbSchema {
     /// Node properties by node label (Neo4j GraphRAG standard format)
+    #[serde(deserialize_with = "deserialize_unique_keys")]
     pub node_props: HashMap<String, Vec<DbSchemaProperty>>,
     /// Relationship properties by relationship type
+    #[serde(deserialize_with = "deserialize_unique_keys")]
     pub rel_props: HashMap<String, Vec<DbSchemaProperty>>,
     /// Valid relationship patterns
     pub relationships: Vec<DbSchemaRelationshipPattern>,
     /// Schema metadata (constraints and indexes)
     pub metadata: DbSchemaMetadata,
+    /// Lookup index derived from the fields above
+    #[serde(skip)]
+    index: OnceLock<SchemaIndex>,
+}
+
+impl PartialEq for DbSchema {
+    fn eq(&self, other: &Self) -> bool {
+        self.node_props == other.node_props
+            && self.rel_props == other.rel_props
+            && self.relationships == other.relationships
+            && self.metadata == other.metadata
+    }
+}
+
+/// Deserialize a label or relationship type map, rejecting repeated keys.
+/// A plain HashMap would keep the last entry and silently drop the others.
+fn deserialize_unique_keys<'de, D>(
+    deserializer: D,
+) -> std::result::Result<HashMap<String, Vec<DbSchemaProperty>>, D::Error>
+where
+    D: Deserializer<'de>,
+{
+    struct UniqueKeys;
+
+    impl<'de> Visitor<'de> for UniqueKeys {
+        type Value = HashMap<String, Vec<DbSchemaProperty>>;
+
+        fn expecting(&self, f: &mut fmt::Formatter) -> fmt::Result {
+            f.write_str("a map of names to property lists")
+        }
+
+        fn visit_map<A>(self, mut access: A) -> std::result::Result<Self::Value, A::Error>
+        where
+            A: MapAccess<'de>,
+        {
+            let mut map = HashMap::with_capacity(access.size_hint().unwrap_or(0));
+            while let Some((key, properties)) = access.next_entry::<String, Vec<_>>()? {
+                match map.entry(key) {
+                    Entry::Occupied(entry) => {
+                        return Err(de::Error::custom(format!(
+                            "duplicate key '{}'",
+                            entry.key()
+                        )))
+                    }
+                    Entry::Vacant(entry) => {
+                        entry.insert(properties);
+                    }
+                }
+            }
+            Ok(map)
+        }
+    }
+
+    deserializer.deserialize_map(UniqueKeys)
+}
+
+/// Multiply-rotate hasher (the FxHash used by rustc) for the lookup index.
+///
+/// The index keys are short names and small integer ids, where SipHash
+/// dominates the lookup cost. Flooding is not a concern because keys are only
+/// inserted from the schema, queries just probe.
+#[derive(Debug, Default, Clone, Copy)]
+struct FxHasher {
+    hash: u64,
+}
+
+const FX_SEED: u64 = 0x51_7c_c1_b7_27_22_0a_95;
+
+impl FxHasher {
+    #[inline]
+    fn add(&mut self, word: u64) {
+        self.hash = (self.hash.rotate_left(5) ^ word).wrapping_mul(FX_SEED);
+    }
+}
+
+impl Hasher for FxHasher {
+    #[inline]
+    fn write(&mut self, bytes: &[u8]) {
+        let mut chunks = bytes.chunks_exact(8);
+        for chunk in &mut chunks {
+            self.add(u64::from_le_bytes(chunk.try_into().unwrap()));
+        }
+        for &byte in chunks.remainder() {
+            self.add(byte as u64);
+        }
+    }
+
+    #[inline]
+    fn write_u8(&mut self, i: u8) {
+        self.add(i as u64);
+    }
+
+    #[inline]
+    fn write_u32(&mut self, i: u32) {
+        self.add(i as u64);
+    }
+
+    #[inline]
+    fn write_u64(&mut self, i: u64) {
+        self.add(i);
+    }
+
+    #[inline]
+    fn write_usize(&mut self, i: usize) {
+        self.add(i as u64);
+    }
+
+    #[inline]
+    fn finish(&self) -> u64 {
+        self.hash
+    }
+}
+
+type FxHashMap<K, V> = HashMap<K, V, BuildHasherDefault<FxHasher>>;
+type FxHashSet<T> = HashSet<T, BuildHasherDefault<FxHasher>>;
+
+/// Flat lookup tables over a schema. Labels, relationship types and property
+/// names are interned to integer ids, so a lookup hashes the names once and
+/// probes a table keyed by ids instead of scanning the property lists.
+#[derive(Debug, Clone, Default)]
+struct SchemaIndex {
+    /// Id of every label, relationship type and property name in the schema
+    ids: FxHashMap<String, u32>,
+    /// Property type by (label, property)
+    node_properties: FxHashMap<(u32, u32), PropertyType>,
+    /// Property type by (relationship type, property)
+    rel_properties: FxHashMap<(u32, u32), PropertyType>,
+    /// Type of the first node property with a given name, on any label
+    any_node_property: FxHashMap<u32, PropertyType>,
+    /// Type of the first relationship property with a given name, on any type
+    any_rel_property: FxHashMap<u32, PropertyType>,
+    /// Relationship types with properties or patterns
+    rel_types: FxHashSet<u32>,
+    /// Number of label ids. Labels are interned first, so their ids are the
+    /// dense range `0..label_ids`.
+    label_ids: u32,
+    /// Number of label and relationship type ids. They are interned before
+    /// property names, so their ids are the dense range `0..pattern_ids`.
+    pattern_ids: u32,
+    /// Relationship patterns as a bitset over (start label, relationship type,
+    /// end label) ids. Empty when the schema has too many names for it, in
+    /// which case `patterns` is used instead.
+    pattern_bits: Vec<u64>,
+    /// Relationship patterns as (start label, relationship type, end label)
+    patterns: FxHashSet<(u32, u32, u32)>,
+}
+
+/// Largest pattern bitset built, in bits (128 KiB, about 100 labels and types)
+const MAX_PATTERN_BITS: usize = 1 << 20;
+
+impl SchemaIndex {
+    fn new(schema: &DbSchema) -> Self {
+        let mut index = Self::default();
+
+        // Intern labels and relationship types first to keep their ids dense
+        for label in schema.node_props.keys() {
+            index.intern(label);
+        }
+        index.label_ids = index.ids.len() as u32;
+        for rel_type in schema.rel_props.keys() {
+            index.intern(rel_type);
+        }
+        for pattern in &schema.relationships {
+            index.intern(&pattern.start);
+            index.intern(&pattern.rel_type);
+            index.intern(&pattern.end);
+        }
+        index.pattern_ids = index.ids.len() as u32;
+
+        for (label, properties) in &schema.node_props {
+            let label = index.intern(label);
+            for property in properties {
+                let name = index.intern(&property.name);
+                index
+                    .node_properties
+                    .insert((label, name), property.neo4j_type);
+                index
+                    .any_node_property
+                    .entry(name)
+                    .or_insert(property.neo4j_type);
+            }
+        }
+
+        for (rel_type, properties) in &schema.rel_props {
+            let rel_type = index.intern(rel_type);
+            index.rel_types.insert(rel_type);
+            for property in properties {
+                let name = index.intern(&property.name);
+                index
+                    .rel_properties
+                    .insert((rel_type, name), property.neo4j_type);
+                index
+                    .any_rel_property
+                    .entry(name)
+                    .or_insert(property.neo4j_type);
+            }
+        }
+
+        for pattern in &schema.relationships {
+            let start = index.intern(&pattern.start);
+            let rel_type = index.intern(&pattern.rel_type);
+            let end = index.intern(&pattern.end);
+            index.rel_types.insert(rel_type);
+            index.patterns.insert((start, rel_type, end));
+        }
+
+        let n = index.pattern_ids as usize;
+        if n * n * n <= MAX_PATTERN_BITS {
+            index.pattern_bits = vec![0; (n * n * n).div_ceil(64)];
+            for &(start, rel_type, end) in &index.patterns {
+                let bit = index.pattern_bit(start, rel_type, end);
+                index.pattern_bits[bit / 64] |= 1 << (bit % 64);
+            }
+        }
+
+        index
+    }
+
+    /// Position of a (start, relationship type, end) id triple in the bitset
+    fn pattern_bit(&self, start: u32, rel_type: u32, end: u32) -> usize {
+        let n = self.pattern_ids as usize;
+        (start as usize * n + rel_type as usize) * n + end as usize
+    }
+
+    fn has_pattern(&self, start: u32, rel_type: u32, end: u32) -> bool {
+        if self.pattern_bits.is_empty() {
+            return self.patterns.contains(&(start, rel_type, end));
+        }
+        // Ids past `pattern_ids` are property names, which are never in a pattern
+        if start.max(rel_type).max(end) >= self.pattern_ids {
+            return false;
+        }
+        let bit = self.pattern_bit(start, rel_type, end);
+        (self.pattern_bits[bit / 64] >> (bit % 64)) & 1 == 1
+    }
+
+    fn intern(&mut self, name: &str) -> u32 {
+        if let Some(&id) = self.ids.get(name) {
+            return id;
+        }
+        let id = self.ids.len() as u32;
+        self.ids.insert(name.to_string(), id);
+        id
+    }
+
+    fn id(&self, name: &str) -> Option<u32> {
+        self.ids.get(name).copied()
+    }
 }
 
 impl Default for DbSchema {
@@ -282,6 +561,7 @@ impl DbSchema {
             rel_props: HashMap::new(),
             relationships: Vec::new(),
             metadata: DbSchemaMetadata::new(),
+            index: OnceLock::new(),
         }
     }
 
@@ -297,9 +577,20 @@ impl DbSchema {
             rel_props,
             relationships,
             metadata,
+            index: OnceLock::new(),
         }
     }
 
+    /// Get the lookup index, building it on first use
+    fn index(&self) -> &SchemaIndex {
+        self.index.get_or_init(|| SchemaIndex::new(self))
+    }
+
+    /// Drop the lookup index after a change, it is rebuilt on the next lookup
+    fn invalidate_index(&mut self) {
+        self.index.take();
+    }
+
     /// Create a schema from a map/dictionary-like structure using serde_json::Value
     /// This is useful when constructing a schema from raw map data
     ///
@@ -354,12 +645,13 @@ impl DbSchema {
 
     /// Add a new node label to the schema
     pub fn add_label(&mut self, label: &str) -> Result<()> {
-        if self.has_label(label) {
+        if self.node_props.contains_key(label) {
             return Err(CypherGuardError::Schema(
                 CypherGuardSchemaError::DuplicateLabel(format!("Label '{}' already exists", label)),
             ));
         }
         self.node_props.insert(label.to_string(), Vec::new());
+        self.invalidate_index();
         Ok(())
     }
 
@@ -370,6 +662,7 @@ impl DbSchema {
                 CypherGuardSchemaError::LabelNotFound(format!("Label '{}' not found", label)),
             ));
         }
+        self.invalidate_index();
         Ok(())
     }
 
@@ -386,6 +679,7 @@ impl DbSchema {
                 ));
             }
             properties.push(property.clone());
+            self.invalidate_index();
             Ok(())
         } else {
             Err(CypherGuardError::Schema(
@@ -407,6 +701,7 @@ impl DbSchema {
                     )),
                 ));
             }
+            self.invalidate_index();
             Ok(())
         } else {
             Err(CypherGuardError::Schema(
@@ -417,14 +712,49 @@ impl DbSchema {
 
     /// Check if a label exists in the schema
     pub fn has_label(&self, label: &str) -> bool {
-        self.node_props.contains_key(label)
+        // One FxHash probe; for labels up to 8 bytes that hashes a single word
+        let index = self.index();
+        index.id(label).is_some_and(|id| id < index.label_ids)
     }
 
     /// Check if a specific property exists for a node label
     pub fn has_node_property(&self, label: &str, property_name: &str) -> bool {
-        self.node_props
-            .get(label)
-            .is_some_and(|properties| properties.iter().any(|p| p.name == property_name))
+        self.node_property_type(label, property_name).is_some()
+    }
+
+    /// Get the type of a node label's property
+    pub fn node_property_type(&self, label: &str, property_name: &str) -> Option<PropertyType> {
+        let index = self.index();
+        let key = (index.id(label)?, index.id(property_name)?);
+        index.node_properties.get(&key).copied()
+    }
+
+    /// Get the type of a relationship type's property
+    pub fn relationship_property_type(
+        &self,
+        rel_type: &str,
+        property_name: &str,
+    ) -> Option<PropertyType> {
+        let index = self.index();
+        let key = (index.id(rel_type)?, index.id(property_name)?);
+        index.rel_properties.get(&key).copied()
+    }
+
+    /// Get the type of a property by name alone, looking at node properties first
+    /// and relationship properties second
+    pub fn property_type(&self, property_name: &str) -> Option<PropertyType> {
+        let index = self.index();
+        let name = index.id(property_name)?;
+        index
+            .any_node_property
+            .get(&name)
+            .or_else(|| index.any_rel_property.get(&name))
+            .copied()
+    }
+
+    /// Check if a property exists on any node label or relationship type
+    pub fn has_property(&self, property_name: &str) -> bool {
+        self.property_type(property_name).is_some()
     }
 
     /// Get all properties for a specific node label
@@ -441,22 +771,33 @@ impl DbSchema {
 
     /// Check if a property exists in any node
     pub fn has_property_in_nodes(&self, property_name: &str) -> bool {
-        self.node_props
-            .values()
-            .any(|properties| properties.iter().any(|p| p.name == property_name))
+        let index = self.index();
+        index
+            .id(property_name)
+            .is_some_and(|name| index.any_node_property.contains_key(&name))
     }
 
     /// Check if a relationship type exists
     pub fn has_relationship_type(&self, rel_type: &str) -> bool {
-        self.rel_props.contains_key(rel_type)
-            || self.relationships.iter().any(|r| r.rel_type == rel_type)
+        let index = self.index();
+        index
+            .id(rel_type)
+            .is_some_and(|rel_type| index.rel_types.contains(&rel_type))
     }
 
     /// Check if a specific relationship property exists
     pub fn has_relationship_property(&self, rel_type: &str, property_name: &str) -> bool {
-        self.rel_props
-            .get(rel_type)
-            .is_some_and(|props| props.iter().any(|p| p.name == property_name))
+        self.relationship_property_type(rel_type, property_name)
+            .is_some()
+    }
+
+    /// Check if the schema has a `(start)-[rel_type]->(end)` relationship pattern
+    pub fn has_relationship_pattern(&self, start: &str, rel_type: &str, end: &str) -> bool {
+        let index = self.index();
+        match (index.id(start), index.id(rel_type), index.id(end)) {
+            (Some(start), Some(rel_type), Some(end)) => index.has_pattern(start, rel_type, end),
+            _ => false,
+        }
     }
 
     /// Add a relationship property
@@ -478,6 +819,7 @@ impl DbSchema {
         }
 
         properties.push(property.clone());
+        self.invalidate_index();
         Ok(())
     }
 
@@ -505,6 +847,7 @@ impl DbSchema {
                 self.rel_props.remove(rel_type);
             }
 
+            self.invalidate_index();
             Ok(())
         } else {
             Err(CypherGuardError::Schema(
@@ -531,6 +874,7 @@ impl DbSchema {
         }
 
         self.relationships.push(pattern);
+        self.invalidate_index();
         Ok(())
     }
 
@@ -726,6 +1070,21 @@ mod tests {
             .is_err());
     }
 
+    #[test]
+    fn test_json_duplicate_label_error() {
+        let json = r#"{
+            "node_props": {
+                "Person": [{"name": "name", "neo4j_type": "STRING"}],
+                "Person": [{"name": "age", "neo4j_type": "INTEGER"}]
+            },
+            "rel_props": {},
+            "relationships": [],
+            "metadata": {"constraint": [], "index": []}
+        }"#;
+        let err = DbSchema::from_json_string(json).unwrap_err();
+        assert!(err.to_string().contains("duplicate key 'Person'"));
+    }
+
     #[test]
     fn test_json_serialization() {
         let schema = create_test_schema();
@@ -802,6 +1161,19 @@ mod tests {
         assert!(PropertyType::from_string("INVALID").is_err());
     }
 
+    #[test]
+    fn test_property_type_as_str_round_trip() {
+        for name in PROPERTY_TYPE_NAMES {
+            let property_type = PropertyType::from_string(name).unwrap();
+            assert_eq!(property_type.as_str(), name);
+            assert_eq!(property_type.to_string(), name);
+        }
+        assert_eq!(
+            PropertyType::from_string("Date_Time").unwrap(),
+            PropertyType::DATE_TIME
+        );
+    }
+
     #[test]
     fn test_duplicate_property_error() {
         let mut schema = DbSchema::new();
@@ -827,6 +1199,33 @@ mod tests {
         assert!(display_string.contains("KNOWS"));
     }
 
+    #[test]
+    fn test_has_relationship_pattern() {
+        let schema = create_test_schema();
+        assert!(schema.has_relationship_pattern("Person", "LIVES_IN", "Place"));
+        assert!(schema.has_relationship_pattern("Person", "KNOWS", "Person"));
+        assert!(!schema.has_relationship_pattern("Place", "LIVES_IN", "Person"));
+        assert!(!schema.has_relationship_pattern("Person", "name", "Place"));
+        assert!(!schema.has_relationship_pattern("Person", "UNKNOWN", "Place"));
+    }
+
+    #[test]
+    fn test_has_relationship_pattern_large_schema() {
+        // Too many names for the pattern bitset, so the hash set is used
+        let mut schema = DbSchema::new();
+        for i in 0..200 {
+            schema
+                .add_relationship_pattern(DbSchemaRelationshipPattern::new(
+                    &format!("Label{}", i),
+                    &format!("Label{}", i + 1),
+                    "NEXT",
+                ))
+                .unwrap();
+        }
+        assert!(schema.has_relationship_pattern("Label0", "NEXT", "Label1"));
+        assert!(!schema.has_relationship_pattern("Label1", "NEXT", "Label0"));
+    }
+
     #[test]
     fn test_with_components() {
         // Create components
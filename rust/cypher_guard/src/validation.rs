@@ -2,6 +2,7 @@ use crate::errors::CypherGuardValidationError;
 use crate::parser::ast::*;
 use crate::schema::DbSchema;
 use std::collections::{HashMap, HashSet};
+use std::ops::ControlFlow;
 
 /// Represents the extracted elements from a Cypher query that need validation
 #[derive(Debug, Clone)]
@@ -431,7 +432,6 @@ fn extract_from_where_condition(condition: &WhereCondition, elements: &mut Query
 
 /// Extract elements from a RETURN item
 fn extract_from_return_item(item: &str, elements: &mut QueryElements) {
-    println!("🔍 RETURN_ITEM: processing '{}'", item);
     extract_property_access_from_string(item, elements, PropertyContext::Return);
 }
 
@@ -477,18 +477,12 @@ fn extract_property_access_from_string(
     context: PropertyContext,
 ) {
     let trimmed = s.trim();
-    println!(
-        "DEBUG: extract_property_access_from_string called with: '{}'",
-        trimmed
-    );
 
     // Skip string literals (quoted strings)
     if trimmed.starts_with('"') && trimmed.ends_with('"') {
-        println!("DEBUG: Skipping double-quoted string: {}", trimmed);
         return;
     }
     if trimmed.starts_with('\'') && trimmed.ends_with('\'') {
-        println!("DEBUG: Skipping single-quoted string: {}", trimmed);
         return;
     }
 
@@ -519,7 +513,6 @@ fn extract_property_access_from_string(
             && !trimmed.ends_with('"')
             && !trimmed.ends_with('\'')
         {
-            println!("DEBUG: Adding variable: {}", trimmed);
             elements.add_variable(trimmed.to_string());
         }
     }
@@ -530,58 +523,72 @@ pub fn validate_query_elements(
     elements: &QueryElements,
     schema: &DbSchema,
 ) -> Vec<CypherGuardValidationError> {
-    eprintln!("DEBUG: validate_query_elements called");
-    eprintln!(
-        "DEBUG: elements.referenced_variables: {:?}",
-        elements.referenced_variables
-    );
-    eprintln!(
-        "DEBUG: elements.defined_variables: {:?}",
-        elements.defined_variables
-    );
     let mut errors = Vec::new();
+    let _ = check_query_elements(elements, schema, &mut |error| {
+        errors.push(error);
+        ControlFlow::Continue(())
+    });
+    errors
+}
+
+/// Check whether the extracted query elements have any validation error,
+/// stopping at the first one found
+pub fn has_validation_errors(elements: &QueryElements, schema: &DbSchema) -> bool {
+    check_query_elements(elements, schema, &mut |_| ControlFlow::Break(())).is_break()
+}
 
+/// Check query elements against the schema, passing each error to `report`.
+/// Checking stops as soon as `report` returns `ControlFlow::Break`.
+fn check_query_elements<F>(
+    elements: &QueryElements,
+    schema: &DbSchema,
+    report: &mut F,
+) -> ControlFlow<()>
+where
+    F: FnMut(CypherGuardValidationError) -> ControlFlow<()>,
+{
     // Validate that all referenced variables are defined
     for referenced_var in &elements.referenced_variables {
         if !elements.defined_variables.contains(referenced_var) {
-            errors.push(CypherGuardValidationError::UndefinedVariable(
+            report(CypherGuardValidationError::UndefinedVariable(
                 referenced_var.clone(),
-            ));
+            ))?;
         }
     }
 
     // Validate node labels
     for label in &elements.node_labels {
         if !schema.has_label(label) {
-            errors.push(CypherGuardValidationError::InvalidNodeLabel(label.clone()));
+            report(CypherGuardValidationError::InvalidNodeLabel(label.clone()))?;
         }
     }
 
     // Validate relationship types
     for rel_type in &elements.relationship_types {
         if !schema.has_relationship_type(rel_type) {
-            errors.push(CypherGuardValidationError::InvalidRelationshipType(
+            report(CypherGuardValidationError::InvalidRelationshipType(
                 rel_type.clone(),
-            ));
+            ))?;
         }
     }
 
     // Validate relationship directions
     for pattern_sequence in &elements.pattern_sequences {
-        // Extract nodes and relationships from the pattern sequence, flattening QPPs
-        let mut nodes = Vec::new();
-        let mut relationships = Vec::new();
+        // Extract nodes and relationships from the pattern sequence, flattening QPPs.
+        // The names are borrowed from the pattern, so this allocates no strings.
+        let mut nodes: Vec<&str> = Vec::new();
+        let mut relationships: Vec<(&str, Direction)> = Vec::new();
 
         for element in pattern_sequence {
             match element {
                 PatternElement::Node(node) => {
                     if let Some(label) = &node.label {
-                        nodes.push(label.clone());
+                        nodes.push(label);
                     }
                 }
                 PatternElement::Relationship(rel) => {
                     if let Some(rel_type) = rel.rel_type() {
-                        relationships.push((rel_type.to_string(), rel.direction()));
+                        relationships.push((rel_type, rel.direction()));
                     }
                 }
                 PatternElement::QuantifiedPathPattern(qpp) => {
@@ -591,12 +598,12 @@ pub fn validate_query_elements(
                         match pattern_element {
                             PatternElement::Node(node) => {
                                 if let Some(label) = &node.label {
-                                    nodes.push(label.clone());
+                                    nodes.push(label);
                                 }
                             }
                             PatternElement::Relationship(rel) => {
                                 if let Some(rel_type) = rel.rel_type() {
-                                    relationships.push((rel_type.to_string(), rel.direction()));
+                                    relationships.push((rel_type, rel.direction()));
                                 }
                             }
                             PatternElement::QuantifiedPathPattern(_) => {
@@ -609,70 +616,69 @@ pub fn validate_query_elements(
             }
         }
 
-        // Validate each relationship in the sequence
+        // Validate each relationship against the patterns of the nodes it connects
         for (i, (rel_type, direction)) in relationships.iter().enumerate() {
-            if let Some(schema_rel) = schema
+            if i + 1 >= nodes.len() {
+                continue;
+            }
+            let node1 = &nodes[i];
+            let node2 = &nodes[i + 1];
+
+            let valid = match direction {
+                // Right direction: node1 -> node2
+                Direction::Right => schema.has_relationship_pattern(node1, rel_type, node2),
+                // Left direction: node1 <- node2 (equivalent to node2 -> node1)
+                Direction::Left => schema.has_relationship_pattern(node2, rel_type, node1),
+                // Undirected: either direction matches
+                Direction::Undirected => {
+                    schema.has_relationship_pattern(node1, rel_type, node2)
+                        || schema.has_relationship_pattern(node2, rel_type, node1)
+                }
+            };
+            if valid {
+                continue;
+            }
+
+            // Only relationship types with patterns in the schema are checked
+            let Some(schema_rel) = schema
                 .relationships
                 .iter()
                 .find(|r| r.rel_type == *rel_type)
-            {
-                // Get the nodes connected by this relationship
-                if i < nodes.len() - 1 && !nodes.is_empty() {
-                    let node1 = &nodes[i];
-                    let node2 = &nodes[i + 1];
-
-                    match direction {
-                        Direction::Right => {
-                            // Right direction: node1 -> node2
-                            // Check if this matches the schema direction
-                            if node1 != &schema_rel.start || node2 != &schema_rel.end {
-                                errors.push(CypherGuardValidationError::InvalidRelationship(
-                                    format!("Relationship '{}' direction mismatch: expected {}->{}, got {}->{}", 
-                                        rel_type, schema_rel.start, schema_rel.end, node1, node2)
-                                ));
-                            }
-                        }
-                        Direction::Left => {
-                            // Left direction: node1 <- node2 (equivalent to node2 -> node1)
-                            // Check if this matches the schema direction
-                            if node1 != &schema_rel.end || node2 != &schema_rel.start {
-                                errors.push(CypherGuardValidationError::InvalidRelationship(
-                                    format!("Relationship '{}' direction mismatch: expected {}->{}, got {}->{}", 
-                                        rel_type, schema_rel.start, schema_rel.end, node2, node1)
-                                ));
-                            }
-                        }
-                        Direction::Undirected => {
-                            // Undirected: check if both nodes are valid for this relationship
-                            // This is always valid since relationships are stored undirected
-                            let valid_combination = (node1 == &schema_rel.start
-                                && node2 == &schema_rel.end)
-                                || (node1 == &schema_rel.end && node2 == &schema_rel.start);
-                            if !valid_combination {
-                                errors.push(CypherGuardValidationError::InvalidRelationship(
-                                    format!("Relationship '{}' invalid node combination: expected {} and {}, got {} and {}", 
-                                        rel_type, schema_rel.start, schema_rel.end, node1, node2)
-                                ));
-                            }
-                        }
-                    }
-                }
-            }
+            else {
+                continue;
+            };
+
+            report(CypherGuardValidationError::InvalidRelationship(
+                match direction {
+                    Direction::Right => format!(
+                        "Relationship '{}' direction mismatch: expected {}->{}, got {}->{}",
+                        rel_type, schema_rel.start, schema_rel.end, node1, node2
+                    ),
+                    Direction::Left => format!(
+                        "Relationship '{}' direction mismatch: expected {}->{}, got {}->{}",
+                        rel_type, schema_rel.start, schema_rel.end, node2, node1
+                    ),
+                    Direction::Undirected => format!(
+                        "Relationship '{}' invalid node combination: expected {} and {}, got {} and {}",
+                        rel_type, schema_rel.start, schema_rel.end, node1, node2
+                    ),
+                },
+            ))?;
         }
     }
 
     // Validate node properties
     for (label, properties) in &elements.node_properties {
         if !schema.has_label(label) {
-            errors.push(CypherGuardValidationError::InvalidNodeLabel(label.clone()));
+            report(CypherGuardValidationError::InvalidNodeLabel(label.clone()))?;
             continue;
         }
         for property in properties {
             if !schema.has_node_property(label, property) {
-                errors.push(CypherGuardValidationError::InvalidNodeProperty {
+                report(CypherGuardValidationError::InvalidNodeProperty {
                     label: label.clone(),
                     property: property.clone(),
-                });
+                })?;
             }
         }
     }
@@ -680,17 +686,17 @@ pub fn validate_query_elements(
     // Validate relationship properties
     for (rel_type, properties) in &elements.relationship_properties {
         if !schema.has_relationship_type(rel_type) {
-            errors.push(CypherGuardValidationError::InvalidRelationshipType(
+            report(CypherGuardValidationError::InvalidRelationshipType(
                 rel_type.clone(),
-            ));
+            ))?;
             continue;
         }
         for property in properties {
             if !schema.has_relationship_property(rel_type, property) {
-                errors.push(CypherGuardValidationError::InvalidRelationshipProperty {
+                report(CypherGuardValidationError::InvalidRelationshipProperty {
                     rel_type: rel_type.clone(),
                     property: property.clone(),
-                });
+                })?;
             }
         }
     }
@@ -703,78 +709,40 @@ pub fn validate_query_elements(
             PropertyContext::With => "WITH clause",
         };
 
-        let mut found = false;
-
-        // Check if the property exists in any node label
-        for properties in schema.node_props.values() {
-            if properties.iter().any(|p| p.name == access.property) {
-                found = true;
-                break;
-            }
-        }
-
-        // If not found in nodes, check relationship properties
-        if !found {
-            for properties in schema.rel_props.values() {
-                if properties.iter().any(|p| p.name == access.property) {
-                    found = true;
-                    break;
-                }
-            }
-        }
+        // Check if the property exists on any node label or relationship type
+        let found = schema.has_property(&access.property);
 
         if !found {
-            errors.push(CypherGuardValidationError::InvalidPropertyAccess {
+            report(CypherGuardValidationError::InvalidPropertyAccess {
                 variable: access.variable.clone(),
                 property: access.property.clone(),
                 context: context_str.to_string(),
-            });
+            })?;
         }
     }
 
     // Validate property type comparisons
     for comparison in &elements.property_comparisons {
-        // Find the property definition in the schema - context-aware search
-        let mut property_def = None;
-
-        // First, try context-aware search using variable bindings
-        if let Some(bound_node_label) = elements.variable_node_bindings.get(&comparison.variable) {
+        // Find the property type in the schema - context-aware search
+        let property_type = if let Some(bound_node_label) =
+            elements.variable_node_bindings.get(&comparison.variable)
+        {
             // Variable is bound to a specific node label - search only within that label
-            if let Some(properties) = schema.node_props.get(bound_node_label) {
-                property_def = properties.iter().find(|p| p.name == comparison.property);
-            }
+            schema.node_property_type(bound_node_label, &comparison.property)
         } else if let Some(bound_rel_type) = elements
             .variable_relationship_bindings
             .get(&comparison.variable)
         {
             // Variable is bound to a specific relationship type - search only within that type
-            if let Some(properties) = schema.rel_props.get(bound_rel_type) {
-                property_def = properties.iter().find(|p| p.name == comparison.property);
-            }
+            schema.relationship_property_type(bound_rel_type, &comparison.property)
         } else {
             // Fallback: No binding found, use global search (for backward compatibility)
-            // Check node properties first
-            for properties in schema.node_props.values() {
-                if let Some(prop) = properties.iter().find(|p| p.name == comparison.property) {
-                    property_def = Some(prop);
-                    break;
-                }
-            }
-
-            // If not found in nodes, check relationship properties
-            if property_def.is_none() {
-                for properties in schema.rel_props.values() {
-                    if let Some(prop) = properties.iter().find(|p| p.name == comparison.property) {
-                        property_def = Some(prop);
-                        break;
-                    }
-                }
-            }
-        }
+            schema.property_type(&comparison.property)
+        };
 
-        if let Some(prop_def) = property_def {
+        if let Some(property_type) = property_type {
             // Check if the value type matches the property type
-            let type_mismatch = match (&comparison.value_type, &prop_def.neo4j_type.to_string()) {
+            let type_mismatch = match (&comparison.value_type, property_type.as_str()) {
                 (PropertyValueType::String, t) if t == "STRING" => false,
                 (PropertyValueType::Number, t) if t == "INTEGER" || t == "FLOAT" => false,
                 (PropertyValueType::Boolean, t) if t == "BOOLEAN" => false,
@@ -785,24 +753,24 @@ pub fn validate_query_elements(
             };
 
             if type_mismatch {
-                errors.push(CypherGuardValidationError::InvalidPropertyType {
+                report(CypherGuardValidationError::InvalidPropertyType {
                     variable: comparison.variable.clone(),
                     property: comparison.property.clone(),
-                    expected_type: prop_def.neo4j_type.to_string(),
+                    expected_type: property_type.to_string(),
                     actual_value: comparison.value.clone(),
-                });
+                })?;
             }
         } else {
             // Property not found in schema - this is also an error
-            errors.push(CypherGuardValidationError::InvalidPropertyAccess {
+            report(CypherGuardValidationError::InvalidPropertyAccess {
                 variable: comparison.variable.clone(),
                 property: comparison.property.clone(),
                 context: "property comparison".to_string(),
-            });
+            })?;
         }
     }
 
-    errors
+    ControlFlow::Continue(())
 }
 
 #[cfg(test)]
@@ -1171,6 +1139,18 @@ mod tests {
         )));
     }
 
+    #[test]
+    fn test_has_validation_errors() {
+        let schema = create_test_schema();
+        let mut elements = QueryElements::new();
+        elements.add_node_label("Person".to_string());
+        assert!(!has_validation_errors(&elements, &schema));
+
+        elements.add_node_label("InvalidLabel".to_string());
+        elements.add_relationship_type("INVALID_REL".to_string());
+        assert!(has_validation_errors(&elements, &schema));
+    }
+
     #[test]
     fn test_validate_query_elements_property_access_context() {
         let schema = create_test_schema();
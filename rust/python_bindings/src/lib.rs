@@ -1,8 +1,9 @@
 #![allow(deprecated)]
 
 use ::cypher_guard::{
-    get_cypher_validation_errors, parse_query as parse_query_rust, CypherGuardError,
-    CypherGuardParsingError, CypherGuardSchemaError, CypherGuardValidationError,
+    collect_cypher_validation_errors, has_cypher_parsing_errors, has_cypher_validation_errors,
+    parse_query as parse_query_rust, parser::ast::Query as CoreQuery, validate_parsed_query,
+    CypherGuardError, CypherGuardParsingError, CypherGuardSchemaError, CypherGuardValidationError,
     DbSchema as CoreDbSchema, DbSchemaConstraint as CoreDbSchemaConstraint,
     DbSchemaIndex as CoreDbSchemaIndex, DbSchemaMetadata as CoreDbSchemaMetadata,
     DbSchemaProperty as CoreDbSchemaProperty,
@@ -10,8 +11,15 @@ use ::cypher_guard::{
     PropertyType as CorePropertyType,
 };
 use pyo3::create_exception;
-use pyo3::exceptions::PyException;
+use pyo3::exceptions::{PyBaseException, PyException};
+use pyo3::intern;
 use pyo3::prelude::*;
+use pyo3::types::PyString;
+use std::collections::hash_map::DefaultHasher;
+use std::collections::HashMap;
+use std::fmt::{self, Write};
+use std::hash::{Hash, Hasher};
+use std::sync::{Arc, LazyLock, Mutex, OnceLock, Weak};
 
 // Base exception for all validation errors
 create_exception!(cypher_guard, CypherValidationError, PyException);
@@ -400,31 +408,38 @@ impl PropertyType {
     }
 
     pub fn from_string(s: &str) -> PyResult<Self> {
-        match s.trim().to_uppercase().as_str() {
-            "STRING" | "STR" => Ok(PropertyType::STRING),
-            "INTEGER" | "INT" => Ok(PropertyType::INTEGER),
-            "FLOAT" => Ok(PropertyType::FLOAT),
-            "BOOLEAN" | "BOOL" => Ok(PropertyType::BOOLEAN),
-            "POINT" => Ok(PropertyType::POINT),
-            "DATE_TIME" => Ok(PropertyType::DATE_TIME),
-            "LIST" => Ok(PropertyType::LIST),
-            _ => Err(PyErr::new::<pyo3::exceptions::PyValueError, _>(format!(
-                "Invalid property type: '{}'. Valid types: STRING, INTEGER, FLOAT, BOOLEAN, POINT, DATE_TIME, LIST",
-                s
-            ))),
-        }
+        // The core crate owns the accepted spellings, the wrapper only trims
+        // surrounding whitespace and keeps its own error message
+        CorePropertyType::from_string(s.trim())
+            .map(|core_type| Self::from_core(&core_type))
+            .map_err(|_| {
+                PyErr::new::<pyo3::exceptions::PyValueError, _>(format!(
+                    "Invalid property type: '{}'. Valid types: STRING, INTEGER, FLOAT, BOOLEAN, POINT, DATE_TIME, LIST",
+                    s
+                ))
+            })
     }
 
-    pub fn to_string(&self) -> String {
+    pub fn as_str(&self) -> &'static str {
+        self.to_core().as_str()
+    }
+
+    /// Interned Python string for the type name, shared by every property
+    pub fn as_py_str<'py>(&self, py: Python<'py>) -> Bound<'py, PyString> {
         match self {
-            PropertyType::STRING => "STRING".to_string(),
-            PropertyType::INTEGER => "INTEGER".to_string(),
-            PropertyType::FLOAT => "FLOAT".to_string(),
-            PropertyType::BOOLEAN => "BOOLEAN".to_string(),
-            PropertyType::POINT => "POINT".to_string(),
-            PropertyType::DATE_TIME => "DATE_TIME".to_string(),
-            PropertyType::LIST => "LIST".to_string(),
-        }
+            PropertyType::STRING => intern!(py, "STRING"),
+            PropertyType::INTEGER => intern!(py, "INTEGER"),
+            PropertyType::FLOAT => intern!(py, "FLOAT"),
+            PropertyType::BOOLEAN => intern!(py, "BOOLEAN"),
+            PropertyType::POINT => intern!(py, "POINT"),
+            PropertyType::DATE_TIME => intern!(py, "DATE_TIME"),
+            PropertyType::LIST => intern!(py, "LIST"),
+        }
+        .clone()
+    }
+
+    pub fn to_string(&self) -> String {
+        self.as_str().to_string()
     }
 
     pub fn py_from_string(s: &str) -> PyResult<Self> {
@@ -436,13 +451,83 @@ impl PropertyType {
     }
 }
 
+/// Hash of the fields a schema object's __hash__ uses. The objects are
+/// immutable from Python, so the hash cannot change while they are in a
+/// set or dict.
+fn hash_fields<T: Hash>(fields: &T) -> u64 {
+    let mut hasher = DefaultHasher::new();
+    fields.hash(&mut hasher);
+    hasher.finish()
+}
+
+/// Append a string list as `['a', 'b']`, or `None`
+fn write_repr_list(out: &mut String, values: Option<&Vec<String>>) {
+    match values {
+        Some(values) => {
+            out.push('[');
+            for (i, value) in values.iter().enumerate() {
+                if i > 0 {
+                    out.push_str(", ");
+                }
+                out.push('\'');
+                out.push_str(value);
+                out.push('\'');
+            }
+            out.push(']');
+        }
+        None => out.push_str("None"),
+    }
+}
+
+/// Append strings separated by ", ", like `join` without the intermediate String
+fn write_joined(out: &mut String, values: &[String]) {
+    for (i, value) in values.iter().enumerate() {
+        if i > 0 {
+            out.push_str(", ");
+        }
+        out.push_str(value);
+    }
+}
+
+/// Append an optional value, or `None`
+fn write_repr_option<T: fmt::Display>(out: &mut String, value: Option<T>) {
+    match value {
+        Some(value) => {
+            let _ = write!(out, "{}", value);
+        }
+        None => out.push_str("None"),
+    }
+}
+
 /// Python wrapper for DbSchemaProperty
-#[pyclass]
+#[pyclass(module = "cypher_guard")]
 #[derive(Debug, Clone)]
 pub struct DbSchemaProperty {
     inner: CoreDbSchemaProperty,
 }
 
+impl DbSchemaProperty {
+    /// Append the repr to `out`, so DbSchema's repr can build one string
+    fn write_repr(&self, out: &mut String) {
+        let _ = write!(
+            out,
+            "DbSchemaProperty(name={}, neo4j_type={}, enum_values=",
+            self.inner.name,
+            PropertyType::from_core(&self.inner.neo4j_type).as_str()
+        );
+        write_repr_list(out, self.inner.enum_values.as_ref());
+        out.push_str(", min_value=");
+        write_repr_option(out, self.inner.min_value);
+        out.push_str(", max_value=");
+        write_repr_option(out, self.inner.max_value);
+        out.push_str(", distinct_value_count=");
+        write_repr_option(out, self.inner.distinct_value_count);
+        out.push_str(", example_values=");
+        write_repr_list(out, self.inner.example_values.as_ref());
+        out.push(')');
+    }
+}
+
 #[pymethods]
 impl DbSchemaProperty {
     /// Create a new DbSchemaProperty.
@@ -459,7 +544,7 @@ impl DbSchemaProperty {
     #[pyo3(signature = (name, neo4j_type, enum_values=None, min_value=None, max_value=None, distinct_value_count=None, example_values=None))]
     fn new(
         name: String,
-        neo4j_type: String,
+        neo4j_type: &str,
         enum_values: Option<Vec<String>>,
         min_value: Option<f64>,
         max_value: Option<f64>,
@@ -467,30 +552,71 @@ impl DbSchemaProperty {
         example_values: Option<Vec<String>>,
     ) -> PyResult<Self> {
         // Validate the neo4j_type string and convert to internal enum
-        let property_type_enum = PropertyType::from_string(&neo4j_type)?;
+        let property_type_enum = PropertyType::from_string(neo4j_type)?;
 
         let inner = CoreDbSchemaProperty {
-            name: name.clone(),
+            name,
             neo4j_type: property_type_enum.to_core(),
-            enum_values: enum_values.clone(),
+            enum_values,
             min_value,
             max_value,
             distinct_value_count,
-            example_values: example_values.clone(),
+            example_values,
         };
 
         Ok(Self { inner })
     }
 
+    /// Create several DbSchemaProperty objects in one call.
+    ///
+    /// Args:
+    ///     records (List[Tuple[str, str, Optional[List[str]]]]): (name, neo4j_type, enum_values) of each property
+    ///
+    /// Returns:
+    ///     List[DbSchemaProperty]: The properties, in input order
+    #[classmethod]
+    fn from_records(
+        _cls: &Bound<'_, pyo3::types::PyType>,
+        records: Vec<(String, String, Option<Vec<String>>)>,
+    ) -> PyResult<Vec<Self>> {
+        records
+            .into_iter()
+            .map(|(name, neo4j_type, enum_values)| {
+                Self::new(name, &neo4j_type, enum_values, None, None, None, None)
+            })
+            .collect()
+    }
+
+    /// Create several DbSchemaProperty objects from a list of dictionaries.
+    ///
+    /// Args:
+    ///     items (List[Dict[str, Any]]): Property dictionaries, in the format accepted by from_dict
+    ///
+    /// Returns:
+    ///     List[DbSchemaProperty]: The properties, in input order
+    #[classmethod]
+    fn from_dicts(
+        cls: &Bound<'_, pyo3::types::PyType>,
+        items: &Bound<'_, pyo3::types::PyList>,
+    ) -> PyResult<Vec<Self>> {
+        let mut properties = Vec::with_capacity(items.len());
+        for item in items.iter() {
+            let dict = item.downcast::<pyo3::types::PyDict>()?;
+            properties.push(Self::py_from_dict(cls, dict)?);
+        }
+        Ok(properties)
+    }
+
     #[classmethod]
     #[pyo3(name = "from_dict")]
     fn py_from_dict(
         _cls: &Bound<'_, pyo3::types::PyType>,
         dict: &Bound<'_, pyo3::types::PyDict>,
     ) -> PyResult<Self> {
-        let name = match dict.get_item("name")? {
+        let py = dict.py();
+        let name = match dict.get_item(intern!(py, "name"))? {
             Some(value) => value.extract::<String>()?,
-            None => match dict.get_item("property")? {
+            None => match dict.get_item(intern!(py, "property"))? {
                 Some(value) => value.extract::<String>()?,
                 None => {
                     return Err(PyErr::new::<pyo3::exceptions::PyKeyError, _>(
@@ -500,10 +626,11 @@ impl DbSchemaProperty {
             },
         };
 
-        let neo4j_type = match dict.get_item("neo4j_type")? {
-            Some(value) => value.extract::<String>()?,
-            None => match dict.get_item("type")? {
-                Some(value) => value.extract::<String>()?,
+        // The type name is only validated, so borrow it instead of copying
+        let neo4j_type_item = match dict.get_item(intern!(py, "neo4j_type"))? {
+            Some(value) => value,
+            None => match dict.get_item(intern!(py, "type"))? {
+                Some(value) => value,
                 None => {
                     return Err(PyErr::new::<pyo3::exceptions::PyKeyError, _>(
                         "Missing 'neo4j_type' or 'type' field",
@@ -512,27 +639,35 @@ impl DbSchemaProperty {
             },
         };
 
-        let property_type_enum = PropertyType::from_string(&neo4j_type)?;
+        let neo4j_type = neo4j_type_item.downcast::<PyString>()?.to_str()?;
+        let property_type_enum = PropertyType::from_string(neo4j_type)?;
 
         // Extract optional fields with alternative field names support
-        let distinct_value_count = match dict.get_item("distinct_value_count")? {
+        let distinct_value_count = match dict.get_item(intern!(py, "distinct_value_count"))? {
             Some(value) if !value.is_none() => Some(value.extract::<i64>()?),
-            _ => match dict.get_item("distinct_count")? {
+            _ => match dict.get_item(intern!(py, "distinct_count"))? {
                 Some(value) if !value.is_none() => Some(value.extract::<i64>()?),
                 _ => None,
             },
         };
 
-        let enum_values = match dict.get_item("enum_values")? {
+        // "values" is the fallback for both enum_values and example_values. It is
+        // only extracted where a fallback is used, and at most once
+        let values_item = dict
+            .get_item(intern!(py, "values"))?
+            .filter(|value| !value.is_none());
+        let mut values: Option<Vec<String>> = None;
+
+        let enum_values = match dict.get_item(intern!(py, "enum_values"))? {
             Some(value) if !value.is_none() => Some(value.extract::<Vec<String>>()?),
-            _ => match dict.get_item("values")? {
+            _ => match &values_item {
+                // Check the length before extracting, values of other lengths are not enums
                 Some(value)
-                    if !value.is_none()
-                        && value
-                            .len()
-                            .is_ok_and(|len| len == distinct_value_count.unwrap_or(0) as usize) =>
+                    if value
+                        .len()
+                        .is_ok_and(|len| len == distinct_value_count.unwrap_or(0) as usize) =>
                 {
-                    Some(value.extract::<Vec<String>>()?)
+                    Some(values.insert(value.extract::<Vec<String>>()?).clone())
                 }
                 _ => None,
             },
@@ -542,8 +677,9 @@ impl DbSchemaProperty {
         let extract_float_value = |value: &Bound<'_, pyo3::types::PyAny>| -> Option<f64> {
             if let Ok(num) = value.extract::<f64>() {
                 Some(num)
-            } else if let Ok(s) = value.extract::<String>() {
-                s.parse::<f64>().ok()
+            } else if let Ok(s) = value.downcast::<PyString>() {
+                // Parse the borrowed text, without copying it into a String
+                s.to_str().ok()?.parse::<f64>().ok()
             } else {
                 None
             }
@@ -553,39 +689,41 @@ impl DbSchemaProperty {
         let mut min_value: Option<f64> = None;
         let mut max_value: Option<f64> = None;
         if neo4j_type == "INTEGER" || neo4j_type == "FLOAT" {
-            min_value = match dict.get_item("min_value")? {
+            min_value = match dict.get_item(intern!(py, "min_value"))? {
                 Some(value) if !value.is_none() => extract_float_value(&value),
-                _ => match dict.get_item("min")? {
+                _ => match dict.get_item(intern!(py, "min"))? {
                     Some(value) if !value.is_none() => extract_float_value(&value),
                     _ => None,
                 },
             };
 
-            max_value = match dict.get_item("max_value")? {
+            max_value = match dict.get_item(intern!(py, "max_value"))? {
                 Some(value) if !value.is_none() => extract_float_value(&value),
-                _ => match dict.get_item("max")? {
+                _ => match dict.get_item(intern!(py, "max"))? {
                     Some(value) if !value.is_none() => extract_float_value(&value),
                     _ => None,
                 },
             };
         }
 
-        let example_values = match dict.get_item("example_values")? {
+        let example_values = match dict.get_item(intern!(py, "example_values"))? {
             Some(value) if !value.is_none() => Some(value.extract::<Vec<String>>()?),
-            _ => match dict.get_item("values")? {
-                Some(value) if !value.is_none() => Some(value.extract::<Vec<String>>()?),
-                _ => None,
+            _ => match values {
+                Some(values) => Some(values),
+                None => values_item
+                    .map(|value| value.extract::<Vec<String>>())
+                    .transpose()?,
             },
         };
 
         let inner = CoreDbSchemaProperty {
-            name: name.clone(),
+            name,
             neo4j_type: property_type_enum.to_core(),
-            enum_values: enum_values.clone(),
+            enum_values,
             min_value,
             max_value,
             distinct_value_count,
-            example_values: example_values.clone(),
+            example_values,
         };
 
         Ok(Self { inner })
@@ -598,8 +736,8 @@ impl DbSchemaProperty {
     }
 
     #[getter]
-    fn neo4j_type(&self) -> String {
-        PropertyType::from_core(&self.inner.neo4j_type).to_string()
+    fn neo4j_type<'py>(&self, py: Python<'py>) -> Bound<'py, PyString> {
+        PropertyType::from_core(&self.inner.neo4j_type).as_py_str(py)
     }
 
     #[getter]
@@ -630,92 +768,57 @@ impl DbSchemaProperty {
     #[pyo3(name = "to_dict")]
     fn py_to_dict(&self, py: Python) -> PyResult<PyObject> {
         let dict = pyo3::types::PyDict::new(py);
-        dict.set_item("name", &self.inner.name)?;
+        dict.set_item(intern!(py, "name"), &self.inner.name)?;
         dict.set_item(
-            "neo4j_type",
-            &PropertyType::from_core(&self.inner.neo4j_type).to_string(),
+            intern!(py, "neo4j_type"),
+            PropertyType::from_core(&self.inner.neo4j_type).as_py_str(py),
         )?;
         if let Some(ref enum_values) = self.inner.enum_values {
-            dict.set_item("enum_values", enum_values)?;
+            dict.set_item(intern!(py, "enum_values"), enum_values)?;
         }
         if let Some(min_value) = self.inner.min_value {
-            dict.set_item("min_value", min_value)?;
+            dict.set_item(intern!(py, "min_value"), min_value)?;
         }
         if let Some(max_value) = self.inner.max_value {
-            dict.set_item("max_value", max_value)?;
+            dict.set_item(intern!(py, "max_value"), max_value)?;
         }
         if let Some(distinct_value_count) = self.inner.distinct_value_count {
-            dict.set_item("distinct_value_count", distinct_value_count)?;
+            dict.set_item(intern!(py, "distinct_value_count"), distinct_value_count)?;
         }
         if let Some(ref example_values) = self.inner.example_values {
-            dict.set_item("example_values", example_values)?;
+            dict.set_item(intern!(py, "example_values"), example_values)?;
         }
         Ok(dict.into())
     }
 
     fn __repr__(&self) -> String {
-        let enum_values_str = match &self.inner.enum_values {
-            Some(values) => format!(
-                "[{}]",
-                values
-                    .iter()
-                    .map(|v| format!("'{}'", v))
-                    .collect::<Vec<_>>()
-                    .join(", ")
-            ),
-            None => "None".to_string(),
-        };
-
-        let min_value_str = match self.inner.min_value {
-            Some(val) => val.to_string(),
-            None => "None".to_string(),
-        };
-
-        let max_value_str = match self.inner.max_value {
-            Some(val) => val.to_string(),
-            None => "None".to_string(),
-        };
-
-        let distinct_value_count_str = match self.inner.distinct_value_count {
-            Some(val) => val.to_string(),
-            None => "None".to_string(),
-        };
-
-        let example_values_str = match &self.inner.example_values {
-            Some(values) => format!(
-                "[{}]",
-                values
-                    .iter()
-                    .map(|v| format!("'{}'", v))
-                    .collect::<Vec<_>>()
-                    .join(", ")
-            ),
-            None => "None".to_string(),
-        };
-
-        format!(
-            "DbSchemaProperty(name={}, neo4j_type={}, enum_values={}, min_value={}, max_value={}, distinct_value_count={}, example_values={})",
-            self.inner.name,
-            PropertyType::from_core(&self.inner.neo4j_type).to_string(),
-            enum_values_str,
-            min_value_str,
-            max_value_str,
-            distinct_value_count_str,
-            example_values_str
-        )
+        let mut out = String::with_capacity(160);
+        self.write_repr(&mut out);
+        out
     }
 
     fn __str__(&self) -> String {
         format!(
             "{}: {}",
             self.inner.name,
-            PropertyType::from_core(&self.inner.neo4j_type).to_string()
+            PropertyType::from_core(&self.inner.neo4j_type).as_str()
         )
     }
+
+    fn __eq__(&self, other: &Self) -> bool {
+        self.inner == other.inner
+    }
+
+    fn __hash__(&self) -> u64 {
+        hash_fields(&(
+            &self.inner.name,
+            PropertyType::from_core(&self.inner.neo4j_type),
+        ))
+    }
 }
 
 /// Python wrapper for DbSchemaRelationshipPattern
-#[pyclass]
+#[pyclass(module = "cypher_guard")]
 #[derive(Debug, Clone)]
 pub struct DbSchemaRelationshipPattern {
     #[pyo3(get)]
@@ -750,17 +853,18 @@ impl DbSchemaRelationshipPattern {
         _cls: &Bound<'_, pyo3::types::PyType>,
         dict: &Bound<'_, pyo3::types::PyDict>,
     ) -> PyResult<Self> {
+        let py = dict.py();
         let start = dict
-            .get_item("start")?
+            .get_item(intern!(py, "start"))?
             .ok_or_else(|| PyErr::new::<pyo3::exceptions::PyKeyError, _>("Missing 'start' field"))?
             .extract::<String>()?;
         let end = dict
-            .get_item("end")?
+            .get_item(intern!(py, "end"))?
             .ok_or_else(|| PyErr::new::<pyo3::exceptions::PyKeyError, _>("Missing 'end' field"))?
             .extract::<String>()?;
-        let rel_type = match dict.get_item("rel_type")? {
+        let rel_type = match dict.get_item(intern!(py, "rel_type"))? {
             Some(value) => value.extract::<String>()?,
-            None => match dict.get_item("type")? {
+            None => match dict.get_item(intern!(py, "type"))? {
                 Some(value) => value.extract::<String>()?,
                 None => {
                     return Err(PyErr::new::<pyo3::exceptions::PyKeyError, _>(
@@ -775,9 +879,9 @@ impl DbSchemaRelationshipPattern {
     #[pyo3(name = "to_dict")]
     fn py_to_dict(&self, py: Python) -> PyResult<PyObject> {
         let dict = pyo3::types::PyDict::new(py);
-        dict.set_item("start", &self.start)?;
-        dict.set_item("end", &self.end)?;
-        dict.set_item("rel_type", &self.rel_type)?;
+        dict.set_item(intern!(py, "start"), &self.start)?;
+        dict.set_item(intern!(py, "end"), &self.end)?;
+        dict.set_item(intern!(py, "rel_type"), &self.rel_type)?;
         Ok(dict.into())
     }
 
@@ -791,10 +895,18 @@ impl DbSchemaRelationshipPattern {
     fn __str__(&self) -> String {
         format!("(:{})-[:{}]->(:{})", self.start, self.rel_type, self.end)
     }
+
+    fn __eq__(&self, other: &Self) -> bool {
+        self.inner == other.inner
+    }
+
+    fn __hash__(&self) -> u64 {
+        hash_fields(&(&self.start, &self.end, &self.rel_type))
+    }
 }
 
 /// Python wrapper for DbSchemaConstraint
-#[pyclass]
+#[pyclass(module = "cypher_guard")]
 #[derive(Debug, Clone)]
 pub struct DbSchemaConstraint {
     #[pyo3(get)]
@@ -817,6 +929,26 @@ pub struct DbSchemaConstraint {
     inner: CoreDbSchemaConstraint,
 }
 
+impl DbSchemaConstraint {
+    /// Append the repr to `out`, so DbSchemaMetadata's repr can build one string
+    fn write_repr(&self, out: &mut String) {
+        let _ = write!(
+            out,
+            "DbSchemaConstraint(id={}, name={}, constraint_type={}, entity_type={}, labels_or_types=[",
+            self.id, self.name, self.constraint_type, self.entity_type
+        );
+        write_joined(out, &self.labels_or_types);
+        out.push_str("], properties=[");
+        write_joined(out, &self.properties);
+        let _ = write!(
+            out,
+            "], owned_index={}, property_type={})",
+            self.owned_index,
+            self.property_type.as_deref().unwrap_or("None")
+        );
+    }
+}
+
 #[pymethods]
 impl DbSchemaConstraint {
     #[new]
@@ -859,17 +991,18 @@ impl DbSchemaConstraint {
         _cls: &Bound<'_, pyo3::types::PyType>,
         dict: &Bound<'_, pyo3::types::PyDict>,
     ) -> PyResult<Self> {
+        let py = dict.py();
         let id = dict
-            .get_item("id")?
+            .get_item(intern!(py, "id"))?
             .ok_or_else(|| PyErr::new::<pyo3::exceptions::PyKeyError, _>("Missing 'id' field"))?
             .extract::<i64>()?;
         let name = dict
-            .get_item("name")?
+            .get_item(intern!(py, "name"))?
             .ok_or_else(|| PyErr::new::<pyo3::exceptions::PyKeyError, _>("Missing 'name' field"))?
             .extract::<String>()?;
-        let constraint_type = match dict.get_item("constraint_type")? {
+        let constraint_type = match dict.get_item(intern!(py, "constraint_type"))? {
             Some(value) => value.extract::<String>()?,
-            None => match dict.get_item("type")? {
+            None => match dict.get_item(intern!(py, "type"))? {
                 Some(value) => value.extract::<String>()?,
                 None => {
                     return Err(PyErr::new::<pyo3::exceptions::PyKeyError, _>(
@@ -878,9 +1011,9 @@ impl DbSchemaConstraint {
                 }
             },
         };
-        let entity_type = match dict.get_item("entity_type")? {
+        let entity_type = match dict.get_item(intern!(py, "entity_type"))? {
             Some(value) => value.extract::<String>()?,
-            None => match dict.get_item("entityType")? {
+            None => match dict.get_item(intern!(py, "entityType"))? {
                 Some(value) => value.extract::<String>()?,
                 None => {
                     return Err(PyErr::new::<pyo3::exceptions::PyKeyError, _>(
@@ -889,11 +1022,11 @@ impl DbSchemaConstraint {
                 }
             },
         };
-        let labels_or_types = match dict.get_item("labels_or_types")? {
+        let labels_or_types = match dict.get_item(intern!(py, "labels_or_types"))? {
             Some(value) => value.extract::<Vec<String>>()?,
-            None => match dict.get_item("labelsOrTypes")? {
+            None => match dict.get_item(intern!(py, "labelsOrTypes"))? {
                 Some(value) => value.extract::<Vec<String>>()?,
-                None => match dict.get_item("labels")? {
+                None => match dict.get_item(intern!(py, "labels"))? {
                     Some(value) => value.extract::<Vec<String>>()?,
                     None => {
                         return Err(PyErr::new::<pyo3::exceptions::PyKeyError, _>(
@@ -905,21 +1038,21 @@ impl DbSchemaConstraint {
         };
 
         let properties = dict
-            .get_item("properties")?
+            .get_item(intern!(py, "properties"))?
             .ok_or_else(|| {
                 PyErr::new::<pyo3::exceptions::PyKeyError, _>("Missing 'properties' field")
             })?
             .extract::<Vec<String>>()?;
-        let owned_index = match dict.get_item("owned_index")? {
+        let owned_index = match dict.get_item(intern!(py, "owned_index"))? {
             Some(value) => Some(value.extract::<String>()?),
-            None => match dict.get_item("ownedIndex")? {
+            None => match dict.get_item(intern!(py, "ownedIndex"))? {
                 Some(value) => Some(value.extract::<String>()?),
                 None => None,
             },
         };
-        let property_type = match dict.get_item("property_type")? {
+        let property_type = match dict.get_item(intern!(py, "property_type"))? {
             Some(value) if !value.is_none() => Some(value.extract::<String>()?),
-            _ => match dict.get_item("propertyType")? {
+            _ => match dict.get_item(intern!(py, "propertyType"))? {
                 Some(value) if !value.is_none() => Some(value.extract::<String>()?),
                 _ => None,
             },
@@ -940,31 +1073,24 @@ impl DbSchemaConstraint {
     #[pyo3(name = "to_dict")]
     fn py_to_dict(&self, py: Python) -> PyResult<PyObject> {
         let dict = pyo3::types::PyDict::new(py);
-        dict.set_item("id", self.id)?;
-        dict.set_item("name", &self.name)?;
-        dict.set_item("constraint_type", &self.constraint_type)?;
-        dict.set_item("entity_type", &self.entity_type)?;
-        dict.set_item("labels_or_types", &self.labels_or_types)?;
-        dict.set_item("properties", &self.properties)?;
-        dict.set_item("owned_index", &self.owned_index)?;
+        dict.set_item(intern!(py, "id"), self.id)?;
+        dict.set_item(intern!(py, "name"), &self.name)?;
+        dict.set_item(intern!(py, "constraint_type"), &self.constraint_type)?;
+        dict.set_item(intern!(py, "entity_type"), &self.entity_type)?;
+        dict.set_item(intern!(py, "labels_or_types"), &self.labels_or_types)?;
+        dict.set_item(intern!(py, "properties"), &self.properties)?;
+        dict.set_item(intern!(py, "owned_index"), &self.owned_index)?;
         dict.set_item(
-            "property_type",
+            intern!(py, "property_type"),
             self.property_type.as_ref().map(|s| s.as_str()),
         )?;
         Ok(dict.into())
     }
 
     fn __repr__(&self) -> String {
-        format!("DbSchemaConstraint(id={}, name={}, constraint_type={}, entity_type={}, labels_or_types=[{}], properties=[{}], owned_index={}, property_type={})",
-            self.id,
-            self.name,
-            self.constraint_type,
-            self.entity_type,
-            self.labels_or_types.join(", "),
-            self.properties.join(", "),
-            self.owned_index,
-            self.property_type.as_ref().map_or("None".to_string(), |pt| pt.clone())
-        )
+        let mut out = String::with_capacity(192);
+        self.write_repr(&mut out);
+        out
     }
 
     fn __str__(&self) -> String {
@@ -977,10 +1103,25 @@ impl DbSchemaConstraint {
             self.properties.join(", "),
         )
     }
+
+    fn __eq__(&self, other: &Self) -> bool {
+        self.id == other.id
+            && self.name == other.name
+            && self.constraint_type == other.constraint_type
+            && self.entity_type == other.entity_type
+            && self.labels_or_types == other.labels_or_types
+            && self.properties == other.properties
+            && self.owned_index == other.owned_index
+            && self.property_type == other.property_type
+    }
+
+    fn __hash__(&self) -> u64 {
+        hash_fields(&(self.id, &self.name))
+    }
 }
 
 /// Python wrapper for DbSchemaIndex
-#[pyclass]
+#[pyclass(module = "cypher_guard")]
 #[derive(Debug, Clone)]
 pub struct DbSchemaIndex {
     #[pyo3(get)]
@@ -999,6 +1140,19 @@ pub struct DbSchemaIndex {
     inner: CoreDbSchemaIndex,
 }
 
+impl DbSchemaIndex {
+    /// Append the repr to `out`, so DbSchemaMetadata's repr can build one string
+    fn write_repr(&self, out: &mut String) {
+        let _ = write!(out, "DbSchemaIndex(label={}, properties=[", self.label);
+        write_joined(out, &self.properties);
+        let _ = write!(
+            out,
+            "], size={}, index_type={}, values_selectivity={}, distinct_values={})",
+            self.size, self.index_type, self.values_selectivity, self.distinct_values
+        );
+    }
+}
+
 #[pymethods]
 impl DbSchemaIndex {
     #[new]
@@ -1031,24 +1185,25 @@ impl DbSchemaIndex {
         _cls: &Bound<'_, pyo3::types::PyType>,
         dict: &Bound<'_, pyo3::types::PyDict>,
     ) -> PyResult<Self> {
+        let py = dict.py();
         let label = dict
-            .get_item("label")?
+            .get_item(intern!(py, "label"))?
             .ok_or_else(|| PyErr::new::<pyo3::exceptions::PyKeyError, _>("Missing 'label' field"))?
             .extract::<String>()?;
         let properties = dict
-            .get_item("properties")?
+            .get_item(intern!(py, "properties"))?
             .ok_or_else(|| {
                 PyErr::new::<pyo3::exceptions::PyKeyError, _>("Missing 'properties' field")
             })?
             .extract::<Vec<String>>()?;
         let size = dict
-            .get_item("size")?
+            .get_item(intern!(py, "size"))?
             .ok_or_else(|| PyErr::new::<pyo3::exceptions::PyKeyError, _>("Missing 'size' field"))?
             .extract::<i64>()?;
-        let index_type = match dict.get_item("index_type")? {
+        let index_type = match dict.get_item(intern!(py, "index_type"))? {
             Some(value) => value.extract::<String>()?,
             None => dict
-                .get_item("type")?
+                .get_item(intern!(py, "type"))?
                 .ok_or_else(|| {
                     PyErr::new::<pyo3::exceptions::PyKeyError, _>(
                         "Missing 'index_type' or 'type' field",
@@ -1056,16 +1211,16 @@ impl DbSchemaIndex {
                 })?
                 .extract::<String>()?,
         };
-        let values_selectivity = match dict.get_item("values_selectivity")? {
+        let values_selectivity = match dict.get_item(intern!(py, "values_selectivity"))? {
             Some(value) => value.extract::<f64>()?,
-            None => match dict.get_item("valuesSelectivity")? {
+            None => match dict.get_item(intern!(py, "valuesSelectivity"))? {
                 Some(value) => value.extract::<f64>()?,
                 None => 0.0,
             },
         };
-        let distinct_values = match dict.get_item("distinct_values")? {
+        let distinct_values = match dict.get_item(intern!(py, "distinct_values"))? {
             Some(value) => value.extract::<f64>()?,
-            None => match dict.get_item("distinctValues")? {
+            None => match dict.get_item(intern!(py, "distinctValues"))? {
                 Some(value) => value.extract::<f64>()?,
                 None => 0.0,
             },
@@ -1084,24 +1239,19 @@ impl DbSchemaIndex {
     #[pyo3(name = "to_dict")]
     fn py_to_dict(&self, py: Python) -> PyResult<PyObject> {
         let dict = pyo3::types::PyDict::new(py);
-        dict.set_item("label", &self.label)?;
-        dict.set_item("properties", &self.properties)?;
-        dict.set_item("size", self.size)?;
-        dict.set_item("index_type", &self.index_type)?;
-        dict.set_item("values_selectivity", self.values_selectivity)?;
-        dict.set_item("distinct_values", self.distinct_values)?;
+        dict.set_item(intern!(py, "label"), &self.label)?;
+        dict.set_item(intern!(py, "properties"), &self.properties)?;
+        dict.set_item(intern!(py, "size"), self.size)?;
+        dict.set_item(intern!(py, "index_type"), &self.index_type)?;
+        dict.set_item(intern!(py, "values_selectivity"), self.values_selectivity)?;
+        dict.set_item(intern!(py, "distinct_values"), self.distinct_values)?;
         Ok(dict.into())
     }
 
     fn __repr__(&self) -> String {
-        format!("DbSchemaIndex(label={}, properties=[{}], size={}, index_type={}, values_selectivity={}, distinct_values={})",
-            self.label,
-            self.properties.join(", "),
-            self.size,
-            self.index_type,
-            self.values_selectivity,
-            self.distinct_values
-        )
+        let mut out = String::with_capacity(128);
+        self.write_repr(&mut out);
+        out
     }
 
     fn __str__(&self) -> String {
@@ -1112,10 +1262,23 @@ impl DbSchemaIndex {
             self.properties.join(", ")
         )
     }
+
+    fn __eq__(&self, other: &Self) -> bool {
+        self.label == other.label
+            && self.properties == other.properties
+            && self.size == other.size
+            && self.index_type == other.index_type
+            && self.values_selectivity == other.values_selectivity
+            && self.distinct_values == other.distinct_values
+    }
+
+    fn __hash__(&self) -> u64 {
+        hash_fields(&(&self.label, &self.properties))
+    }
 }
 
 /// Python wrapper for DbSchemaMetadata
-#[pyclass]
+#[pyclass(module = "cypher_guard")]
 #[derive(Debug, Clone)]
 pub struct DbSchemaMetadata {
     #[pyo3(get)]
@@ -1126,6 +1289,27 @@ pub struct DbSchemaMetadata {
     inner: CoreDbSchemaMetadata,
 }
 
+impl DbSchemaMetadata {
+    /// Append the repr to `out`, so DbSchema's repr can build one string
+    fn write_repr(&self, out: &mut String) {
+        out.push_str("DbSchemaMetadata(constraint=[");
+        for (i, constraint) in self.constraint.iter().enumerate() {
+            if i > 0 {
+                out.push_str(", ");
+            }
+            constraint.write_repr(out);
+        }
+        out.push_str("], index=[");
+        for (i, index) in self.index.iter().enumerate() {
+            if i > 0 {
+                out.push_str(", ");
+            }
+            index.write_repr(out);
+        }
+        out.push_str("])");
+    }
+}
+
 #[pymethods]
 impl DbSchemaMetadata {
     #[new]
@@ -1147,10 +1331,11 @@ impl DbSchemaMetadata {
         _cls: &Bound<'_, pyo3::types::PyType>,
         dict: &Bound<'_, pyo3::types::PyDict>,
     ) -> PyResult<Self> {
-        let constraint = match dict.get_item("constraint")? {
+        let py = dict.py();
+        let constraint = match dict.get_item(intern!(py, "constraint"))? {
             Some(items) => {
                 let iter = items.try_iter()?;
-                let mut constraints = Vec::new();
+                let mut constraints = Vec::with_capacity(items.len().unwrap_or(0));
                 for item in iter {
                     let constraint_item = item?;
                     if let Ok(constraint_dict) = constraint_item.downcast::<pyo3::types::PyDict>() {
@@ -1166,10 +1351,10 @@ impl DbSchemaMetadata {
             None => Vec::new(),
         };
 
-        let index = match dict.get_item("index")? {
+        let index = match dict.get_item(intern!(py, "index"))? {
             Some(items) => {
                 let iter = items.try_iter()?;
-                let mut indexes = Vec::new();
+                let mut indexes = Vec::with_capacity(items.len().unwrap_or(0));
                 for item in iter {
                     let index_item = item?;
                     if let Ok(index_dict) = index_item.downcast::<pyo3::types::PyDict>() {
@@ -1192,35 +1377,27 @@ impl DbSchemaMetadata {
     fn py_to_dict(&self, py: Python) -> PyResult<PyObject> {
         let dict = pyo3::types::PyDict::new(py);
 
-        let constraint_list = pyo3::types::PyList::empty(py);
-        for constraint in &self.constraint {
-            constraint_list.append(constraint.py_to_dict(py)?)?;
-        }
-        dict.set_item("constraint", constraint_list)?;
+        let constraint_list = self
+            .constraint
+            .iter()
+            .map(|constraint| constraint.py_to_dict(py))
+            .collect::<PyResult<Vec<_>>>()?;
+        dict.set_item(intern!(py, "constraint"), constraint_list)?;
 
-        let index_list = pyo3::types::PyList::empty(py);
-        for index in &self.index {
-            index_list.append(index.py_to_dict(py)?)?;
-        }
-        dict.set_item("index", index_list)?;
+        let index_list = self
+            .index
+            .iter()
+            .map(|index| index.py_to_dict(py))
+            .collect::<PyResult<Vec<_>>>()?;
+        dict.set_item(intern!(py, "index"), index_list)?;
 
         Ok(dict.into())
     }
 
     fn __repr__(&self) -> String {
-        format!(
-            "DbSchemaMetadata(constraint=[{}], index=[{}])",
-            self.constraint
-                .iter()
-                .map(|c| c.__repr__())
-                .collect::<Vec<String>>()
-                .join(", "),
-            self.index
-                .iter()
-                .map(|i| i.__repr__())
-                .collect::<Vec<String>>()
-                .join(", ")
-        )
+        let mut out = String::with_capacity(64 + 192 * (self.constraint.len() + self.index.len()));
+        self.write_repr(&mut out);
+        out
     }
 
     fn __str__(&self) -> String {
@@ -1240,8 +1417,25 @@ impl DbSchemaMetadata {
     }
 }
 
+/// Return the cached string, formatting it with the GIL released on first use.
+///
+/// Formatting runs outside the OnceLock initializer: a thread blocked on the
+/// lock while holding the GIL would otherwise deadlock with the formatting
+/// thread waiting to take the GIL back. Concurrent first calls may both
+/// format, the first result is kept.
+fn cached_format<F>(py: Python, cache: &OnceLock<String>, format: F) -> String
+where
+    F: FnOnce() -> String + Send,
+{
+    if let Some(formatted) = cache.get() {
+        return formatted.clone();
+    }
+    let formatted = py.detach(format);
+    cache.get_or_init(|| formatted).clone()
+}
+
 /// Python wrapper for DbSchema
-#[pyclass]
+#[pyclass(module = "cypher_guard")]
 #[derive(Debug, Clone)]
 pub struct DbSchema {
     #[pyo3(get)]
@@ -1252,7 +1446,147 @@ pub struct DbSchema {
     pub relationships: Vec<DbSchemaRelationshipPattern>,
     #[pyo3(get)]
     pub metadata: DbSchemaMetadata,
-    inner: CoreDbSchema,
+    inner: Arc<CoreDbSchema>,
+    // The fields are read-only from Python, so str() and repr() are
+    // formatted once and reused
+    str_cache: OnceLock<String>,
+    repr_cache: OnceLock<String>,
+}
+
+impl DbSchema {
+    /// Build the wrapper and its core schema from already extracted parts,
+    /// so lookups like has_label are answered from the core schema's index.
+    /// Duplicate properties or relationship patterns raise ValueError, as in from_dict
+    fn from_parts(
+        node_props: HashMap<String, Vec<DbSchemaProperty>>,
+        rel_props: HashMap<String, Vec<DbSchemaProperty>>,
+        relationships: Vec<DbSchemaRelationshipPattern>,
+        metadata: Option<DbSchemaMetadata>,
+    ) -> PyResult<Self> {
+        let to_value_error =
+            |e: CypherGuardError| PyErr::new::<pyo3::exceptions::PyValueError, _>(e.to_string());
+        let mut core_schema = CoreDbSchema::new();
+        for (label, properties) in &node_props {
+            core_schema.add_label(label).map_err(to_value_error)?;
+            for prop in properties {
+                core_schema
+                    .add_node_property(label, &prop.inner)
+                    .map_err(to_value_error)?;
+            }
+        }
+        for (rel_type, properties) in &rel_props {
+            for prop in properties {
+                core_schema
+                    .add_relationship_property(rel_type, &prop.inner)
+                    .map_err(to_value_error)?;
+            }
+        }
+        for rel in &relationships {
+            core_schema
+                .add_relationship_pattern(rel.inner.clone())
+                .map_err(to_value_error)?;
+        }
+
+        Ok(Self {
+            node_props,
+            rel_props,
+            relationships,
+            metadata: metadata.unwrap_or_else(|| DbSchemaMetadata::new(None, None)),
+            inner: Arc::new(core_schema),
+            str_cache: OnceLock::new(),
+            repr_cache: OnceLock::new(),
+        })
+    }
+
+    fn format_str(&self) -> String {
+        let mut result = String::new();
+
+        // Nodes section
+        result.push_str("Nodes:\n");
+        for (label, properties) in &self.node_props {
+            let _ = writeln!(result, "{}:", label);
+            for prop in properties {
+                let _ = writeln!(result, "{}", prop.__str__());
+            }
+        }
+
+        // Relationship Properties section
+        if !self.rel_props.is_empty() {
+            result.push_str("Relationship Properties:\n");
+            for (rel_type, properties) in &self.rel_props {
+                let _ = writeln!(result, "{}:", rel_type);
+                for prop in properties {
+                    let _ = writeln!(result, "{}", prop.__str__());
+                }
+            }
+        }
+
+        // Relationships section
+        if !self.relationships.is_empty() {
+            result.push_str("Relationships:\n");
+            for rel in &self.relationships {
+                let _ = writeln!(result, "{}", rel.__str__());
+            }
+        }
+
+        // Constraints section
+        if !self.metadata.constraint.is_empty() {
+            result.push_str("Constraints:\n");
+            for constraint in &self.metadata.constraint {
+                let _ = writeln!(result, "{}", constraint.__str__());
+            }
+        }
+
+        // Indexes section
+        if !self.metadata.index.is_empty() {
+            result.push_str("Indexes:\n");
+            for index in &self.metadata.index {
+                let _ = writeln!(result, "{}", index.__str__());
+            }
+        }
+
+        result
+    }
+
+    fn format_repr(&self) -> String {
+        let mut result = String::from("DbSchema(node_props={");
+
+        // Format node_props and rel_props, written in place instead of
+        // joining a string per property
+        let write_props = |result: &mut String, props: &HashMap<String, Vec<DbSchemaProperty>>| {
+            for (i, (name, properties)) in props.iter().enumerate() {
+                if i > 0 {
+                    result.push_str(", ");
+                }
+                let _ = write!(result, "'{}': ", name);
+                for (j, prop) in properties.iter().enumerate() {
+                    if j > 0 {
+                        result.push_str(", ");
+                    }
+                    prop.write_repr(result);
+                }
+            }
+        };
+        write_props(&mut result, &self.node_props);
+        result.push_str("}, rel_props={");
+        write_props(&mut result, &self.rel_props);
+        result.push_str("}, relationships=[");
+
+        // Format relationships
+        for (i, rel) in self.relationships.iter().enumerate() {
+            if i > 0 {
+                result.push_str(", ");
+            }
+            result.push_str(&rel.__repr__());
+        }
+        result.push_str("], metadata=");
+
+        // Format metadata
+        self.metadata.write_repr(&mut result);
+        result.push(')');
+
+        result
+    }
 }
 
 #[pymethods]
@@ -1264,15 +1598,13 @@ impl DbSchema {
         rel_props: Option<std::collections::HashMap<String, Vec<DbSchemaProperty>>>,
         relationships: Option<Vec<DbSchemaRelationshipPattern>>,
         metadata: Option<DbSchemaMetadata>,
-    ) -> Self {
-        let inner = CoreDbSchema::new();
-        Self {
-            node_props: node_props.unwrap_or_default(),
-            rel_props: rel_props.unwrap_or_default(),
-            relationships: relationships.unwrap_or_default(),
-            metadata: metadata.unwrap_or_else(|| DbSchemaMetadata::new(None, None)),
-            inner,
-        }
+    ) -> PyResult<Self> {
+        Self::from_parts(
+            node_props.unwrap_or_default(),
+            rel_props.unwrap_or_default(),
+            relationships.unwrap_or_default(),
+            metadata,
+        )
     }
 
     fn has_label(&self, label: &str) -> bool {
@@ -1289,11 +1621,18 @@ impl DbSchema {
         _cls: &Bound<'_, pyo3::types::PyType>,
         dict: &Bound<'_, pyo3::types::PyDict>,
     ) -> PyResult<Self> {
+        let py = dict.py();
+        // The core schema and the wrapper fields are filled in the same pass
+        // over the dictionary, without going through a JSON string
         let mut core_schema = CoreDbSchema::new();
+        let mut node_props = std::collections::HashMap::new();
+        let mut rel_props = std::collections::HashMap::new();
+        let mut relationships = Vec::new();
 
         // Parse node_props (Neo4j GraphRAG standard format)
-        if let Some(node_props_item) = dict.get_item("node_props")? {
+        if let Some(node_props_item) = dict.get_item(intern!(py, "node_props"))? {
             let node_props_dict = node_props_item.downcast::<pyo3::types::PyDict>()?;
+            node_props.reserve(node_props_dict.len());
             for (label, props_item) in node_props_dict.iter() {
                 let label = label.extract::<String>()?;
 
@@ -1302,91 +1641,56 @@ impl DbSchema {
                     .map_err(|e| PyErr::new::<pyo3::exceptions::PyValueError, _>(e.to_string()))?;
 
                 let props_list = props_item.downcast::<pyo3::types::PyList>()?;
-                for prop_item in props_list.iter() {
-                    let prop_dict = prop_item.downcast::<pyo3::types::PyDict>()?;
-                    let prop = DbSchemaProperty::py_from_dict(_cls, prop_dict)?;
+                let properties = DbSchemaProperty::from_dicts(_cls, props_list)?;
+                for prop in &properties {
                     core_schema
                         .add_node_property(&label, &prop.inner)
                         .map_err(|e| {
                             PyErr::new::<pyo3::exceptions::PyValueError, _>(e.to_string())
                         })?;
                 }
+                node_props.insert(label, properties);
             }
         }
 
         // Parse rel_props (if present)
-        if let Some(rel_props_item) = dict.get_item("rel_props")? {
+        if let Some(rel_props_item) = dict.get_item(intern!(py, "rel_props"))? {
             let rel_props_dict = rel_props_item.downcast::<pyo3::types::PyDict>()?;
+            rel_props.reserve(rel_props_dict.len());
             for (rel_type, properties) in rel_props_dict.iter() {
                 let rel_type_str = rel_type.extract::<String>()?;
                 let properties_list = properties.downcast::<pyo3::types::PyList>()?;
-                for prop_item in properties_list.iter() {
-                    let prop_dict = prop_item.downcast::<pyo3::types::PyDict>()?;
-                    let prop = DbSchemaProperty::py_from_dict(_cls, prop_dict)?;
+                let properties = DbSchemaProperty::from_dicts(_cls, properties_list)?;
+                for prop in &properties {
                     core_schema
                         .add_relationship_property(&rel_type_str, &prop.inner)
                         .map_err(|e| {
                             PyErr::new::<pyo3::exceptions::PyValueError, _>(e.to_string())
                         })?;
                 }
+                // The core schema only keeps relationship types that have properties
+                if !properties.is_empty() {
+                    rel_props.insert(rel_type_str, properties);
+                }
             }
         }
 
         // Parse relationships (if present)
-        if let Some(relationships_item) = dict.get_item("relationships")? {
+        if let Some(relationships_item) = dict.get_item(intern!(py, "relationships"))? {
             let relationships_list = relationships_item.downcast::<pyo3::types::PyList>()?;
+            relationships.reserve(relationships_list.len());
             for rel_item in relationships_list.iter() {
                 let rel_dict = rel_item.downcast::<pyo3::types::PyDict>()?;
                 let rel = DbSchemaRelationshipPattern::py_from_dict(_cls, rel_dict)?;
                 core_schema
-                    .add_relationship_pattern(rel.inner)
+                    .add_relationship_pattern(rel.inner.clone())
                     .map_err(|e| PyErr::new::<pyo3::exceptions::PyValueError, _>(e.to_string()))?;
+                relationships.push(rel);
             }
         }
 
-        // Convert core schema to wrapper
-        let node_props = core_schema
-            .node_props
-            .iter()
-            .map(|(label, core_properties)| {
-                let properties = core_properties
-                    .iter()
-                    .map(|core_prop| DbSchemaProperty {
-                        inner: core_prop.clone(),
-                    })
-                    .collect();
-                (label.clone(), properties)
-            })
-            .collect();
-
-        let relationships = core_schema
-            .relationships
-            .iter()
-            .map(|core_rel| DbSchemaRelationshipPattern {
-                start: core_rel.start.clone(),
-                end: core_rel.end.clone(),
-                rel_type: core_rel.rel_type.clone(),
-                inner: core_rel.clone(),
-            })
-            .collect();
-
-        // Parse rel_props
-        let rel_props = core_schema
-            .rel_props
-            .iter()
-            .map(|(rel_type, core_properties)| {
-                let properties = core_properties
-                    .iter()
-                    .map(|core_prop| DbSchemaProperty {
-                        inner: core_prop.clone(),
-                    })
-                    .collect();
-                (rel_type.clone(), properties)
-            })
-            .collect();
-
         // Parse metadata from the input dictionary
-        let metadata = if let Some(metadata_item) = dict.get_item("metadata")? {
+        let metadata = if let Some(metadata_item) = dict.get_item(intern!(py, "metadata"))? {
             let metadata_dict = metadata_item.downcast::<pyo3::types::PyDict>()?;
             DbSchemaMetadata::py_from_dict(_cls, metadata_dict)?
         } else {
@@ -1398,10 +1702,64 @@ impl DbSchema {
             rel_props,
             relationships,
             metadata,
-            inner: core_schema,
+            inner: Arc::new(core_schema),
+            str_cache: OnceLock::new(),
+            repr_cache: OnceLock::new(),
         })
     }
 
+    /// Create a DbSchema from parallel lists instead of dictionaries.
+    ///
+    /// Args:
+    ///     labels (List[str]): Node labels
+    ///     props_per_label (List[List[DbSchemaProperty]]): Properties of each label, in the same order
+    ///     rel_types (Optional[List[str]]): Relationship types that have properties
+    ///     props_per_rel_type (Optional[List[List[DbSchemaProperty]]]): Properties of each relationship type
+    ///     relationships (Optional[List[DbSchemaRelationshipPattern]]): Relationship patterns
+    ///     metadata (Optional[DbSchemaMetadata]): Constraints and indexes
+    ///
+    /// Returns:
+    ///     DbSchema: The schema, equivalent to passing the same data to from_dict
+    #[classmethod]
+    #[pyo3(signature = (labels, props_per_label, rel_types=None, props_per_rel_type=None, relationships=None, metadata=None))]
+    fn from_soa(
+        _cls: &Bound<'_, pyo3::types::PyType>,
+        labels: Vec<String>,
+        props_per_label: Vec<Vec<DbSchemaProperty>>,
+        rel_types: Option<Vec<String>>,
+        props_per_rel_type: Option<Vec<Vec<DbSchemaProperty>>>,
+        relationships: Option<Vec<DbSchemaRelationshipPattern>>,
+        metadata: Option<DbSchemaMetadata>,
+    ) -> PyResult<Self> {
+        let rel_types = rel_types.unwrap_or_default();
+        let props_per_rel_type = props_per_rel_type.unwrap_or_default();
+        if labels.len() != props_per_label.len() || rel_types.len() != props_per_rel_type.len() {
+            return Err(PyErr::new::<pyo3::exceptions::PyValueError, _>(
+                "Each label and relationship type needs exactly one property list",
+            ));
+        }
+
+        let label_count = labels.len();
+        let node_props: HashMap<_, _> = labels.into_iter().zip(props_per_label).collect();
+        if node_props.len() != label_count {
+            return Err(PyErr::new::<pyo3::exceptions::PyValueError, _>(
+                "Duplicate label in labels",
+            ));
+        }
+        // Like from_dict, only keep relationship types that have properties
+        let rel_props = rel_types
+            .into_iter()
+            .zip(props_per_rel_type)
+            .filter(|(_, properties)| !properties.is_empty())
+            .collect();
+        Self::from_parts(
+            node_props,
+            rel_props,
+            relationships.unwrap_or_default(),
+            metadata,
+        )
+    }
+
     #[pyo3(name = "to_dict")]
     fn py_to_dict(&self, py: Python) -> PyResult<PyObject> {
         let dict = pyo3::types::PyDict::new(py);
@@ -1409,126 +1767,281 @@ impl DbSchema {
         // Convert node_props to dict
         let node_props_dict = pyo3::types::PyDict::new(py);
         for (label, properties) in &self.node_props {
-            let props_list = pyo3::types::PyList::empty(py);
-            for prop in properties {
-                props_list.append(prop.py_to_dict(py)?)?;
-            }
+            let props_list = properties
+                .iter()
+                .map(|prop| prop.py_to_dict(py))
+                .collect::<PyResult<Vec<_>>>()?;
             node_props_dict.set_item(label, props_list)?;
         }
-        dict.set_item("node_props", node_props_dict)?;
+        dict.set_item(intern!(py, "node_props"), node_props_dict)?;
 
         // Convert rel_props to dict
         let rel_props_dict = pyo3::types::PyDict::new(py);
         for (rel_type, properties) in &self.rel_props {
-            let props_list = pyo3::types::PyList::empty(py);
-            for prop in properties {
-                props_list.append(prop.py_to_dict(py)?)?;
-            }
+            let props_list = properties
+                .iter()
+                .map(|prop| prop.py_to_dict(py))
+                .collect::<PyResult<Vec<_>>>()?;
             rel_props_dict.set_item(rel_type, props_list)?;
         }
-        dict.set_item("rel_props", rel_props_dict)?;
+        dict.set_item(intern!(py, "rel_props"), rel_props_dict)?;
 
         // Convert relationships to dict
-        let rels_list = pyo3::types::PyList::empty(py);
-        for rel in &self.relationships {
-            rels_list.append(rel.py_to_dict(py)?)?;
-        }
-        dict.set_item("relationships", rels_list)?;
+        let rels_list = self
+            .relationships
+            .iter()
+            .map(|rel| rel.py_to_dict(py))
+            .collect::<PyResult<Vec<_>>>()?;
+        dict.set_item(intern!(py, "relationships"), rels_list)?;
 
         // Convert metadata to dict
-        dict.set_item("metadata", self.metadata.py_to_dict(py)?)?;
+        dict.set_item(intern!(py, "metadata"), self.metadata.py_to_dict(py)?)?;
 
         Ok(dict.into())
     }
 
-    fn __str__(&self) -> String {
-        let mut result = String::new();
+    /// Pickle support: a schema is rebuilt with `DbSchema.from_dict(schema.to_dict())`,
+    /// which also covers `copy.copy` and `copy.deepcopy`
+    fn __reduce__<'py>(&self, py: Python<'py>) -> PyResult<(Bound<'py, PyAny>, (PyObject,))> {
+        let from_dict = py.get_type::<Self>().getattr(intern!(py, "from_dict"))?;
+        Ok((from_dict, (self.py_to_dict(py)?,)))
+    }
 
-        // Nodes section
-        result.push_str("Nodes:\n");
-        for (label, properties) in &self.node_props {
-            result.push_str(&format!("{}:\n", label));
-            for prop in properties {
-                result.push_str(&format!("{}\n", prop.__str__()));
-            }
-        }
+    fn __str__(&self, py: Python) -> String {
+        cached_format(py, &self.str_cache, || self.format_str())
+    }
 
-        // Relationship Properties section
-        if !self.rel_props.is_empty() {
-            result.push_str("Relationship Properties:\n");
-            for (rel_type, properties) in &self.rel_props {
-                result.push_str(&format!("{}:\n", rel_type));
-                for prop in properties {
-                    result.push_str(&format!("{}\n", prop.__str__()));
-                }
-            }
-        }
+    fn __repr__(&self, py: Python) -> String {
+        cached_format(py, &self.repr_cache, || self.format_repr())
+    }
+}
 
-        // Relationships section
-        if !self.relationships.is_empty() {
-            result.push_str("Relationships:\n");
-            for rel in &self.relationships {
-                result.push_str(&format!("{}\n", rel.__str__()));
-            }
-        }
+/// A validation error found in a query, as returned by get_validation_errors.
+/// The message is only formatted when it is requested.
+#[pyclass(module = "cypher_guard")]
+#[derive(Debug, Clone)]
+pub struct ValidationError {
+    inner: CypherGuardValidationError,
+}
 
-        // Constraints section
-        if !self.metadata.constraint.is_empty() {
-            result.push_str("Constraints:\n");
-            for constraint in &self.metadata.constraint {
-                result.push_str(&format!("{}\n", constraint.__str__()));
-            }
-        }
+#[pymethods]
+impl ValidationError {
+    /// Kind of error, named like the exception raised for it (e.g. "InvalidNodeLabel")
+    #[getter]
+    fn code(&self) -> &'static str {
+        self.inner.code()
+    }
 
-        // Indexes section
-        if !self.metadata.index.is_empty() {
-            result.push_str("Indexes:\n");
-            for index in &self.metadata.index {
-                result.push_str(&format!("{}\n", index.__str__()));
-            }
-        }
+    /// Error message, the same text validate_cypher returns
+    #[getter]
+    fn message(&self) -> String {
+        self.inner.to_string()
+    }
 
-        result
+    fn __str__(&self) -> String {
+        self.inner.to_string()
     }
 
     fn __repr__(&self) -> String {
-        let mut result = String::from("DbSchema(node_props={");
+        format!(
+            "ValidationError(code='{}', message='{}')",
+            self.inner.code(),
+            self.inner
+        )
+    }
+}
 
-        // Format node_props
-        let node_props_strs: Vec<String> = self
-            .node_props
-            .iter()
-            .map(|(label, props)| {
-                let props_repr: Vec<String> = props.iter().map(|p| p.__repr__()).collect();
-                format!("'{}': {}", label, props_repr.join(", "))
-            })
-            .collect();
-        result.push_str(&node_props_strs.join(", "));
-        result.push_str("}, rel_props={");
+/// A parsed Cypher query, as returned by parse_query.
+/// It can be validated against any number of schemas without parsing it again.
+#[pyclass(module = "cypher_guard")]
+#[derive(Debug, Clone)]
+pub struct ParsedQuery {
+    /// The query text that was parsed
+    #[pyo3(get)]
+    query: String,
+    ast: Arc<CoreQuery>,
+}
 
-        // Format rel_props
-        let rel_props_strs: Vec<String> = self
-            .rel_props
-            .iter()
-            .map(|(rel_type, props)| {
-                let props_repr: Vec<String> = props.iter().map(|p| p.__repr__()).collect();
-                format!("'{}': {}", rel_type, props_repr.join(", "))
-            })
-            .collect();
-        result.push_str(&rel_props_strs.join(", "));
-        result.push_str("}, relationships=[");
+#[pymethods]
+impl ParsedQuery {
+    /// Whether the query contains write operations, like is_write
+    #[getter]
+    fn is_write(&self) -> bool {
+        query_is_write(&self.query, &self.ast)
+    }
 
-        // Format relationships
-        let rels_repr: Vec<String> = self.relationships.iter().map(|r| r.__repr__()).collect();
-        result.push_str(&rels_repr.join(", "));
-        result.push_str("], metadata=");
+    fn __repr__(&self) -> String {
+        format!("ParsedQuery(query={:?})", self.query)
+    }
+}
 
-        // Format metadata
-        result.push_str(&self.metadata.__repr__());
-        result.push(')');
+// === Schema Resolution ===
 
-        result
+/// Maximum number of parsed JSON schema strings kept for reuse
+const SCHEMA_CACHE_SIZE: usize = 16;
+
+/// Core schemas parsed from JSON schema strings, keyed by the JSON string
+static SCHEMA_CACHE: LazyLock<Mutex<HashMap<String, Arc<CoreDbSchema>>>> =
+    LazyLock::new(|| Mutex::new(HashMap::new()));
+
+/// Resolve the `schema` argument of the API functions to a core schema.
+///
+/// DbSchema objects share their core schema without copying it. JSON strings are
+/// parsed on first use and later calls with the same string reuse the parsed schema.
+fn resolve_schema(py: Python, schema: &Bound<'_, PyAny>) -> PyResult<Arc<CoreDbSchema>> {
+    if let Ok(schema) = schema.downcast::<DbSchema>() {
+        return Ok(Arc::clone(&schema.borrow().inner));
+    }
+
+    let json = schema.extract::<&str>().map_err(|_| {
+        PyErr::new::<pyo3::exceptions::PyTypeError, _>(
+            "schema must be a DbSchema object or a JSON schema string",
+        )
+    })?;
+
+    let mut cache = SCHEMA_CACHE.lock().unwrap_or_else(|e| e.into_inner());
+    if let Some(core_schema) = cache.get(json) {
+        return Ok(Arc::clone(core_schema));
+    }
+
+    let core_schema =
+        Arc::new(CoreDbSchema::from_json_string(json).map_err(|e| convert_cypher_error(py, e))?);
+    if cache.len() >= SCHEMA_CACHE_SIZE {
+        cache.clear();
+    }
+    cache.insert(json.to_string(), Arc::clone(&core_schema));
+    Ok(core_schema)
+}
+
+// === Validation Cache ===
+
+/// Maximum number of validation results kept for reuse
+const VALIDATION_CACHE_SIZE: usize = 1024;
+
+/// Validation errors of a query, shared between the cache and its callers
+type ValidationErrors = Arc<Vec<CypherGuardValidationError>>;
+
+/// A cached validation result. The entry holds a weak reference to its schema:
+/// that keeps the allocation, so the schema address in its key cannot be reused
+/// while the entry exists, but not the schema itself, which is freed once the
+/// last DbSchema or JSON cache entry using it is gone.
+struct CachedValidation {
+    query: String,
+    schema: Weak<CoreDbSchema>,
+    errors: ValidationErrors,
+}
+
+/// Validation results by schema address and query hash. The hash is the one
+/// Python computes for the query string, which str objects cache, so repeated
+/// calls with the same string object do not hash the query text again.
+type ValidationCache = HashMap<(usize, isize), CachedValidation>;
+
+static VALIDATION_CACHE: LazyLock<Mutex<ValidationCache>> =
+    LazyLock::new(|| Mutex::new(HashMap::new()));
+
+/// Get the query text and its Python hash, the key of the validation cache
+fn query_key<'a>(query: &'a Bound<'_, PyString>) -> PyResult<(&'a str, isize)> {
+    Ok((query.to_str()?, query.hash()?))
+}
+
+/// Look up the cached validation errors of a query
+fn lookup_validation_errors(
+    query: &str,
+    query_hash: isize,
+    schema: &Arc<CoreDbSchema>,
+) -> Option<ValidationErrors> {
+    let cache = VALIDATION_CACHE.lock().unwrap_or_else(|e| e.into_inner());
+    let entry = cache.get(&(Arc::as_ptr(schema) as usize, query_hash))?;
+    // Different queries can share a hash, so the text has to match as well
+    (entry.query == query).then(|| Arc::clone(&entry.errors))
+}
+
+fn cache_validation_errors(
+    query: &str,
+    query_hash: isize,
+    schema: &Arc<CoreDbSchema>,
+    errors: ValidationErrors,
+) {
+    let mut cache = VALIDATION_CACHE.lock().unwrap_or_else(|e| e.into_inner());
+    if cache.len() >= VALIDATION_CACHE_SIZE {
+        // Results for schemas that no longer exist can never be looked up again
+        cache.retain(|_, entry| entry.schema.strong_count() > 0);
+        if cache.len() >= VALIDATION_CACHE_SIZE {
+            cache.clear();
+        }
+    }
+    cache.insert(
+        (Arc::as_ptr(schema) as usize, query_hash),
+        CachedValidation {
+            query: query.to_string(),
+            schema: Arc::downgrade(schema),
+            errors,
+        },
+    );
+}
+
+/// Get the validation errors of a query, reusing the result of an earlier call
+/// with the same query and schema. Queries that fail to parse are not cached.
+fn cached_validation_errors(
+    query: &str,
+    query_hash: isize,
+    schema: &Arc<CoreDbSchema>,
+) -> Result<ValidationErrors, CypherGuardParsingError> {
+    if let Some(errors) = lookup_validation_errors(query, query_hash, schema) {
+        return Ok(errors);
     }
+
+    let errors = Arc::new(collect_cypher_validation_errors(query, schema)?);
+    cache_validation_errors(query, query_hash, schema, Arc::clone(&errors));
+    Ok(errors)
+}
+
+/// Format validation errors as the messages returned by validate_cypher
+fn error_messages(errors: &[CypherGuardValidationError]) -> Vec<String> {
+    errors.iter().map(|e| e.to_string()).collect()
+}
+
+/// Check whether a query is valid, stopping at the first validation error.
+/// Only valid queries are cached, since the full error list of an invalid
+/// query is not computed.
+fn cached_is_valid(query: &str, query_hash: isize, schema: &Arc<CoreDbSchema>) -> bool {
+    if let Some(errors) = lookup_validation_errors(query, query_hash, schema) {
+        return errors.is_empty();
+    }
+
+    if has_cypher_validation_errors(query, schema) {
+        return false;
+    }
+    cache_validation_errors(query, query_hash, schema, Arc::new(Vec::new()));
+    true
+}
+
+/// Run `check` on each query on the available cores, preserving input order
+fn check_batch<T: Send>(
+    queries: &[(&str, isize)],
+    schema: &Arc<CoreDbSchema>,
+    check: fn(&str, isize, &Arc<CoreDbSchema>) -> T,
+) -> Vec<T> {
+    let threads = std::thread::available_parallelism().map_or(1, |n| n.get());
+    let chunk_size = queries.len().div_ceil(threads).max(1);
+
+    std::thread::scope(|scope| {
+        let workers: Vec<_> = queries
+            .chunks(chunk_size)
+            .map(|chunk| {
+                scope.spawn(move || {
+                    chunk
+                        .iter()
+                        .map(|&(query, query_hash)| check(query, query_hash, schema))
+                        .collect::<Vec<_>>()
+                })
+            })
+            .collect();
+        workers
+            .into_iter()
+            .flat_map(|worker| worker.join().expect("validation worker panicked"))
+            .collect()
+    })
 }
 
 // === CORE PYTHON API FUNCTIONS ===
@@ -1550,10 +2063,81 @@ impl DbSchema {
 ///     True
 ///     >>> has_valid_cypher("MATCH (p:InvalidLabel) RETURN p.name", schema_json)  
 ///     False
-pub fn has_valid_cypher(_py: Python, query: &str, schema: DbSchema) -> PyResult<bool> {
-    // Fast path - just check if there are any validation errors
-    let errors = get_cypher_validation_errors(query, &schema.inner);
-    Ok(errors.is_empty())
+pub fn has_valid_cypher(
+    py: Python,
+    query: &Bound<'_, PyString>,
+    schema: &Bound<'_, PyAny>,
+) -> PyResult<bool> {
+    let (query, query_hash) = query_key(query)?;
+    let schema = resolve_schema(py, schema)?;
+    // Fast path - stops at the first validation or parsing error
+    Ok(py.detach(|| cached_is_valid(query, query_hash, &schema)))
+}
+
+/// Batch version of has_valid_cypher.
+///
+/// The schema is resolved once and the queries are checked in parallel
+/// without holding the GIL.
+///
+/// Args:
+///     queries (List[str]): The Cypher query strings to check
+///     schema (str | DbSchema): Either a JSON schema string or a DbSchema object
+///
+/// Returns:
+///     List[bool]: Whether each query is valid, in input order
+///
+/// Examples:
+///     >>> has_valid_cypher_batch(["MATCH (p:Person) RETURN p", "MATCH (p:Invalid) RETURN p"], schema_json)
+///     [True, False]
+#[pyfunction]
+#[pyo3(text_signature = "(queries, schema, /)")]
+pub fn has_valid_cypher_batch(
+    py: Python,
+    queries: Vec<Bound<'_, PyString>>,
+    schema: &Bound<'_, PyAny>,
+) -> PyResult<Vec<bool>> {
+    let queries = queries
+        .iter()
+        .map(query_key)
+        .collect::<PyResult<Vec<_>>>()?;
+    let schema = resolve_schema(py, schema)?;
+    Ok(py.detach(|| check_batch(&queries, &schema, cached_is_valid)))
+}
+
+/// Parse a query without holding the GIL, raising syntax errors as the
+/// matching Python exception
+fn parse_for_python(py: Python, query: &str) -> PyResult<CoreQuery> {
+    py.detach(|| parse_query_rust(query))
+        .map_err(|e| convert_parsing_error(py, e))
+}
+
+/// Whether a parsed query contains write operations
+fn query_is_write(query: &str, ast: &CoreQuery) -> bool {
+    // Check AST for write operations
+    let has_ast_write_ops = !ast.create_clauses.is_empty()
+        || !ast.merge_clauses.is_empty()
+        || !ast.call_clauses.is_empty(); // CALL can contain write operations
+
+    // Check for SET operations in MERGE clauses
+    let has_set_ops = ast.merge_clauses.iter().any(|merge| {
+        merge
+            .on_create
+            .as_ref()
+            .is_some_and(|on_create| !on_create.set_clauses.is_empty())
+            || merge
+                .on_match
+                .as_ref()
+                .is_some_and(|on_match| !on_match.set_clauses.is_empty())
+    });
+
+    // For now, we need to fall back to string matching for DELETE/REMOVE
+    // since they're not implemented as separate clauses yet
+    let query_upper = query.to_uppercase();
+    let has_string_write_ops = query_upper.contains("DELETE")
+        || query_upper.contains("DETACH DELETE")
+        || query_upper.contains("REMOVE");
+
+    has_ast_write_ops || has_set_ops || has_string_write_ops
 }
 
 /// Check if a Cypher query has valid syntax.
@@ -1584,17 +2168,45 @@ pub fn has_valid_cypher(_py: Python, query: &str, schema: DbSchema) -> PyResult<
 pub fn check_syntax(py: Python, query: &str) -> PyResult<bool> {
     // Check if the query can be parsed (syntax check)
     // Schema is not needed for syntax checking - only for validation
-    match parse_query_rust(query) {
-        Ok(_) => {
-            // If parsing succeeds, syntax is valid
-            Ok(true)
-        }
-        Err(e) => {
-            // If parsing fails, syntax is invalid
-            // Convert parsing error to specific error type
-            Err(convert_parsing_error(py, e))
-        }
-    }
+    parse_for_python(py, query)?;
+    Ok(true)
+}
+
+/// Check the syntax of several Cypher queries in one call.
+///
+/// Unlike check_syntax, syntax errors are returned rather than raised, so
+/// one bad query does not hide the results of the others.
+///
+/// Args:
+///     queries (List[str]): The Cypher query strings to check
+///
+/// Returns:
+///     List[CypherParsingError | None]: None for each query with valid syntax, otherwise
+///     the error check_syntax would raise for it, in input order
+///
+/// Examples:
+///     >>> check_syntax_batch(["MATCH (n) RETURN n", "MATCH (n RETURN n"])
+///     [None, NomParsingError('Nom parsing error: ...')]
+#[pyfunction]
+#[pyo3(text_signature = "(queries, /)")]
+pub fn check_syntax_batch(
+    py: Python,
+    queries: Vec<Bound<'_, PyString>>,
+) -> PyResult<Vec<Option<Py<PyBaseException>>>> {
+    let queries = queries
+        .iter()
+        .map(|query| query.to_str())
+        .collect::<PyResult<Vec<_>>>()?;
+    let errors = py.detach(|| {
+        queries
+            .iter()
+            .map(|query| parse_query_rust(query).err())
+            .collect::<Vec<_>>()
+    });
+    Ok(errors
+        .into_iter()
+        .map(|error| error.map(|e| convert_parsing_error(py, e).into_value(py)))
+        .collect())
 }
 
 /// Validate a Cypher query against a schema and return validation errors.
@@ -1616,18 +2228,145 @@ pub fn check_syntax(py: Python, query: &str) -> PyResult<bool> {
 ///     []
 #[pyfunction]
 #[pyo3(text_signature = "(query, schema, /)")]
-pub fn validate_cypher(py: Python, query: &str, schema: DbSchema) -> PyResult<Vec<String>> {
-    // First check if the query can be parsed (syntax check)
-    match parse_query_rust(query) {
-        Ok(_) => {
-            // If parsing succeeds, get validation errors
-            Ok(get_cypher_validation_errors(query, &schema.inner))
-        }
-        Err(e) => {
-            // If parsing fails, raise syntax error
-            Err(convert_parsing_error(py, e))
-        }
-    }
+pub fn validate_cypher(
+    py: Python,
+    query: &Bound<'_, PyString>,
+    schema: &Bound<'_, PyAny>,
+) -> PyResult<Vec<String>> {
+    let (query, query_hash) = query_key(query)?;
+    let schema = resolve_schema(py, schema)?;
+    // Parsing errors (syntax errors) are raised, validation errors are returned
+    py.detach(|| {
+        cached_validation_errors(query, query_hash, &schema).map(|errors| error_messages(&errors))
+    })
+    .map_err(|e| convert_parsing_error(py, e))
+}
+
+/// Validate several Cypher queries against one schema.
+///
+/// The schema is resolved once and the queries are validated in parallel
+/// without holding the GIL.
+///
+/// Args:
+///     queries (List[str]): The Cypher query strings to validate
+///     schema (str | DbSchema): Either a JSON schema string or a DbSchema object
+///
+/// Returns:
+///     List[List[str]]: The validation error messages of each query, in input order
+///
+/// Raises:
+///     Various parsing errors: For the first query (in input order) with a syntax error
+///
+/// Examples:
+///     >>> validate_cypher_batch(["MATCH (n:Person) RETURN n", "MATCH (n:Invalid) RETURN n"], schema_json)
+///     [[], ['Invalid node label: Invalid']]
+#[pyfunction]
+#[pyo3(text_signature = "(queries, schema, /)")]
+pub fn validate_cypher_batch(
+    py: Python,
+    queries: Vec<Bound<'_, PyString>>,
+    schema: &Bound<'_, PyAny>,
+) -> PyResult<Vec<Vec<String>>> {
+    let queries = queries
+        .iter()
+        .map(query_key)
+        .collect::<PyResult<Vec<_>>>()?;
+    let schema = resolve_schema(py, schema)?;
+    py.detach(|| check_batch(&queries, &schema, cached_validation_errors))
+        .into_iter()
+        .map(|result| {
+            result
+                .map(|errors| error_messages(&errors))
+                .map_err(|e| convert_parsing_error(py, e))
+        })
+        .collect()
+}
+
+/// Validate a Cypher query against a schema and return structured validation errors.
+///
+/// Like validate_cypher, but each error is a ValidationError with a `code` naming
+/// the kind of error. Messages are only formatted when `message` or `str()` is used.
+///
+/// Args:
+///     query (str): The Cypher query string to validate
+///     schema (str | DbSchema): Either a JSON schema string or a DbSchema object
+///
+/// Returns:
+///     List[ValidationError]: The validation errors. Empty list if query is valid.
+///
+/// Raises:
+///     Various parsing errors: If there's a syntax error
+///
+/// Examples:
+///     >>> [e.code for e in get_validation_errors("MATCH (n:InvalidLabel) RETURN n", schema_json)]
+///     ['InvalidNodeLabel']
+#[pyfunction]
+#[pyo3(text_signature = "(query, schema, /)")]
+pub fn get_validation_errors(
+    py: Python,
+    query: &Bound<'_, PyString>,
+    schema: &Bound<'_, PyAny>,
+) -> PyResult<Vec<ValidationError>> {
+    let (query, query_hash) = query_key(query)?;
+    let schema = resolve_schema(py, schema)?;
+    let errors = py
+        .detach(|| cached_validation_errors(query, query_hash, &schema))
+        .map_err(|e| convert_parsing_error(py, e))?;
+    Ok(errors
+        .iter()
+        .map(|error| ValidationError {
+            inner: error.clone(),
+        })
+        .collect())
+}
+
+/// Parse a Cypher query once, for validation with validate_parsed.
+///
+/// Args:
+///     query (str): The Cypher query string to parse
+///
+/// Returns:
+///     ParsedQuery: The parsed query
+///
+/// Raises:
+///     Various parsing errors: If there's a syntax error
+///
+/// Examples:
+///     >>> parsed = parse_query("MATCH (n:Person) RETURN n")
+///     >>> validate_parsed(parsed, schema_json)
+///     []
+#[pyfunction]
+#[pyo3(text_signature = "(query, /)")]
+pub fn parse_query(py: Python, query: &str) -> PyResult<ParsedQuery> {
+    let ast = parse_for_python(py, query)?;
+    Ok(ParsedQuery {
+        query: query.to_string(),
+        ast: Arc::new(ast),
+    })
+}
+
+/// Validate a query returned by parse_query against a schema.
+///
+/// Args:
+///     parsed (ParsedQuery): The parsed query to validate
+///     schema (str | DbSchema): Either a JSON schema string or a DbSchema object
+///
+/// Returns:
+///     List[str]: List of validation error messages, the same as validate_cypher returns
+///
+/// Examples:
+///     >>> validate_parsed(parse_query("MATCH (n:InvalidLabel) RETURN n"), schema_json)
+///     ['Invalid node label: InvalidLabel']
+#[pyfunction]
+#[pyo3(text_signature = "(parsed, schema, /)")]
+pub fn validate_parsed(
+    py: Python,
+    parsed: &ParsedQuery,
+    schema: &Bound<'_, PyAny>,
+) -> PyResult<Vec<String>> {
+    let schema = resolve_schema(py, schema)?;
+    let ast = Arc::clone(&parsed.ast);
+    Ok(py.detach(|| error_messages(&validate_parsed_query(&ast, &schema))))
 }
 
 /// Check if a Cypher query contains write operations (CREATE, MERGE, DELETE, SET, REMOVE).
@@ -1651,40 +2390,9 @@ pub fn validate_cypher(py: Python, query: &str, schema: DbSchema) -> PyResult<Ve
 #[pyfunction]
 #[pyo3(text_signature = "(query, /)")]
 pub fn is_write(py: Python, query: &str) -> PyResult<bool> {
-    // First check if the query can be parsed (syntax check)
-    match parse_query_rust(query) {
-        Ok(ast) => {
-            // Check AST for write operations
-            let has_ast_write_ops = !ast.create_clauses.is_empty()
-                || !ast.merge_clauses.is_empty()
-                || !ast.call_clauses.is_empty(); // CALL can contain write operations
-
-            // Check for SET operations in MERGE clauses
-            let has_set_ops = ast.merge_clauses.iter().any(|merge| {
-                merge
-                    .on_create
-                    .as_ref()
-                    .is_some_and(|on_create| !on_create.set_clauses.is_empty())
-                    || merge
-                        .on_match
-                        .as_ref()
-                        .is_some_and(|on_match| !on_match.set_clauses.is_empty())
-            });
-
-            // For now, we need to fall back to string matching for DELETE/REMOVE
-            // since they're not implemented as separate clauses yet
-            let query_upper = query.to_uppercase();
-            let has_string_write_ops = query_upper.contains("DELETE")
-                || query_upper.contains("DETACH DELETE")
-                || query_upper.contains("REMOVE");
-
-            Ok(has_ast_write_ops || has_set_ops || has_string_write_ops)
-        }
-        Err(e) => {
-            // If parsing fails, raise syntax error
-            Err(convert_parsing_error(py, e))
-        }
-    }
+    // First check if the query can be parsed (syntax check), raising syntax errors
+    let ast = parse_for_python(py, query)?;
+    Ok(query_is_write(query, &ast))
 }
 
 /// Check if a Cypher query has any parsing errors (syntax errors).
@@ -1704,9 +2412,49 @@ pub fn is_write(py: Python, query: &str) -> PyResult<bool> {
 ///     True
 #[pyfunction]
 #[pyo3(text_signature = "(query, /)")]
-pub fn has_parser_errors(query: &str) -> bool {
+pub fn has_parser_errors(py: Python, query: &str) -> bool {
     // Simply check if parsing fails
-    parse_query_rust(query).is_err()
+    py.detach(|| has_cypher_parsing_errors(query))
+}
+
+/// Clear the cached validation results.
+///
+/// Results of validate_cypher and has_valid_cypher are cached per query and
+/// schema, up to 1024 results in total. Schemas cannot change once created, so
+/// this is only needed to free the memory held by the cache. The cache does not
+/// keep schemas alive: once a schema is no longer used, only its cached results
+/// remain, and they are dropped first when the cache is full.
+///
+/// Examples:
+///     >>> clear_validation_cache()
+#[pyfunction]
+#[pyo3(text_signature = "()")]
+pub fn clear_validation_cache() {
+    VALIDATION_CACHE
+        .lock()
+        .unwrap_or_else(|e| e.into_inner())
+        .clear();
+}
+
+/// Pay the one-off initialization cost up front.
+///
+/// Creates the schema and validation caches and runs the parser and validator
+/// once on a small query, so the first real validation call is not slower than
+/// the ones after it. Nothing is added to the caches.
+///
+/// Examples:
+///     >>> _warmup()
+#[pyfunction]
+#[pyo3(name = "_warmup", text_signature = "()")]
+pub fn warmup(py: Python) {
+    LazyLock::force(&SCHEMA_CACHE);
+    LazyLock::force(&VALIDATION_CACHE);
+    py.detach(|| {
+        let _ = collect_cypher_validation_errors(
+            "MATCH (a:Label)-[r:TYPE]->(b) WHERE a.name = 'x' RETURN a.name, r, b",
+            &CoreDbSchema::new(),
+        );
+    });
 }
 
 #[pymodule]
@@ -1732,13 +2480,23 @@ fn cypher_guard(py: Python, m: &Bound<'_, PyModule>) -> PyResult<()> {
     m.add_class::<DbSchemaConstraint>()?;
     m.add_class::<DbSchemaIndex>()?;
     m.add_class::<DbSchemaMetadata>()?;
+    m.add_class::<ValidationError>()?;
+    m.add_class::<ParsedQuery>()?;
     m.add_function(wrap_pyfunction!(has_valid_cypher, m)?)?;
+    m.add_function(wrap_pyfunction!(has_valid_cypher_batch, m)?)?;
 
     // Core API functions
     m.add_function(wrap_pyfunction!(check_syntax, m)?)?;
+    m.add_function(wrap_pyfunction!(check_syntax_batch, m)?)?;
     m.add_function(wrap_pyfunction!(validate_cypher, m)?)?;
+    m.add_function(wrap_pyfunction!(validate_cypher_batch, m)?)?;
+    m.add_function(wrap_pyfunction!(get_validation_errors, m)?)?;
+    m.add_function(wrap_pyfunction!(parse_query, m)?)?;
+    m.add_function(wrap_pyfunction!(validate_parsed, m)?)?;
     m.add_function(wrap_pyfunction!(is_write, m)?)?;
     m.add_function(wrap_pyfunction!(has_parser_errors, m)?)?;
+    m.add_function(wrap_pyfunction!(clear_validation_cache, m)?)?;
+    m.add_function(wrap_pyfunction!(warmup, m)?)?;
 
     // Expose error classes using the simpler approach from PyO3 docs
     m.add(
@@ -4,56 +4,11 @@ import sys
 import os
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
 
-from cypher_guard import validate_cypher, get_validation_errors
+from cypher_guard import validate_cypher
+from schema_data import schema_json_string
 
-# Schema from the test
-schema_json = '''
-    {
-        "node_props": {
-        "Person": [
-            {"name": "name", "neo4j_type": "STRING"},
-            {"name": "age", "neo4j_type": "INTEGER"},
-            {"name": "created", "neo4j_type": "BOOLEAN"}
-        ],
-        "Movie": [
-            {"name": "title", "neo4j_type": "STRING"},
-            {"name": "year", "neo4j_type": "INTEGER"}
-        ],
-        "Station": [
-            {"name": "name", "neo4j_type": "STRING"},
-            {"name": "location", "neo4j_type": "POINT"}
-        ],
-        "Stop": [
-            {"name": "departs", "neo4j_type": "STRING"},
-            {"name": "arrives", "neo4j_type": "STRING"}
-        ]
-    },
-    "rel_props": {
-        "KNOWS": [
-            {"name": "since", "neo4j_type": "DATE_TIME"}
-        ],
-        "ACTED_IN": [
-            {"name": "role", "neo4j_type": "STRING"}
-        ],
-        "CALLS_AT": [],
-        "NEXT": [],
-        "LINK": [
-            {"name": "distance", "neo4j_type": "FLOAT"}
-        ]
-    },
-    "relationships": [
-        {"start": "Person", "end": "Person", "rel_type": "KNOWS"},
-        {"start": "Person", "end": "Movie", "rel_type": "ACTED_IN"},
-        {"start": "Stop", "end": "Station", "rel_type": "CALLS_AT"},
-        {"start": "Stop", "end": "Stop", "rel_type": "NEXT"},
-        {"start": "Station", "end": "Station", "rel_type": "LINK"}
-    ],
-    "metadata": {
-        "index": [],
-        "constraint": []
-    }
-}
-'''
+# Schema shared with the unit tests
+schema_json = schema_json_string()
 
 def test_validation():
     print("Testing validation logic...")
@@ -0,0 +1,67 @@
+"""Schema shared by the unit tests and the debug scripts next to them.
+
+Kept out of conftest.py so scripts can import it without pytest.
+"""
+
+import json
+from functools import lru_cache
+
+try:
+    import orjson
+except ImportError:  # orjson is optional, the stdlib json works the same here
+    orjson = None
+
+# Shared test schema, defined once as a Python literal
+_SCHEMA_DICT = {
+    "node_props": {
+        "Person": [
+            {"name": "name", "neo4j_type": "STRING"},
+            {"name": "age", "neo4j_type": "INTEGER"},
+            {"name": "created", "neo4j_type": "BOOLEAN"}
+        ],
+        "Movie": [
+            {"name": "title", "neo4j_type": "STRING"},
+            {"name": "year", "neo4j_type": "INTEGER"}
+        ],
+        "Station": [
+            {"name": "name", "neo4j_type": "STRING"},
+            {"name": "location", "neo4j_type": "POINT"}
+        ],
+        "Stop": [
+            {"name": "departs", "neo4j_type": "STRING"},
+            {"name": "arrives", "neo4j_type": "STRING"}
+        ]
+    },
+    "rel_props": {
+        "KNOWS": [
+            {"name": "since", "neo4j_type": "DATE_TIME"}
+        ],
+        "ACTED_IN": [
+            {"name": "role", "neo4j_type": "STRING"}
+        ],
+        "CALLS_AT": [],
+        "NEXT": [],
+        "LINK": [
+            {"name": "distance", "neo4j_type": "FLOAT"}
+        ]
+    },
+    "relationships": [
+        {"start": "Person", "end": "Person", "rel_type": "KNOWS"},
+        {"start": "Person", "end": "Movie", "rel_type": "ACTED_IN"},
+        {"start": "Stop", "end": "Station", "rel_type": "CALLS_AT"},
+        {"start": "Stop", "end": "Stop", "rel_type": "NEXT"},
+        {"start": "Station", "end": "Station", "rel_type": "LINK"}
+    ],
+    "metadata": {
+        "index": [],
+        "constraint": []
+    }
+}
+
+
+@lru_cache(maxsize=None)
+def schema_json_string():
+    """JSON form of the shared schema, serialized on first use"""
+    if orjson is not None:
+        return orjson.dumps(_SCHEMA_DICT).decode()
+    return json.dumps(_SCHEMA_DICT)
@@ -3,7 +3,7 @@ import cypher_guard
 from cypher_guard import DbSchema
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def simple_schema():
     """Simple schema fixture for error handling tests"""
     return DbSchema.from_dict({
@@ -5,8 +5,11 @@ This module tests that parser error types are properly raised
 when different kinds of syntax errors are encountered.
 """
 
+import re
+
 import pytest
 import cypher_guard
+# Every parser error class is imported, so a missing export fails at collection
 from cypher_guard import (
     # Core parsing errors
     NomParsingError,
@@ -45,198 +48,136 @@ from cypher_guard import (
 )
 
 
+# Queries that raise NomParsingError
+NOM_CASES = (
+    "MATCH (n RETURN n",  # Basic syntax error
+    "MATCH (n:Person",  # Incomplete query
+    "MATCH (n:Person) INVALID",  # Invalid keyword
+    "MATCH (n:Person) WHERE",  # Incomplete WHERE
+    "MATCH (n:Person) RETURN n RETURN n",  # Multiple RETURN
+    "MATCH (n:Person) ORDER BY n.name RETURN n",  # ORDER BY before RETURN
+    "MATCH (n:Person) RETURN n DELETE n",  # DELETE after RETURN
+    "MATCH (n:Person) RETURN n SET n.age = 30",  # SET after RETURN
+)
+
+# Queries that raise specific error types
+SPECIFIC_CASES = (
+    ("RETURN n MATCH (n:Person)", ReturnBeforeOtherClauses),
+    ("WHERE n.age > 30 MATCH (n:Person) RETURN n", WhereBeforeMatch),
+    ("MATCH (n:Person) RETURN n MATCH (m:Person)", MatchAfterReturn),
+    ("MATCH (n:Person) RETURN n WITH n", WithAfterReturn),
+    ("MATCH (n:Person) RETURN n UNWIND [1,2,3] AS x", UnwindAfterReturn),
+    ("MATCH (n:Person) RETURN n WHERE n.age > 30", InvalidClauseOrder),
+)
+
+# Queries that parse successfully, some surprisingly
+VALID_CASES = (
+    "MATCH (n:Person) RETURN n CREATE (m:Person)",  # CREATE after RETURN is valid Cypher
+    "MATCH (n:Person) RETURN n MERGE (m:Person)",  # MERGE after RETURN is valid Cypher
+    "MATCH (n:Person) RETURN undefined_var",  # Undefined variables are a validation issue, not a parsing issue
+)
+
+# Queries with a syntax error, paired with the error they raise
+ERROR_CASES = tuple((query, NomParsingError) for query in NOM_CASES) + SPECIFIC_CASES
+
+# Expected shapes of the error messages
+NOM_MESSAGE_RE = re.compile(r"Nom parsing error.*error (?:Verify|Tag)", re.S)
+RETURN_BEFORE_MESSAGE_RE = re.compile(r"RETURN clause must come after.*line.*column", re.S)
+
+# Errors accepted for empty and whitespace-only queries
+EMPTY_QUERY_ERRORS = (UnexpectedEndOfInput, NomParsingError)
 
+# Functions that raise parser errors instead of returning them
+ERROR_RAISING_FUNCTIONS = (cypher_guard.check_syntax, cypher_guard.is_write)
 
 
 class TestNomParsingErrors:
     """Test that NomParsingError is raised for basic syntax errors."""
     
-    def test_nom_parsing_error_basic_syntax(self):
-        """Test that NomParsingError is raised for basic syntax errors."""
-        with pytest.raises(NomParsingError):
-            cypher_guard.check_syntax("MATCH (n RETURN n")
-    
-    def test_nom_parsing_error_incomplete_query(self):
-        """Test that NomParsingError is raised for incomplete queries."""
-        with pytest.raises(NomParsingError):
-            cypher_guard.check_syntax("MATCH (n:Person")
-    
-    def test_nom_parsing_error_invalid_keyword(self):
-        """Test that NomParsingError is raised for invalid keywords."""
-        with pytest.raises(NomParsingError):
-            cypher_guard.check_syntax("MATCH (n:Person) INVALID")
-    
-    def test_nom_parsing_error_incomplete_where(self):
-        """Test that NomParsingError is raised for incomplete WHERE clauses."""
-        with pytest.raises(NomParsingError):
-            cypher_guard.check_syntax("MATCH (n:Person) WHERE")
-    
-    def test_nom_parsing_error_multiple_return(self):
-        """Test that NomParsingError is raised for multiple RETURN clauses."""
+    @pytest.mark.parametrize("query", NOM_CASES)
+    def test_nom_parsing_error(self, query, check_syntax_cached):
+        """Test that NomParsingError is raised for each syntax error."""
         with pytest.raises(NomParsingError):
-            cypher_guard.check_syntax("MATCH (n:Person) RETURN n RETURN n")
-    
-    def test_nom_parsing_error_order_by_before_return(self):
-        """Test that NomParsingError is raised for ORDER BY before RETURN."""
-        with pytest.raises(NomParsingError):
-            cypher_guard.check_syntax("MATCH (n:Person) ORDER BY n.name RETURN n")
-    
-    def test_nom_parsing_error_delete_after_return(self):
-        """Test that NomParsingError is raised for DELETE after RETURN."""
-        with pytest.raises(NomParsingError):
-            cypher_guard.check_syntax("MATCH (n:Person) RETURN n DELETE n")
-    
-    def test_nom_parsing_error_set_after_return(self):
-        """Test that NomParsingError is raised for SET after RETURN."""
-        with pytest.raises(NomParsingError):
-            cypher_guard.check_syntax("MATCH (n:Person) RETURN n SET n.age = 30")
+            check_syntax_cached(query)
 
 
 class TestSpecificParserErrors:
     """Test specific parser error types that are actually raised."""
     
-    def test_return_before_other_clauses(self):
-        """Test that ReturnBeforeOtherClauses is raised when RETURN comes too early."""
-        with pytest.raises(ReturnBeforeOtherClauses):
-            cypher_guard.check_syntax("RETURN n MATCH (n:Person)")
-    
-    def test_where_before_match(self):
-        """Test that WhereBeforeMatch is raised when WHERE comes before MATCH."""
-        with pytest.raises(WhereBeforeMatch):
-            cypher_guard.check_syntax("WHERE n.age > 30 MATCH (n:Person) RETURN n")
-    
-    def test_match_after_return(self):
-        """Test that MatchAfterReturn is raised when MATCH comes after RETURN."""
-        with pytest.raises(MatchAfterReturn):
-            cypher_guard.check_syntax("MATCH (n:Person) RETURN n MATCH (m:Person)")
-    
-    def test_with_after_return(self):
-        """Test that WithAfterReturn is raised when WITH comes after RETURN."""
-        with pytest.raises(WithAfterReturn):
-            cypher_guard.check_syntax("MATCH (n:Person) RETURN n WITH n")
-    
-    def test_unwind_after_return(self):
-        """Test that UnwindAfterReturn is raised when UNWIND comes after RETURN."""
-        with pytest.raises(UnwindAfterReturn):
-            cypher_guard.check_syntax("MATCH (n:Person) RETURN n UNWIND [1,2,3] AS x")
+    @pytest.mark.parametrize("query,expected_error", SPECIFIC_CASES)
+    def test_specific_parser_error(self, query, expected_error, check_syntax_cached):
+        """Test that each misplaced clause raises its specific error type."""
+        with pytest.raises(expected_error) as exc_info:
+            check_syntax_cached(query)
+        
+        assert isinstance(exc_info.value, CypherParsingError), f"Error {expected_error.__name__} should inherit from CypherParsingError"
+
+
+class TestCheckSyntaxBatch:
+    """Test that check_syntax_batch reports the same errors as check_syntax."""
     
-    def test_invalid_clause_order_where_after_return(self):
-        """Test that InvalidClauseOrder is raised for WHERE after RETURN."""
-        with pytest.raises(InvalidClauseOrder):
-            cypher_guard.check_syntax("MATCH (n:Person) RETURN n WHERE n.age > 30")
+    def test_check_syntax_batch(self):
+        """Test that each query gets the error check_syntax raises, or None."""
+        queries = [query for query, _ in ERROR_CASES] + list(VALID_CASES)
+        
+        results = cypher_guard.check_syntax_batch(queries)
+        
+        assert len(results) == len(queries)
+        for (query, expected_error), error in zip(ERROR_CASES, results):
+            assert isinstance(error, expected_error), f"{query!r} gave {error!r}"
+        assert results[len(ERROR_CASES):] == [None] * len(VALID_CASES)
 
 
 class TestValidQueries:
     """Test that some queries that might seem invalid actually parse successfully."""
     
-    def test_create_after_return_is_valid(self):
-        """Test that CREATE after RETURN actually parses successfully."""
-        # This is surprising but true - CREATE after RETURN is valid Cypher
-        result = cypher_guard.check_syntax("MATCH (n:Person) RETURN n CREATE (m:Person)")
-        assert result is True
-    
-    def test_merge_after_return_is_valid(self):
-        """Test that MERGE after RETURN actually parses successfully."""
-        # This is surprising but true - MERGE after RETURN is valid Cypher
-        result = cypher_guard.check_syntax("MATCH (n:Person) RETURN n MERGE (m:Person)")
-        assert result is True
-    
-    def test_undefined_variable_is_valid_parsing(self):
-        """Test that undefined variables don't cause parsing errors."""
-        # Undefined variables are a validation issue, not a parsing issue
-        result = cypher_guard.check_syntax("MATCH (n:Person) RETURN undefined_var")
+    @pytest.mark.parametrize("query", VALID_CASES)
+    def test_query_is_valid(self, query):
+        """Test that the query parses successfully."""
+        result = cypher_guard.check_syntax(query)
         assert result is True
 
 
 class TestErrorInheritance:
     """Test that all parser errors inherit from the base CypherParsingError."""
     
-    def test_nom_parsing_error_inheritance(self):
-        """Test that NomParsingError inherits from CypherParsingError."""
-        with pytest.raises(NomParsingError) as exc_info:
-            cypher_guard.check_syntax("MATCH (n RETURN n")
+    def test_parser_errors_inheritance(self):
+        """Test that every parser error class derives from CypherParsingError."""
+        error_types = {NomParsingError, UnexpectedEndOfInput, InvalidSyntax}
+        error_types.update(expected_error for _, expected_error in SPECIFIC_CASES)
         
-        assert isinstance(exc_info.value, CypherParsingError)
-    
-    def test_specific_errors_inheritance(self):
-        """Test that specific parser errors inherit from CypherParsingError."""
-        error_queries = [
-            ("RETURN n MATCH (n:Person)", ReturnBeforeOtherClauses),
-            ("WHERE n.age > 30 MATCH (n:Person) RETURN n", WhereBeforeMatch),
-            ("MATCH (n:Person) RETURN n MATCH (m:Person)", MatchAfterReturn),
-            ("MATCH (n:Person) RETURN n WITH n", WithAfterReturn),
-            ("MATCH (n:Person) RETURN n UNWIND [1,2,3] AS x", UnwindAfterReturn),
-            ("MATCH (n:Person) RETURN n WHERE n.age > 30", InvalidClauseOrder),
-        ]
-        
-        for query, expected_error in error_queries:
-            with pytest.raises(expected_error) as exc_info:
-                cypher_guard.check_syntax(query)
-            
-            assert isinstance(exc_info.value, CypherParsingError), f"Error {expected_error.__name__} should inherit from CypherParsingError"
+        for error_type in error_types:
+            assert issubclass(error_type, CypherParsingError), f"Error {error_type.__name__} should inherit from CypherParsingError"
 
 
 class TestErrorMessages:
     """Test that error messages are informative and helpful."""
     
-    def test_nom_parsing_error_message(self):
+    def test_nom_parsing_error_message(self, check_syntax_cached):
         """Test that NomParsingError messages contain useful information."""
-        with pytest.raises(NomParsingError) as exc_info:
-            cypher_guard.check_syntax("MATCH (n:Person")
-        
-        error_msg = str(exc_info.value)
-        assert "Nom parsing error" in error_msg
-        assert "error Verify" in error_msg or "error Tag" in error_msg
+        with pytest.raises(NomParsingError, match=NOM_MESSAGE_RE):
+            check_syntax_cached("MATCH (n:Person")
     
-    def test_specific_error_messages(self):
+    def test_specific_error_messages(self, check_syntax_cached):
         """Test that specific error messages are descriptive."""
-        with pytest.raises(ReturnBeforeOtherClauses) as exc_info:
-            cypher_guard.check_syntax("RETURN n MATCH (n:Person)")
+        with pytest.raises(ReturnBeforeOtherClauses, match=RETURN_BEFORE_MESSAGE_RE):
+            check_syntax_cached("RETURN n MATCH (n:Person)")
         
-        error_msg = str(exc_info.value)
-        assert "RETURN clause must come after" in error_msg
-        assert "line" in error_msg and "column" in error_msg
-        
-        with pytest.raises(WhereBeforeMatch) as exc_info:
-            cypher_guard.check_syntax("WHERE n.age > 30 MATCH (n:Person) RETURN n")
-        
-        error_msg = str(exc_info.value)
-        assert "WHERE clause must come after" in error_msg
+        with pytest.raises(WhereBeforeMatch, match="WHERE clause must come after"):
+            check_syntax_cached("WHERE n.age > 30 MATCH (n:Person) RETURN n")
 
 
 class TestErrorConsistency:
     """Test that errors are consistent across different functions."""
     
-    def test_nom_parsing_error_consistency(self):
-        """Test that NomParsingError is consistent across functions that raise errors."""
-        invalid_query = "MATCH (n:Person) WHERE"
-        
-        # Functions that raise errors
-        error_raising_functions = [
-            cypher_guard.check_syntax,
-            lambda q: cypher_guard.is_write(q),
-        ]
-
-        for func in error_raising_functions:
-            with pytest.raises(NomParsingError):
-                func(invalid_query)
-        
-        # has_parser_errors returns boolean instead of raising
-        result = cypher_guard.has_parser_errors(invalid_query)
-        assert result is True
-    
-    def test_specific_error_consistency(self):
-        """Test that specific errors are consistent across functions that raise errors."""
-        invalid_query = "RETURN n MATCH (n:Person)"
-        
-        # Functions that raise errors
-        error_raising_functions = [
-            cypher_guard.check_syntax,
-            lambda q: cypher_guard.is_write(q),
-        ]
-
-        for func in error_raising_functions:
-            with pytest.raises(ReturnBeforeOtherClauses):
+    @pytest.mark.parametrize("invalid_query,expected_error", [
+        ("MATCH (n:Person) WHERE", NomParsingError),
+        ("RETURN n MATCH (n:Person)", ReturnBeforeOtherClauses),
+    ])
+    def test_error_consistency(self, invalid_query, expected_error):
+        """Test that each error is consistent across functions that raise errors."""
+        for func in ERROR_RAISING_FUNCTIONS:
+            with pytest.raises(expected_error):
                 func(invalid_query)
         
         # has_parser_errors returns boolean instead of raising
@@ -247,16 +188,30 @@ class TestErrorConsistency:
 class TestErrorEdgeCases:
     """Test edge cases and boundary conditions."""
     
-    def test_empty_query(self):
+    def test_empty_query(self, check_syntax_cached):
         """Test that empty queries raise appropriate errors."""
-        with pytest.raises((UnexpectedEndOfInput, NomParsingError)):
-            cypher_guard.check_syntax("")
+        with pytest.raises(EMPTY_QUERY_ERRORS):
+            check_syntax_cached("")
     
     def test_whitespace_only_query(self):
         """Test that whitespace-only queries raise appropriate errors."""
-        with pytest.raises((UnexpectedEndOfInput, NomParsingError)):
+        with pytest.raises(EMPTY_QUERY_ERRORS):
             cypher_guard.check_syntax("   \n\t  ")
     
+    def test_empty_query_exact_type(self, check_syntax_cached):
+        """Test that empty queries currently raise NomParsingError, not UnexpectedEndOfInput."""
+        with pytest.raises(EMPTY_QUERY_ERRORS) as exc_info:
+            check_syntax_cached("")
+        
+        assert type(exc_info.value) is NomParsingError
+    
+    def test_deeply_nested_invalid_query(self):
+        """Test that deeply nested invalid queries raise appropriate errors."""
+        nested_query = "MATCH " + "(" * 64 + "n:Person" + ")" * 64 + " RETURN n"
+        with pytest.raises((NomParsingError, InvalidSyntax)):
+            cypher_guard.check_syntax(nested_query)
+    
+    @pytest.mark.slow
     def test_very_long_invalid_query(self):
         """Test that very long invalid queries still raise appropriate errors."""
         long_query = "MATCH " + "(" * 1000 + "n:Person" + ")" * 1000 + " RETURN n"
@@ -264,59 +219,5 @@ class TestErrorEdgeCases:
             cypher_guard.check_syntax(long_query)
 
 
-class TestErrorTypeSummary:
-    """Test to document what error types are actually raised."""
-    
-    def test_error_type_summary(self):
-        """Document which error types are actually raised by the parser."""
-        # This test documents the current behavior for reference
-        
-        # These raise NomParsingError:
-        nom_error_cases = [
-            "MATCH (n:Person",  # Incomplete query
-            "MATCH (n:Person) WHERE",  # Incomplete WHERE
-            "MATCH (n:Person) INVALID",  # Invalid keyword
-            "MATCH (n:Person) RETURN n RETURN n",  # Multiple RETURN
-            "MATCH (n:Person) ORDER BY n.name RETURN n",  # ORDER BY before RETURN
-            "MATCH (n:Person) RETURN n DELETE n",  # DELETE after RETURN
-            "MATCH (n:Person) RETURN n SET n.age = 30",  # SET after RETURN
-        ]
-        
-        # These raise specific error types:
-        specific_error_cases = [
-            ("RETURN n MATCH (n:Person)", ReturnBeforeOtherClauses),
-            ("WHERE n.age > 30 MATCH (n:Person) RETURN n", WhereBeforeMatch),
-            ("MATCH (n:Person) RETURN n MATCH (m:Person)", MatchAfterReturn),
-            ("MATCH (n:Person) RETURN n WITH n", WithAfterReturn),
-            ("MATCH (n:Person) RETURN n UNWIND [1,2,3] AS x", UnwindAfterReturn),
-            ("MATCH (n:Person) RETURN n WHERE n.age > 30", InvalidClauseOrder),
-        ]
-        
-        # These parse successfully (surprisingly):
-        valid_cases = [
-            "MATCH (n:Person) RETURN n CREATE (m:Person)",  # CREATE after RETURN
-            "MATCH (n:Person) RETURN n MERGE (m:Person)",   # MERGE after RETURN
-            "MATCH (n:Person) RETURN undefined_var",        # Undefined variable
-        ]
-        
-        # Test NomParsingError cases
-        for query in nom_error_cases:
-            with pytest.raises(NomParsingError):
-                cypher_guard.check_syntax(query)
-        
-        # Test specific error cases
-        for query, expected_error in specific_error_cases:
-            with pytest.raises(expected_error):
-                cypher_guard.check_syntax(query)
-        
-        # Test valid cases
-        for query in valid_cases:
-            result = cypher_guard.check_syntax(query)
-            assert result is True
-        
-        # This test always passes - it's for documentation
-        assert True
-
-
 if __name__ == "__main__":
     pytest.main([__file__])
\ No newline at end of file
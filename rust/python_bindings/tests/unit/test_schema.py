@@ -1,44 +1,49 @@
 from cypher_guard import DbSchema, DbSchemaProperty, DbSchemaRelationshipPattern, DbSchemaConstraint, DbSchemaIndex, DbSchemaMetadata
-from cypher_guard import DbSchema, DbSchemaProperty, DbSchemaRelationshipPattern, DbSchemaConstraint, DbSchemaIndex, DbSchemaMetadata
+import copy
+import pickle
 import pytest
 
-# PropertyType is now internal-only, tests use strings directly
-
-def test_PropertyType_str_validation():
-    """Test that valid property type strings are accepted"""
-    valid_types = ["STRING", "INTEGER", "FLOAT", "BOOLEAN", "POINT", "DATE_TIME", "LIST"]
-    for prop_type in valid_types:
-        prop = DbSchemaProperty("test", prop_type)
-        assert prop.neo4j_type == prop_type
-
-def test_PropertyType_invalid_str():
-    """Test that invalid property type strings are rejected"""
-    with pytest.raises(Exception):  # Should raise ValueError for invalid type
-        DbSchemaProperty("test", "INVALID_TYPE")
-
-def test_DbSchemaProperty_init_from_args_valid():
-    # Test basic constructor (only name and neo4j_type are required)
-    prop = DbSchemaProperty("name", "STRING")
-    assert prop is not None
-    assert prop.name == "name"
-    assert prop.neo4j_type == "STRING"
-    assert prop.enum_values is None  # Should be None for basic constructor
-    assert prop.min_value is None
-    assert prop.max_value is None
-
-def test_DbSchemaProperty_init_from_args_invalid_arg_type():
-    with pytest.raises(TypeError):
-        DbSchemaProperty("name", 10)  # neo4j_type should be string, not int
-
+# Read-only from_dict inputs, built once at import
+PROPERTY_DICT = {"name": "name", "neo4j_type": "STRING", "enum_values": ["value1", "value2"], "min_value": None, "max_value": None, "distinct_value_count": None, "example_values": None}
+RELATIONSHIP_DICT = {"start": "nodeA", "end": "nodeB", "rel_type": "REL_A"}
+CONSTRAINT_DICT = {"id": 1, "name": "CONSTRAINT_NAME", "constraint_type": "UNIQUE", "entity_type": "NODE", "labels_or_types": ["label1"], "properties": ["prop1", "prop2"], "owned_index": "INDEX_NAME", "property_type": None}
+INDEX_DICT = {"label": "INDEX_NAME", "properties": ["prop1", "prop2"], "size": 10, "index_type": "BTREE", "values_selectivity": 0.5, "distinct_values": 1000}
+SCHEMA_DICT = {
+    "node_props": {"nodeA": [{"name": "name", "neo4j_type": "STRING", "enum_values": ["value1", "value2"]}, {"name": "age", "neo4j_type": "INTEGER"}],
+                   "nodeB": [{"name": "title", "neo4j_type": "STRING", "enum_values": ["value1", "value2"]}]},
+    "rel_props": {"relA": [{"name": "num", "neo4j_type": "INTEGER"}]},
+    "relationships": [{"start": "nodeA", "end": "nodeB", "rel_type": "relA"}],
+    "metadata": {"constraint": [{"id": 1, "name": "CONSTRAINT_NAME", "constraint_type": "UNIQUE", "entity_type": "NODE", "labels_or_types": ["label1", "label2"], "properties": ["prop1", "prop2"], "owned_index": "INDEX_NAME", "property_type": None}], "index": [{"label": "INDEX_NAME", "properties": ["prop1", "prop2"], "size": 10, "index_type": "BTREE", "values_selectivity": 0.5, "distinct_values": 1000}]},
+}
+
+@pytest.fixture(scope="module")
+def constraint():
+    return DbSchemaConstraint(1, "CONSTRAINT_NAME", "UNIQUE", "NODE", ["label1", "label2"], ["prop1", "prop2"], "INDEX_NAME", None)
+
+@pytest.fixture(scope="module")
+def index():
+    return DbSchemaIndex("INDEX_NAME", ["prop1", "prop2"], 10, "BTREE", 0.5, 1000)
+
+@pytest.fixture(scope="module")
+def metadata(constraint, index):
+    return DbSchemaMetadata([constraint], [index])
+
+@pytest.fixture(scope="module")
+def sample_schema():
+    return DbSchema.from_dict(SCHEMA_DICT)
 
 # PropertyType is now internal-only, tests use strings directly
 
-def test_PropertyType_str_validation():
+@pytest.mark.parametrize("prop_type", ["STRING", "INTEGER", "FLOAT", "BOOLEAN", "POINT", "DATE_TIME", "LIST"])
+def test_PropertyType_str_validation(prop_type):
     """Test that valid property type strings are accepted"""
-    valid_types = ["STRING", "INTEGER", "FLOAT", "BOOLEAN", "POINT", "DATE_TIME", "LIST"]
-    for prop_type in valid_types:
-        prop = DbSchemaProperty("test", prop_type)
-        assert prop.neo4j_type == prop_type
+    prop = DbSchemaProperty("test", prop_type)
+    assert prop.neo4j_type == prop_type
+
+@pytest.mark.parametrize("alias,prop_type", [("str", "STRING"), (" Int ", "INTEGER"), ("bool", "BOOLEAN"), ("date_time", "DATE_TIME")])
+def test_PropertyType_str_aliases(alias, prop_type):
+    """Test that aliases are matched case-insensitively and normalized"""
+    assert DbSchemaProperty("test", alias).neo4j_type == prop_type
 
 def test_PropertyType_invalid_str():
     """Test that invalid property type strings are rejected"""
@@ -55,22 +60,29 @@ def test_DbSchemaProperty_init_from_args_valid():
     assert prop.min_value is None
     assert prop.max_value is None
 
-def test_DbSchemaProperty_init_from_args_invalid_arg_type():
+def test_DbSchemaProperty_from_records():
+    props = DbSchemaProperty.from_records([("name", "STRING", ["value1", "value2"]), ("age", "INTEGER", None)])
+    assert [(p.name, p.neo4j_type, p.enum_values) for p in props] == [("name", "STRING", ["value1", "value2"]), ("age", "INTEGER", None)]
+    with pytest.raises(ValueError):
+        DbSchemaProperty.from_records([("age", "bigint", None)])
+
+def test_DbSchemaProperty_from_dicts():
+    props = DbSchemaProperty.from_dicts([PROPERTY_DICT, {"name": "age", "neo4j_type": "INTEGER"}])
+    assert [p.to_dict() for p in props] == [{"name": "name", "neo4j_type": "STRING", "enum_values": ["value1", "value2"]}, {"name": "age", "neo4j_type": "INTEGER"}]
+    assert DbSchemaProperty.from_dicts([]) == []
     with pytest.raises(TypeError):
-        DbSchemaProperty("name", 10)  # neo4j_type should be string, not int
+        DbSchemaProperty.from_dicts([PROPERTY_DICT, "age"])
 
+@pytest.mark.parametrize("args,exc,match", [
+    (("name", 10), TypeError, None),  # neo4j_type should be string, not int
+    (("name", "bigint"), ValueError, "Invalid property type"),
+])
+def test_DbSchemaProperty_invalid(args, exc, match):
+    with pytest.raises(exc, match=match):
+        DbSchemaProperty(*args)
 
 def test_DbSchemaProperty_init_from_dict_valid():
-    prop = DbSchemaProperty.from_dict({"name": "name", "neo4j_type": "STRING", "enum_values": ["value1", "value2"], "min_value": None, "max_value": None, "distinct_value_count": None, "example_values": None})
-    assert prop is not None
-    assert prop.name == "name"
-    assert prop.neo4j_type == "STRING"
-    assert prop.enum_values == ["value1", "value2"]
-    assert prop.min_value is None
-    assert prop.max_value is None
-
-def test_DbSchemaProperty_init_from_dict_valid_undeclared_keys():
-    prop = DbSchemaProperty.from_dict({"name": "name", "neo4j_type": "STRING", "enum_values": ["value1", "value2"], "min_value": None, "max_value": None, "distinct_value_count": None, "example_values": None})
+    prop = DbSchemaProperty.from_dict(PROPERTY_DICT)
     assert prop is not None
     assert prop.name == "name"
     assert prop.neo4j_type == "STRING"
@@ -86,28 +98,29 @@ def test_DbSchemaProperty_init_from_dict_valid_undeclared_keys():
     assert prop.enum_values == ["value1", "value2"]
     assert prop.min_value is None
     assert prop.max_value is None
-    assert prop.enum_values == ["value1", "value2"]
-    assert prop.min_value is None
-    assert prop.max_value is None
-
-def test_DbSchemaProperty_init_from_dict_invalid_neo4j_type():
-    with pytest.raises(ValueError):
-        DbSchemaProperty.from_dict({"name": "name", "neo4j_type": "bigint", "enum_values": ["value1", "value2"], "min_value": None, "max_value": None, "distinct_value_count": None, "example_values": None})
-def test_DbSchemaProperty_init_from_dict_invalid_neo4j_type():
-    with pytest.raises(ValueError):
-        DbSchemaProperty.from_dict({"name": "name", "neo4j_type": "bigint", "enum_values": ["value1", "value2"], "min_value": None, "max_value": None, "distinct_value_count": None, "example_values": None})
-
-def test_DbSchemaProperty_to_dict_valid():
-    prop = DbSchemaProperty("name", "STRING", enum_values=["value1", "value2"])
-    assert prop.to_dict() == {"name": "name", "neo4j_type": "STRING", "enum_values": ["value1", "value2"]}
-
-def test_DbSchemaProperty_repr_with_enum_values():
-    prop = DbSchemaProperty("name", "STRING", enum_values=["value1", "value2"])
-    assert prop.__repr__() == "DbSchemaProperty(name=name, neo4j_type=STRING, enum_values=['value1', 'value2'], min_value=None, max_value=None, distinct_value_count=None, example_values=None)"
 
-def test_DbSchemaProperty_repr_without_enum_values():
-    prop = DbSchemaProperty("name", "STRING")
-    assert prop.__repr__() == "DbSchemaProperty(name=name, neo4j_type=STRING, enum_values=None, min_value=None, max_value=None, distinct_value_count=None, example_values=None)"
+def test_DbSchemaProperty_from_dict_values_fallback():
+    # "values" is only read when enum_values or example_values is missing
+    prop = DbSchemaProperty.from_dict({**PROPERTY_DICT, "example_values": ["value1"], "values": 5})
+    assert prop.enum_values == ["value1", "value2"]
+    assert prop.example_values == ["value1"]
+    prop = DbSchemaProperty.from_dict({"name": "name", "neo4j_type": "STRING", "values": ["a", "b"], "distinct_count": 2})
+    assert prop.enum_values == ["a", "b"]
+    assert prop.example_values == ["a", "b"]
+    # values of a different length than distinct_count are not enum values,
+    # so they are not extracted when example_values is present either
+    prop = DbSchemaProperty.from_dict({"name": "n", "neo4j_type": "INTEGER", "example_values": ["1"], "values": [1, 2, 3], "distinct_count": 5})
+    assert prop.enum_values is None
+    assert prop.example_values == ["1"]
+
+@pytest.mark.parametrize("data,exc,match", [
+    ({**PROPERTY_DICT, "neo4j_type": "bigint"}, ValueError, "Invalid property type"),
+    ({"name": "name"}, KeyError, "neo4j_type"),
+    ({"name": "name", "neo4j_type": 10}, TypeError, None),
+])
+def test_DbSchemaProperty_from_dict_invalid(data, exc, match):
+    with pytest.raises(exc, match=match):
+        DbSchemaProperty.from_dict(data)
 
 def test_DbSchemaProperty_to_dict_valid():
     prop = DbSchemaProperty("name", "STRING", enum_values=["value1", "value2"])
@@ -117,14 +130,24 @@ def test_DbSchemaProperty_repr_with_enum_values():
     prop = DbSchemaProperty("name", "STRING", enum_values=["value1", "value2"])
     assert prop.__repr__() == "DbSchemaProperty(name=name, neo4j_type=STRING, enum_values=['value1', 'value2'], min_value=None, max_value=None, distinct_value_count=None, example_values=None)"
 
-def test_DbSchemaProperty_repr_without_enum_values():
+def test_DbSchemaProperty_fields_without_enum_values():
     prop = DbSchemaProperty("name", "STRING")
-    assert prop.__repr__() == "DbSchemaProperty(name=name, neo4j_type=STRING, enum_values=None, min_value=None, max_value=None, distinct_value_count=None, example_values=None)"
+    assert (prop.name, prop.neo4j_type) == ("name", "STRING")
+    assert prop.enum_values is None
+    assert prop.min_value is None
+    assert prop.max_value is None
+    assert prop.distinct_value_count is None
+    assert prop.example_values is None
 
 
-def test_DbSchemaProperty_repr_with_min_max_distinct_value():
+def test_DbSchemaProperty_fields_with_min_max_distinct_value():
     prop = DbSchemaProperty("name", "STRING", min_value=1.2, max_value=10, distinct_value_count=2)
-    assert prop.__repr__() == "DbSchemaProperty(name=name, neo4j_type=STRING, enum_values=None, min_value=1.2, max_value=10, distinct_value_count=2, example_values=None)"
+    assert (prop.name, prop.neo4j_type) == ("name", "STRING")
+    assert prop.enum_values is None
+    assert prop.min_value == 1.2
+    assert prop.max_value == 10
+    assert prop.distinct_value_count == 2
+    assert prop.example_values is None
 
 def test_DbSchemaProperty_str():
     prop = DbSchemaProperty("name", "STRING", enum_values=["value1", "value2"])
@@ -137,55 +160,29 @@ def test_DbSchemaRelationshipPattern_init_from_args_valid():
     assert rel.end == "nodeB"
     assert rel.rel_type == "REL_A"
 
-def test_DbSchemaRelationshipPattern_init_from_args_invalid_arg_type():
-    with pytest.raises(TypeError):
-        DbSchemaRelationshipPattern("nodeA", "nodeB", 10)
-def test_DbSchemaProperty_repr_with_min_max_distinct_value():
-    prop = DbSchemaProperty("name", "STRING", min_value=1.2, max_value=10, distinct_value_count=2)
-    assert prop.__repr__() == "DbSchemaProperty(name=name, neo4j_type=STRING, enum_values=None, min_value=1.2, max_value=10, distinct_value_count=2, example_values=None)"
-
-def test_DbSchemaProperty_str():
-    prop = DbSchemaProperty("name", "STRING", enum_values=["value1", "value2"])
-    assert str(prop) == "name: STRING"
-
-def test_DbSchemaRelationshipPattern_init_from_args_valid():
-    rel = DbSchemaRelationshipPattern("nodeA", "nodeB", "REL_A")
-    assert rel is not None
-    assert rel.start == "nodeA"
-    assert rel.end == "nodeB"
-    assert rel.rel_type == "REL_A"
-
-def test_DbSchemaRelationshipPattern_init_from_args_invalid_arg_type():
-    with pytest.raises(TypeError):
-        DbSchemaRelationshipPattern("nodeA", "nodeB", 10)
+@pytest.mark.parametrize("args,exc", [
+    (("nodeA", "nodeB", 10), TypeError),
+    ((10, "nodeB", "REL_A"), TypeError),
+])
+def test_DbSchemaRelationshipPattern_invalid(args, exc):
+    with pytest.raises(exc):
+        DbSchemaRelationshipPattern(*args)
 
 def test_DbSchemaRelationshipPattern_init_from_dict_valid():
-    rel = DbSchemaRelationshipPattern.from_dict({"start": "nodeA", "end": "nodeB", "rel_type": "REL_A"})
-    rel = DbSchemaRelationshipPattern.from_dict({"start": "nodeA", "end": "nodeB", "rel_type": "REL_A"})
+    rel = DbSchemaRelationshipPattern.from_dict(RELATIONSHIP_DICT)
     assert rel is not None
     assert rel.start == "nodeA"
     assert rel.end == "nodeB"
     assert rel.rel_type == "REL_A"
-    assert rel.rel_type == "REL_A"
-
-def test_DbSchemaRelationshipPattern_init_from_dict_invalid_arg_type():
-    with pytest.raises(TypeError):
-        DbSchemaRelationshipPattern.from_dict({"start": "nodeA", "end": "nodeB", "rel_type": 10})
 
-def test_DbSchemaRelationshipPattern_init_from_dict_invalid_keys():
-    with pytest.raises(KeyError):
-        DbSchemaRelationshipPattern.from_dict({"start": "nodeA", "end": "nodeB"})
-
-def test_DbSchemaRelationshipPattern_repr():
-    rel = DbSchemaRelationshipPattern("nodeA", "nodeB", "REL_A")
-    assert rel.__repr__() == "DbSchemaRelationshipPattern(start=nodeA, end=nodeB, rel_type=REL_A)"
-def test_DbSchemaRelationshipPattern_init_from_dict_invalid_arg_type():
-    with pytest.raises(TypeError):
-        DbSchemaRelationshipPattern.from_dict({"start": "nodeA", "end": "nodeB", "rel_type": 10})
-
-def test_DbSchemaRelationshipPattern_init_from_dict_invalid_keys():
-    with pytest.raises(KeyError):
-        DbSchemaRelationshipPattern.from_dict({"start": "nodeA", "end": "nodeB"})
+@pytest.mark.parametrize("data,exc,match", [
+    ({**RELATIONSHIP_DICT, "rel_type": 10}, TypeError, None),
+    ({"start": "nodeA", "end": "nodeB"}, KeyError, "rel_type"),
+    ({"end": "nodeB", "rel_type": "REL_A"}, KeyError, "start"),
+])
+def test_DbSchemaRelationshipPattern_from_dict_invalid(data, exc, match):
+    with pytest.raises(exc, match=match):
+        DbSchemaRelationshipPattern.from_dict(data)
 
 def test_DbSchemaRelationshipPattern_repr():
     rel = DbSchemaRelationshipPattern("nodeA", "nodeB", "REL_A")
@@ -206,12 +203,16 @@ def test_DbSchemaConstraint_init_from_args_valid():
     assert constraint.id == 1
     assert constraint.name == "CONSTRAINT_NAME"
 
-def test_DbSchemaConstraint_init_from_args_invalid_arg_type():
-    with pytest.raises(TypeError):
-        DbSchemaConstraint(1, "CONSTRAINT_NAME", "UNIQUE", "NODE", ["label1", "label2"], ["prop1", "prop2"], 10, None)
+@pytest.mark.parametrize("args,exc", [
+    ((1, "CONSTRAINT_NAME", "UNIQUE", "NODE", ["label1", "label2"], ["prop1", "prop2"], 10, None), TypeError),
+    (("1", "CONSTRAINT_NAME", "UNIQUE", "NODE", ["label1", "label2"], ["prop1", "prop2"], "INDEX_NAME", None), TypeError),
+])
+def test_DbSchemaConstraint_invalid(args, exc):
+    with pytest.raises(exc):
+        DbSchemaConstraint(*args)
 
 def test_DbSchemaConstraint_init_from_dict_valid():
-    constraint = DbSchemaConstraint.from_dict({"id": 1, "name": "CONSTRAINT_NAME", "constraint_type": "UNIQUE", "entity_type": "NODE", "labels_or_types": ["label1"], "properties": ["prop1", "prop2"], "owned_index": "INDEX_NAME", "property_type": None})
+    constraint = DbSchemaConstraint.from_dict(CONSTRAINT_DICT)
     assert constraint is not None
     assert constraint.id == 1
     assert constraint.name == "CONSTRAINT_NAME"
@@ -221,20 +222,21 @@ def test_DbSchemaConstraint_init_from_dict_valid():
     assert constraint.properties == ["prop1", "prop2"]
     assert constraint.owned_index == "INDEX_NAME"
 
-def test_DbSchemaConstraint_init_from_dict_invalid_arg_type():
-    with pytest.raises(TypeError):
-        DbSchemaConstraint.from_dict({"id": 1, "name": "CONSTRAINT_NAME", "constraint_type": "UNIQUE", "entity_type": "NODE", "labels_or_types": ["label1"], "properties": ["prop1", "prop2"], "owned_index": 10, "property_type": None})
+@pytest.mark.parametrize("data,exc,match", [
+    ({**CONSTRAINT_DICT, "owned_index": 10}, TypeError, None),
+    ({k: v for k, v in CONSTRAINT_DICT.items() if k != "id"}, KeyError, "id"),
+])
+def test_DbSchemaConstraint_from_dict_invalid(data, exc, match):
+    with pytest.raises(exc, match=match):
+        DbSchemaConstraint.from_dict(data)
 
-def test_DbSchemaConstraint_repr():
-    constraint = DbSchemaConstraint(1, "CONSTRAINT_NAME", "UNIQUE", "NODE", ["label1", "label2"], ["prop1", "prop2"], "INDEX_NAME", None)
+def test_DbSchemaConstraint_repr(constraint):
     assert constraint.__repr__() == "DbSchemaConstraint(id=1, name=CONSTRAINT_NAME, constraint_type=UNIQUE, entity_type=NODE, labels_or_types=[label1, label2], properties=[prop1, prop2], owned_index=INDEX_NAME, property_type=None)"
 
-def test_DbSchemaConstraint_str():
-    constraint = DbSchemaConstraint(1, "CONSTRAINT_NAME", "UNIQUE", "NODE", ["label1", "label2"], ["prop1", "prop2"], "INDEX_NAME", None)
+def test_DbSchemaConstraint_str(constraint):
     assert str(constraint) == "UNIQUE CONSTRAINT CONSTRAINT_NAME ON NODE (label1, label2).{prop1, prop2}"
 
-def test_DbSchemaConstraint_to_dict_valid():
-    constraint = DbSchemaConstraint(1, "CONSTRAINT_NAME", "UNIQUE", "NODE", ["label1", "label2"], ["prop1", "prop2"], "INDEX_NAME", None)
+def test_DbSchemaConstraint_to_dict_valid(constraint):
     assert constraint.to_dict() == {"id": 1, "name": "CONSTRAINT_NAME", "constraint_type": "UNIQUE", "entity_type": "NODE", "labels_or_types": ["label1", "label2"], "properties": ["prop1", "prop2"], "owned_index": "INDEX_NAME", "property_type": None}
 
 def test_DbSchemaIndex_init_from_args_valid():
@@ -247,12 +249,16 @@ def test_DbSchemaIndex_init_from_args_valid():
     assert index.values_selectivity == 0.5
     assert index.distinct_values == 1000
 
-def test_DbSchemaIndex_init_from_args_invalid_arg_type():
-    with pytest.raises(TypeError):
-        DbSchemaIndex("INDEX_NAME", ["prop1", "prop2"], 10, "BTREE", 0.5, "1000")
+@pytest.mark.parametrize("args,exc", [
+    (("INDEX_NAME", ["prop1", "prop2"], 10, "BTREE", 0.5, "1000"), TypeError),
+    (("INDEX_NAME", ["prop1", "prop2"], "10", "BTREE", 0.5, 1000), TypeError),
+])
+def test_DbSchemaIndex_invalid(args, exc):
+    with pytest.raises(exc):
+        DbSchemaIndex(*args)
 
 def test_DbSchemaIndex_init_from_dict_valid():
-    index = DbSchemaIndex.from_dict({"label": "INDEX_NAME", "properties": ["prop1", "prop2"], "size": 10, "index_type": "BTREE", "values_selectivity": 0.5, "distinct_values": 1000})
+    index = DbSchemaIndex.from_dict(INDEX_DICT)
     assert index is not None
     assert index.label == "INDEX_NAME"
     assert index.properties == ["prop1", "prop2"]
@@ -261,26 +267,42 @@ def test_DbSchemaIndex_init_from_dict_valid():
     assert index.values_selectivity == 0.5
     assert index.distinct_values == 1000
 
-def test_DbSchemaIndex_init_from_dict_invalid_arg_type():
-    with pytest.raises(TypeError):
-        DbSchemaIndex.from_dict({"label": "INDEX_NAME", "properties": ["prop1", "prop2"], "size": 10, "index_type": "BTREE", "values_selectivity": 0.5, "distinct_values": "1000"})
+@pytest.mark.parametrize("data,exc", [
+    ({**INDEX_DICT, "distinct_values": "1000"}, TypeError),
+    ({**INDEX_DICT, "size": "10"}, TypeError),
+])
+def test_DbSchemaIndex_from_dict_invalid(data, exc):
+    with pytest.raises(exc):
+        DbSchemaIndex.from_dict(data)
 
-def test_DbSchemaIndex_repr():
-    index = DbSchemaIndex("INDEX_NAME", ["prop1", "prop2"], 10, "BTREE", 0.5, 1000)
+def test_DbSchemaIndex_repr(index):
     assert index.__repr__() == "DbSchemaIndex(label=INDEX_NAME, properties=[prop1, prop2], size=10, index_type=BTREE, values_selectivity=0.5, distinct_values=1000)"
 
-def test_DbSchemaIndex_str():
-    index = DbSchemaIndex("INDEX_NAME", ["prop1", "prop2"], 10, "BTREE", 0.5, 1000)
+def test_DbSchemaIndex_str(index):
     assert str(index) == "INDEX BTREE ON INDEX_NAME (prop1, prop2)"
 
-def test_DbSchemaIndex_to_dict_valid():
-    index = DbSchemaIndex("INDEX_NAME", ["prop1", "prop2"], 10, "BTREE", 0.5, 1000)
+def test_DbSchemaIndex_to_dict_valid(index):
     assert index.to_dict() == {"label": "INDEX_NAME", "properties": ["prop1", "prop2"], "size": 10, "index_type": "BTREE", "values_selectivity": 0.5, "distinct_values": 1000}
 
-def test_DbSchemaMetadata_init_from_args_valid():
-    constraint = DbSchemaConstraint(1, "CONSTRAINT_NAME", "UNIQUE", "NODE", ["label1", "label2"], ["prop1", "prop2"], "INDEX_NAME", None)
-    index = DbSchemaIndex("INDEX_NAME", ["prop1", "prop2"], 10, "BTREE", 0.5, 1000)
-    metadata = DbSchemaMetadata([constraint], [index])
+@pytest.mark.parametrize("make,different", [
+    (lambda: DbSchemaProperty("name", "STRING"), DbSchemaProperty("name", "INTEGER")),
+    (lambda: DbSchemaRelationshipPattern("nodeA", "nodeB", "REL_A"), DbSchemaRelationshipPattern("nodeA", "nodeB", "REL_B")),
+])
+def test_schema_objects_eq_and_hash(make, different):
+    a, b = make(), make()
+    assert a == b and hash(a) == hash(b)
+    assert len({a, b}) == 1
+    assert a != different
+    assert a != "not a schema object"
+
+def test_DbSchemaConstraint_DbSchemaIndex_eq(constraint, index):
+    assert constraint == DbSchemaConstraint.from_dict(constraint.to_dict())
+    assert index == DbSchemaIndex.from_dict(index.to_dict())
+    assert constraint != DbSchemaConstraint.from_dict({**constraint.to_dict(), "name": "OTHER"})
+    assert index != DbSchemaIndex.from_dict({**index.to_dict(), "size": 11})
+    assert {constraint, index} == {DbSchemaConstraint.from_dict(constraint.to_dict()), DbSchemaIndex.from_dict(index.to_dict())}
+
+def test_DbSchemaMetadata_init_from_args_valid(constraint, index, metadata):
     assert metadata is not None
     assert len(metadata.constraint) == 1
     assert len(metadata.index) == 1
@@ -297,33 +319,21 @@ def test_DbSchemaMetadata_init_from_dict_valid():
     assert metadata.constraint[0].id == constraint["id"]
     assert metadata.index[0].label == index["label"]
 
-def test_DbSchemaMetadata_to_dict_valid():
-    constraint = DbSchemaConstraint(1, "CONSTRAINT_NAME", "UNIQUE", "NODE", ["label1", "label2"], ["prop1", "prop2"], "INDEX_NAME", None)
-    index = DbSchemaIndex("INDEX_NAME", ["prop1", "prop2"], 10, "BTREE", 0.5, 1000)
-    metadata = DbSchemaMetadata([constraint], [index])
+def test_DbSchemaMetadata_to_dict_valid(constraint, index, metadata):
     assert metadata.to_dict() == {"constraint": [constraint.to_dict()], "index": [index.to_dict()]}
 
-def test_DbSchemaMetadata_repr():
-    constraint = DbSchemaConstraint(1, "CONSTRAINT_NAME", "UNIQUE", "NODE", ["label1", "label2"], ["prop1", "prop2"], "INDEX_NAME", None)
-    index = DbSchemaIndex("INDEX_NAME", ["prop1", "prop2"], 10, "BTREE", 0.5, 1000)
-    metadata = DbSchemaMetadata([constraint], [index])
+def test_DbSchemaMetadata_repr(metadata):
     assert metadata.__repr__() == "DbSchemaMetadata(constraint=[DbSchemaConstraint(id=1, name=CONSTRAINT_NAME, constraint_type=UNIQUE, entity_type=NODE, labels_or_types=[label1, label2], properties=[prop1, prop2], owned_index=INDEX_NAME, property_type=None)], index=[DbSchemaIndex(label=INDEX_NAME, properties=[prop1, prop2], size=10, index_type=BTREE, values_selectivity=0.5, distinct_values=1000)])"
 
-def test_DbSchemaMetadata_str():
-    constraint = DbSchemaConstraint(1, "CONSTRAINT_NAME", "UNIQUE", "NODE", ["label1", "label2"], ["prop1", "prop2"], "INDEX_NAME", None)
-    index = DbSchemaIndex("INDEX_NAME", ["prop1", "prop2"], 10, "BTREE", 0.5, 1000)
-    metadata = DbSchemaMetadata([constraint], [index])
+def test_DbSchemaMetadata_str(metadata):
     assert str(metadata) == "DbSchemaMetadata(constraint=[UNIQUE CONSTRAINT CONSTRAINT_NAME ON NODE (label1, label2).{prop1, prop2}], index=[INDEX BTREE ON INDEX_NAME (prop1, prop2)])"
 
 
-def test_DbSchema_init_from_args_valid():
-    node_a_props = [DbSchemaProperty("name", neo4j_type="STRING", enum_values=["value1", "value2"]), DbSchemaProperty("age", "INTEGER")]
-    node_b_props = [DbSchemaProperty("title", "STRING", enum_values=["value1", "value2"])]
+def test_DbSchema_init_from_args_valid(metadata):
+    node_a_props = DbSchemaProperty.from_records([("name", "STRING", ["value1", "value2"]), ("age", "INTEGER", None)])
+    node_b_props = DbSchemaProperty.from_records([("title", "STRING", ["value1", "value2"])])
     rel_a_props = [DbSchemaProperty("num", "INTEGER")]
     rel_a_pattern = DbSchemaRelationshipPattern("nodeA", "nodeB", "relA")
-    constraint = DbSchemaConstraint(1, "CONSTRAINT_NAME", "UNIQUE", "NODE", ["label1", "label2"], ["prop1", "prop2"], "INDEX_NAME", None)
-    index = DbSchemaIndex("INDEX_NAME", ["prop1", "prop2"], 10, "BTREE", 0.5, 1000)
-    metadata = DbSchemaMetadata([constraint], [index])
 
     schema = DbSchema(
         node_props={"nodeA": node_a_props, "nodeB": node_b_props},
@@ -344,196 +354,54 @@ def test_DbSchema_init_from_args_valid():
     assert schema.relationships[0].start == "nodeA"
     assert schema.metadata.constraint[0].name == "CONSTRAINT_NAME"
     assert schema.metadata.index[0].label == "INDEX_NAME"
-
-    rel = DbSchemaRelationshipPattern("nodeA", "nodeB", "REL_A")
-    assert str(rel) == "(:nodeA)-[:REL_A]->(:nodeB)"
-
-def test_DbSchemaRelationshipPattern_to_dict_valid():
-    rel = DbSchemaRelationshipPattern("nodeA", "nodeB", "REL_A")
-    assert rel.to_dict() == {"start": "nodeA", "end": "nodeB", "rel_type": "REL_A"}
-
-
-def test_DbSchemaConstraint_init_from_args_valid():
-    constraint = DbSchemaConstraint(1, "CONSTRAINT_NAME", "UNIQUE", "NODE", ["label1", "label2"], ["prop1", "prop2"], "INDEX_NAME", None)
-    assert constraint is not None
-    assert constraint.id == 1
-    assert constraint.name == "CONSTRAINT_NAME"
-
-def test_DbSchemaConstraint_init_from_args_invalid_arg_type():
-    with pytest.raises(TypeError):
-        DbSchemaConstraint(1, "CONSTRAINT_NAME", "UNIQUE", "NODE", ["label1", "label2"], ["prop1", "prop2"], 10, None)
-
-def test_DbSchemaConstraint_init_from_dict_valid():
-    constraint = DbSchemaConstraint.from_dict({"id": 1, "name": "CONSTRAINT_NAME", "constraint_type": "UNIQUE", "entity_type": "NODE", "labels_or_types": ["label1"], "properties": ["prop1", "prop2"], "owned_index": "INDEX_NAME", "property_type": None})
-    assert constraint is not None
-    assert constraint.id == 1
-    assert constraint.name == "CONSTRAINT_NAME"
-    assert constraint.constraint_type == "UNIQUE"
-    assert constraint.entity_type == "NODE"
-    assert constraint.labels_or_types == ["label1"]
-    assert constraint.properties == ["prop1", "prop2"]
-    assert constraint.owned_index == "INDEX_NAME"
-
-def test_DbSchemaConstraint_init_from_dict_invalid_arg_type():
-    with pytest.raises(TypeError):
-        DbSchemaConstraint.from_dict({"id": 1, "name": "CONSTRAINT_NAME", "constraint_type": "UNIQUE", "entity_type": "NODE", "labels_or_types": ["label1"], "properties": ["prop1", "prop2"], "owned_index": 10, "property_type": None})
-
-def test_DbSchemaConstraint_repr():
-    constraint = DbSchemaConstraint(1, "CONSTRAINT_NAME", "UNIQUE", "NODE", ["label1", "label2"], ["prop1", "prop2"], "INDEX_NAME", None)
-    assert constraint.__repr__() == "DbSchemaConstraint(id=1, name=CONSTRAINT_NAME, constraint_type=UNIQUE, entity_type=NODE, labels_or_types=[label1, label2], properties=[prop1, prop2], owned_index=INDEX_NAME, property_type=None)"
-
-def test_DbSchemaConstraint_str():
-    constraint = DbSchemaConstraint(1, "CONSTRAINT_NAME", "UNIQUE", "NODE", ["label1", "label2"], ["prop1", "prop2"], "INDEX_NAME", None)
-    assert str(constraint) == "UNIQUE CONSTRAINT CONSTRAINT_NAME ON NODE (label1, label2).{prop1, prop2}"
-
-def test_DbSchemaConstraint_to_dict_valid():
-    constraint = DbSchemaConstraint(1, "CONSTRAINT_NAME", "UNIQUE", "NODE", ["label1", "label2"], ["prop1", "prop2"], "INDEX_NAME", None)
-    assert constraint.to_dict() == {"id": 1, "name": "CONSTRAINT_NAME", "constraint_type": "UNIQUE", "entity_type": "NODE", "labels_or_types": ["label1", "label2"], "properties": ["prop1", "prop2"], "owned_index": "INDEX_NAME", "property_type": None}
-
-def test_DbSchemaIndex_init_from_args_valid():
-    index = DbSchemaIndex("INDEX_NAME", ["prop1", "prop2"], 10, "BTREE", 0.5, 1000)
-    assert index is not None
-    assert index.label == "INDEX_NAME"
-    assert index.properties == ["prop1", "prop2"]
-    assert index.size == 10
-    assert index.index_type == "BTREE"
-    assert index.values_selectivity == 0.5
-    assert index.distinct_values == 1000
-
-def test_DbSchemaIndex_init_from_args_invalid_arg_type():
-    with pytest.raises(TypeError):
-        DbSchemaIndex("INDEX_NAME", ["prop1", "prop2"], 10, "BTREE", 0.5, "1000")
-
-def test_DbSchemaIndex_init_from_dict_valid():
-    index = DbSchemaIndex.from_dict({"label": "INDEX_NAME", "properties": ["prop1", "prop2"], "size": 10, "index_type": "BTREE", "values_selectivity": 0.5, "distinct_values": 1000})
-    assert index is not None
-    assert index.label == "INDEX_NAME"
-    assert index.properties == ["prop1", "prop2"]
-    assert index.size == 10
-    assert index.index_type == "BTREE"
-    assert index.values_selectivity == 0.5
-    assert index.distinct_values == 1000
-
-def test_DbSchemaIndex_init_from_dict_invalid_arg_type():
-    with pytest.raises(TypeError):
-        DbSchemaIndex.from_dict({"label": "INDEX_NAME", "properties": ["prop1", "prop2"], "size": 10, "index_type": "BTREE", "values_selectivity": 0.5, "distinct_values": "1000"})
-
-def test_DbSchemaIndex_repr():
-    index = DbSchemaIndex("INDEX_NAME", ["prop1", "prop2"], 10, "BTREE", 0.5, 1000)
-    assert index.__repr__() == "DbSchemaIndex(label=INDEX_NAME, properties=[prop1, prop2], size=10, index_type=BTREE, values_selectivity=0.5, distinct_values=1000)"
-
-def test_DbSchemaIndex_str():
-    index = DbSchemaIndex("INDEX_NAME", ["prop1", "prop2"], 10, "BTREE", 0.5, 1000)
-    assert str(index) == "INDEX BTREE ON INDEX_NAME (prop1, prop2)"
-
-def test_DbSchemaIndex_to_dict_valid():
-    index = DbSchemaIndex("INDEX_NAME", ["prop1", "prop2"], 10, "BTREE", 0.5, 1000)
-    assert index.to_dict() == {"label": "INDEX_NAME", "properties": ["prop1", "prop2"], "size": 10, "index_type": "BTREE", "values_selectivity": 0.5, "distinct_values": 1000}
-
-def test_DbSchemaMetadata_init_from_args_valid():
-    constraint = DbSchemaConstraint(1, "CONSTRAINT_NAME", "UNIQUE", "NODE", ["label1", "label2"], ["prop1", "prop2"], "INDEX_NAME", None)
-    index = DbSchemaIndex("INDEX_NAME", ["prop1", "prop2"], 10, "BTREE", 0.5, 1000)
-    metadata = DbSchemaMetadata([constraint], [index])
-    assert metadata is not None
-    assert len(metadata.constraint) == 1
-    assert len(metadata.index) == 1
-    assert metadata.constraint[0].id == constraint.id
-    assert metadata.index[0].label == index.label
-
-def test_DbSchemaMetadata_init_from_dict_valid():
-    constraint = {"id": 1, "name": "CONSTRAINT_NAME", "constraint_type": "UNIQUE", "entity_type": "NODE", "labels_or_types": ["label1"], "properties": ["prop1", "prop2"], "owned_index": "INDEX_NAME"}
-    index = {"label": "INDEX_NAME", "properties": ["prop1", "prop2"], "size": 10, "index_type": "BTREE", "values_selectivity": 0.5, "distinct_values": 1000}
-    metadata = DbSchemaMetadata.from_dict({"constraint": [constraint], "index": [index]})
-    assert metadata is not None
-    assert len(metadata.constraint) == 1
-    assert len(metadata.index) == 1
-    assert metadata.constraint[0].id == constraint["id"]
-    assert metadata.index[0].label == index["label"]
-
-def test_DbSchemaMetadata_to_dict_valid():
-    constraint = DbSchemaConstraint(1, "CONSTRAINT_NAME", "UNIQUE", "NODE", ["label1", "label2"], ["prop1", "prop2"], "INDEX_NAME", None)
-    index = DbSchemaIndex("INDEX_NAME", ["prop1", "prop2"], 10, "BTREE", 0.5, 1000)
-    metadata = DbSchemaMetadata([constraint], [index])
-    assert metadata.to_dict() == {"constraint": [constraint.to_dict()], "index": [index.to_dict()]}
-
-def test_DbSchemaMetadata_repr():
-    constraint = DbSchemaConstraint(1, "CONSTRAINT_NAME", "UNIQUE", "NODE", ["label1", "label2"], ["prop1", "prop2"], "INDEX_NAME", None)
-    index = DbSchemaIndex("INDEX_NAME", ["prop1", "prop2"], 10, "BTREE", 0.5, 1000)
-    metadata = DbSchemaMetadata([constraint], [index])
-    assert metadata.__repr__() == "DbSchemaMetadata(constraint=[DbSchemaConstraint(id=1, name=CONSTRAINT_NAME, constraint_type=UNIQUE, entity_type=NODE, labels_or_types=[label1, label2], properties=[prop1, prop2], owned_index=INDEX_NAME, property_type=None)], index=[DbSchemaIndex(label=INDEX_NAME, properties=[prop1, prop2], size=10, index_type=BTREE, values_selectivity=0.5, distinct_values=1000)])"
-
-def test_DbSchemaMetadata_str():
-    constraint = DbSchemaConstraint(1, "CONSTRAINT_NAME", "UNIQUE", "NODE", ["label1", "label2"], ["prop1", "prop2"], "INDEX_NAME", None)
-    index = DbSchemaIndex("INDEX_NAME", ["prop1", "prop2"], 10, "BTREE", 0.5, 1000)
-    metadata = DbSchemaMetadata([constraint], [index])
-    assert str(metadata) == "DbSchemaMetadata(constraint=[UNIQUE CONSTRAINT CONSTRAINT_NAME ON NODE (label1, label2).{prop1, prop2}], index=[INDEX BTREE ON INDEX_NAME (prop1, prop2)])"
-
-
-def test_DbSchema_init_from_args_valid():
-    node_a_props = [DbSchemaProperty("name", neo4j_type="STRING", enum_values=["value1", "value2"]), DbSchemaProperty("age", "INTEGER")]
-    node_b_props = [DbSchemaProperty("title", "STRING", enum_values=["value1", "value2"])]
-    rel_a_props = [DbSchemaProperty("num", "INTEGER")]
-    rel_a_pattern = DbSchemaRelationshipPattern("nodeA", "nodeB", "relA")
-    constraint = DbSchemaConstraint(1, "CONSTRAINT_NAME", "UNIQUE", "NODE", ["label1", "label2"], ["prop1", "prop2"], "INDEX_NAME", None)
-    index = DbSchemaIndex("INDEX_NAME", ["prop1", "prop2"], 10, "BTREE", 0.5, 1000)
-    metadata = DbSchemaMetadata([constraint], [index])
-
-    schema = DbSchema(
-        node_props={"nodeA": node_a_props, "nodeB": node_b_props},
-        rel_props={"relA": rel_a_props},
-        relationships=[rel_a_pattern],
+    # Keyword-built schemas answer lookups like from_dict ones
+    assert schema.has_label("nodeA")
+    assert schema.has_node_property("nodeB", "title")
+    assert not schema.has_node_property("nodeB", "age")
+
+
+@pytest.mark.parametrize("kwargs,match", [
+    ({"node_props": {"nodeA": [DbSchemaProperty("name", "STRING"), DbSchemaProperty("name", "INTEGER")]}}, "Property 'name' already exists for label 'nodeA'"),
+    ({"rel_props": {"relA": [DbSchemaProperty("num", "INTEGER"), DbSchemaProperty("num", "FLOAT")]}}, "Property 'num' already exists for relationship 'relA'"),
+    ({"relationships": [DbSchemaRelationshipPattern("nodeA", "nodeB", "relA"), DbSchemaRelationshipPattern("nodeA", "nodeB", "relA")]}, "Duplicate relationship"),
+])
+def test_DbSchema_init_duplicates_invalid(kwargs, match):
+    # The keyword constructor rejects duplicates like from_dict does
+    with pytest.raises(ValueError, match=match):
+        DbSchema(**kwargs)
+
+def test_DbSchema_from_soa(metadata, sample_schema):
+    node_a_props = DbSchemaProperty.from_records([("name", "STRING", ["value1", "value2"]), ("age", "INTEGER", None)])
+    node_b_props = DbSchemaProperty.from_records([("title", "STRING", ["value1", "value2"])])
+    schema = DbSchema.from_soa(
+        ["nodeA", "nodeB"], [node_a_props, node_b_props],
+        ["relA"], [[DbSchemaProperty("num", "INTEGER")]],
+        relationships=[DbSchemaRelationshipPattern("nodeA", "nodeB", "relA")],
         metadata=metadata,
     )
-    assert schema is not None
-    assert len(schema.node_props) == 2
-    assert len(schema.node_props["nodeA"]) == 2
-    assert len(schema.node_props["nodeB"]) == 1
-    assert len(schema.rel_props) == 1
-    assert len(schema.rel_props["relA"]) == 1
-    assert len(schema.relationships) == 1
-    assert schema.node_props["nodeA"][0].name == "name"
-    assert schema.node_props["nodeB"][0].name == "title"
-    assert schema.rel_props["relA"][0].name == "num"
-    assert schema.relationships[0].start == "nodeA"
-    assert schema.metadata.constraint[0].name == "CONSTRAINT_NAME"
-    assert schema.metadata.index[0].label == "INDEX_NAME"
-
+    assert schema.to_dict() == sample_schema.to_dict()
+    assert schema.has_label("nodeB")
+    assert schema.has_node_property("nodeA", "age")
+    with pytest.raises(ValueError):
+        DbSchema.from_soa(["nodeA", "nodeB"], [node_a_props])
 
-def test_DbSchema_init_from_dict_valid():
-    schema = DbSchema.from_dict({
-        "node_props": {"nodeA": [{"name": "name", "neo4j_type": "STRING", "enum_values": ["value1", "value2"], "min_value": None, "max_value": None, "distinct_value_count": None, "example_values": None}, {"name": "age", "neo4j_type": "INTEGER"}],
-                       "nodeB": [{"name": "title", "neo4j_type": "STRING", "enum_values": ["value1", "value2"], "min_value": None, "max_value": None, "distinct_value_count": None, "example_values": None}]},
-        "node_props": {"nodeA": [{"name": "name", "neo4j_type": "STRING", "enum_values": ["value1", "value2"], "min_value": None, "max_value": None, "distinct_value_count": None, "example_values": None}, {"name": "age", "neo4j_type": "INTEGER"}],
-                       "nodeB": [{"name": "title", "neo4j_type": "STRING", "enum_values": ["value1", "value2"], "min_value": None, "max_value": None, "distinct_value_count": None, "example_values": None}]},
-        "rel_props": {"relA": [{"name": "num", "neo4j_type": "INTEGER"}]},
-        "relationships": [{"start": "nodeA", "end": "nodeB", "rel_type": "relA"}],
-        "metadata": {"constraint": [{"id": 1, "name": "CONSTRAINT_NAME", "constraint_type": "UNIQUE", "entity_type": "NODE", "labels_or_types": ["label1", "label2"], "properties": ["prop1", "prop2"], "owned_index": "INDEX_NAME", "property_type": None}], "index": [{"label": "INDEX_NAME", "properties": ["prop1", "prop2"], "size": 10, "index_type": "BTREE", "values_selectivity": 0.5, "distinct_values": 1000}]},
-    })
-    assert schema is not None
+def test_DbSchema_init_from_dict_valid(sample_schema):
+    # sample_schema is DbSchema.from_dict(SCHEMA_DICT), built once per module
+    schema = sample_schema
     assert len(schema.node_props) == 2
     assert len(schema.node_props["nodeA"]) == 2
     assert len(schema.rel_props) == 1
     assert len(schema.rel_props["relA"]) == 1
     assert len(schema.relationships) == 1
-    assert len(schema.rel_props) == 1
-    assert len(schema.rel_props["relA"]) == 1
-    assert len(schema.relationships) == 1
     assert schema.node_props["nodeA"][0].name == "name"
     assert schema.node_props["nodeA"][1].name == "age"
     assert schema.rel_props["relA"][0].name == "num"
-    assert schema.node_props["nodeA"][1].name == "age"
-    assert schema.rel_props["relA"][0].name == "num"
     assert schema.relationships[0].start == "nodeA"
     assert schema.metadata.constraint[0].name == "CONSTRAINT_NAME"
     assert schema.metadata.index[0].label == "INDEX_NAME"
-    assert schema.metadata.constraint[0].name == "CONSTRAINT_NAME"
-    assert schema.metadata.index[0].label == "INDEX_NAME"
 
 def test_DbSchema_to_dict_valid():
-
-
     d = {
-        "node_props": {"nodeA": [{"name": "name", "neo4j_type": "STRING", "enum_values": ["value1", "value2"]}, {"name": "age", "neo4j_type": "INTEGER"}]},
         "node_props": {"nodeA": [{"name": "name", "neo4j_type": "STRING", "enum_values": ["value1", "value2"]}, {"name": "age", "neo4j_type": "INTEGER"}]},
         "rel_props": {"relA": [{"name": "num", "neo4j_type": "INTEGER"}]},
         "relationships": [{"start": "nodeA", "end": "nodeB", "rel_type": "relA"}],
@@ -541,54 +409,39 @@ def test_DbSchema_to_dict_valid():
     }
     schema = DbSchema.from_dict(d)
     assert schema.to_dict() == d
-    assert schema.to_dict() == d
 
-def test_DbSchema_str():
-    schema = DbSchema.from_dict({
-        "node_props": {"nodeA": [{"name": "name", "neo4j_type": "STRING", "enum_values": ["value1", "value2"]}, {"name": "age", "neo4j_type": "INTEGER"}],
-                       "nodeB": [{"name": "title", "neo4j_type": "STRING", "enum_values": ["value1", "value2"]}]},
-        "node_props": {"nodeA": [{"name": "name", "neo4j_type": "STRING", "enum_values": ["value1", "value2"]}, {"name": "age", "neo4j_type": "INTEGER"}],
-                       "nodeB": [{"name": "title", "neo4j_type": "STRING", "enum_values": ["value1", "value2"]}]},
-        "rel_props": {"relA": [{"name": "num", "neo4j_type": "INTEGER"}]},
-        "relationships": [{"start": "nodeA", "end": "nodeB", "rel_type": "relA"}],
-        "metadata": {"constraint": [{"id": 1, "name": "CONSTRAINT_NAME", "constraint_type": "UNIQUE", "entity_type": "NODE", "labels_or_types": ["label1", "label2"], "properties": ["prop1", "prop2"], "owned_index": "INDEX_NAME", "property_type": None}], "index": [{"label": "INDEX_NAME", "properties": ["prop1", "prop2"], "size": 10, "index_type": "BTREE", "values_selectivity": 0.5, "distinct_values": 1000}]},
-    })
-    assert "Nodes:" in str(schema)
-    assert "nodeA:\nname: STRING\nage: INTEGER" in str(schema)
-    assert "nodeB:\ntitle: STRING" in str(schema)
-    assert "Relationship Properties:" in str(schema)
-    assert "relA:\nnum: INTEGER" in str(schema)
-    assert "Relationships:" in str(schema)
-    assert "(:nodeA)-[:relA]->(:nodeB)" in str(schema)
-    assert "Constraints:" in str(schema)
-    assert "UNIQUE CONSTRAINT CONSTRAINT_NAME ON NODE (label1, label2).{prop1, prop2}" in str(schema)
-    assert "Indexes:" in str(schema)
-    assert "INDEX BTREE ON INDEX_NAME (prop1, prop2)" in str(schema)
-    assert "Nodes:" in str(schema)
-    assert "nodeA:\nname: STRING\nage: INTEGER" in str(schema)
-    assert "nodeB:\ntitle: STRING" in str(schema)
-    assert "Relationship Properties:" in str(schema)
-    assert "relA:\nnum: INTEGER" in str(schema)
-    assert "Relationships:" in str(schema)
-    assert "(:nodeA)-[:relA]->(:nodeB)" in str(schema)
-    assert "Constraints:" in str(schema)
-    assert "UNIQUE CONSTRAINT CONSTRAINT_NAME ON NODE (label1, label2).{prop1, prop2}" in str(schema)
-    assert "Indexes:" in str(schema)
-    assert "INDEX BTREE ON INDEX_NAME (prop1, prop2)" in str(schema)
-
-def test_DbSchema_repr():
-    schema = DbSchema.from_dict({
-        "node_props": {"nodeA": [{"name": "name", "neo4j_type": "STRING", "enum_values": ["value1", "value2"]}, {"name": "age", "neo4j_type": "INTEGER"}],
-                       "nodeB": [{"name": "title", "neo4j_type": "STRING", "enum_values": ["value1", "value2"]}]},
-        "node_props": {"nodeA": [{"name": "name", "neo4j_type": "STRING", "enum_values": ["value1", "value2"]}, {"name": "age", "neo4j_type": "INTEGER"}],
-                       "nodeB": [{"name": "title", "neo4j_type": "STRING", "enum_values": ["value1", "value2"]}]},
-        "rel_props": {"relA": [{"name": "num", "neo4j_type": "INTEGER"}]},
-        "relationships": [{"start": "nodeA", "end": "nodeB", "rel_type": "relA"}],
-        "metadata": {"constraint": [{"id": 1, "name": "CONSTRAINT_NAME", "constraint_type": "UNIQUE", "entity_type": "NODE", "labels_or_types": ["label1", "label2"], "properties": ["prop1", "prop2"], "owned_index": "INDEX_NAME", "property_type": None}], "index": [{"label": "INDEX_NAME", "properties": ["prop1", "prop2"], "size": 10, "index_type": "BTREE", "values_selectivity": 0.5, "distinct_values": 1000}]},
-    })
-    assert "DbSchema(node_props={" in repr(schema)
-    assert "'nodeA': DbSchemaProperty(name=name, neo4j_type=STRING, enum_values=['value1', 'value2'], min_value=None, max_value=None, distinct_value_count=None, example_values=None)" in repr(schema)
-    assert "DbSchemaProperty(name=age, neo4j_type=INTEGER, enum_values=None, min_value=None, max_value=None, distinct_value_count=None, example_values=None)" in repr(schema)
-    assert "'nodeB': DbSchemaProperty(name=title, neo4j_type=STRING, enum_values=['value1', 'value2'], min_value=None, max_value=None, distinct_value_count=None, example_values=None)" in repr(schema)
-    assert "relationships=[DbSchemaRelationshipPattern(start=nodeA, end=nodeB, rel_type=relA)]," in repr(schema)
-    assert "metadata=DbSchemaMetadata(constraint=[DbSchemaConstraint(id=1, name=CONSTRAINT_NAME, constraint_type=UNIQUE, entity_type=NODE, labels_or_types=[label1, label2], properties=[prop1, prop2], owned_index=INDEX_NAME, property_type=None)], index=[DbSchemaIndex(label=INDEX_NAME, properties=[prop1, prop2], size=10, index_type=BTREE, values_selectivity=0.5, distinct_values=1000)])" in repr(schema)
\ No newline at end of file
+def test_DbSchema_to_dict_returns_independent_copies(sample_schema):
+    # Callers may edit the result, so it must not be shared between calls
+    first = sample_schema.to_dict()
+    first["node_props"]["nodeA"].clear()
+    first["metadata"]["index"].clear()
+    assert sample_schema.to_dict() == SCHEMA_DICT
+
+def test_DbSchema_pickle_and_deepcopy(sample_schema):
+    for restored in (pickle.loads(pickle.dumps(sample_schema)), copy.deepcopy(sample_schema)):
+        assert restored is not sample_schema
+        assert restored.to_dict() == SCHEMA_DICT
+        assert restored.has_label("nodeA")
+        assert restored.has_node_property("nodeA", "age")
+
+def test_DbSchema_str(sample_schema):
+    assert "Nodes:" in str(sample_schema)
+    assert "nodeA:\nname: STRING\nage: INTEGER" in str(sample_schema)
+    assert "nodeB:\ntitle: STRING" in str(sample_schema)
+    assert "Relationship Properties:" in str(sample_schema)
+    assert "relA:\nnum: INTEGER" in str(sample_schema)
+    assert "Relationships:" in str(sample_schema)
+    assert "(:nodeA)-[:relA]->(:nodeB)" in str(sample_schema)
+    assert "Constraints:" in str(sample_schema)
+    assert "UNIQUE CONSTRAINT CONSTRAINT_NAME ON NODE (label1, label2).{prop1, prop2}" in str(sample_schema)
+    assert "Indexes:" in str(sample_schema)
+    assert "INDEX BTREE ON INDEX_NAME (prop1, prop2)" in str(sample_schema)
+
+def test_DbSchema_repr(sample_schema):
+    schema_repr = repr(sample_schema)
+    assert "DbSchema(node_props={" in schema_repr
+    assert "'nodeA': DbSchemaProperty(name=name, neo4j_type=STRING, enum_values=['value1', 'value2'], min_value=None, max_value=None, distinct_value_count=None, example_values=None)" in schema_repr
+    assert "DbSchemaProperty(name=age, neo4j_type=INTEGER, enum_values=None, min_value=None, max_value=None, distinct_value_count=None, example_values=None)" in schema_repr
+    assert "'nodeB': DbSchemaProperty(name=title, neo4j_type=STRING, enum_values=['value1', 'value2'], min_value=None, max_value=None, distinct_value_count=None, example_values=None)" in schema_repr
+    assert "relationships=[DbSchemaRelationshipPattern(start=nodeA, end=nodeB, rel_type=relA)]," in schema_repr
+    assert "metadata=DbSchemaMetadata(constraint=[DbSchemaConstraint(id=1, name=CONSTRAINT_NAME, constraint_type=UNIQUE, entity_type=NODE, labels_or_types=[label1, label2], properties=[prop1, prop2], owned_index=INDEX_NAME, property_type=None)], index=[DbSchemaIndex(label=INDEX_NAME, properties=[prop1, prop2], size=10, index_type=BTREE, values_selectivity=0.5, distinct_values=1000)])" in schema_repr
\ No newline at end of file
@@ -1,54 +1,6 @@
-from cypher_guard import validate_cypher, InvalidNodeLabel, InvalidRelationshipType, InvalidNodeProperty, InvalidRelationshipProperty, InvalidPropertyAccess, DbSchema
+from cypher_guard import validate_cypher, validate_cypher_batch, has_valid_cypher, has_valid_cypher_batch, get_validation_errors, parse_query, validate_parsed, is_write, clear_validation_cache, InvalidNodeLabel, InvalidRelationshipType, InvalidNodeProperty, InvalidRelationshipProperty, InvalidPropertyAccess, DbSchema
 import pytest
 
-@pytest.fixture(scope="session")
-def schema():
-    return DbSchema.from_dict({
-        "node_props": {
-            "Person": [
-                {"name": "name", "neo4j_type": "STRING"},
-                {"name": "age", "neo4j_type": "INTEGER"},
-                {"name": "created", "neo4j_type": "BOOLEAN"}
-            ],
-            "Movie": [
-                {"name": "title", "neo4j_type": "STRING"},
-                {"name": "year", "neo4j_type": "INTEGER"}
-            ],
-            "Station": [
-                {"name": "name", "neo4j_type": "STRING"},
-                {"name": "location", "neo4j_type": "POINT"}
-            ],
-            "Stop": [
-                {"name": "departs", "neo4j_type": "STRING"},
-                {"name": "arrives", "neo4j_type": "STRING"}
-            ]
-        },
-        "rel_props": {
-            "KNOWS": [
-                {"name": "since", "neo4j_type": "DATE_TIME"}
-            ],
-            "ACTED_IN": [
-                {"name": "role", "neo4j_type": "STRING"}
-            ],
-            "CALLS_AT": [],
-            "NEXT": [],
-            "LINK": [
-                {"name": "distance", "neo4j_type": "FLOAT"}
-            ]
-        },
-        "relationships": [
-            {"start": "Person", "end": "Person", "rel_type": "KNOWS"},
-            {"start": "Person", "end": "Movie", "rel_type": "ACTED_IN"},
-            {"start": "Stop", "end": "Station", "rel_type": "CALLS_AT"},
-            {"start": "Stop", "end": "Stop", "rel_type": "NEXT"},
-            {"start": "Station", "end": "Station", "rel_type": "LINK"}
-        ],
-        "metadata": {
-            "index": [],
-            "constraint": []
-        }
-    })
-
 def get_valid_cypher_queries():
     return [
         "MATCH (a:Person) WHERE a.age > 30 RETURN a.name",
@@ -91,51 +43,75 @@ def valid_qpp_cypher_queries():
     "MATCH (a:Person)-[r:KNOWS]->(b:Person) RETURN a.height",  # 'height' is not a valid property
     "MATCH (a:Person)-[r:KNOWS]->(b:Person) RETURN a.name, r.invalid_property",  # 'invalid_property' is not a valid property
 ])
-def test_cypher_query_invalid_property(query: str, schema: DbSchema):
-    errors = validate_cypher(query, schema)
+def test_cypher_query_invalid_property(query: str, db_schema: DbSchema):
+    errors = validate_cypher(query, db_schema)
     assert len(errors) > 0
 
 @pytest.mark.parametrize("query", [
    "MATCH (a:Person)-[r:FOLLOWS]->(b:Person) RETURN a.name",  # 'FOLLOWS' is not a valid relationship type
     "MATCH (a:Station)-[r:CONNECTS]->(b:Station) RETURN a.name",  # 'CONNECTS' is not a valid relationship type
 ])
-def test_cypher_query_invalid_relationship_type(query: str, schema: DbSchema):
-    errors = validate_cypher(query, schema)
+def test_cypher_query_invalid_relationship_type(query: str, db_schema: DbSchema):
+    errors = validate_cypher(query, db_schema)
     assert len(errors) > 0
 
 @pytest.mark.parametrize("query", [
    "MATCH (a:User) RETURN a.name",  # 'User' is not a valid label
     "MATCH (a:Train) RETURN a.name",  # 'Train' is not a valid label
 ])
-def test_cypher_query_invalid_node_label(query: str, schema: DbSchema):
-    errors = validate_cypher(query, schema)
+def test_cypher_query_invalid_node_label(query: str, db_schema: DbSchema):
+    errors = validate_cypher(query, db_schema)
     assert len(errors) > 0
 
 @pytest.mark.parametrize("query", [
    "MATCH (a:Person) WHERE a.age = '30' RETURN a.name",  # 'age' should be INTEGER, not STRING
     "MATCH (a:Person) WHERE a.name = 123 RETURN a.name",  # 'name' should be STRING, not INTEGER
 ])
-def test_cypher_query_invalid_property_type(query: str, schema: DbSchema):
-    errors = validate_cypher(query, schema)
+def test_cypher_query_invalid_property_type(query: str, db_schema: DbSchema):
+    errors = validate_cypher(query, db_schema)
     assert len(errors) > 0
 
 @pytest.mark.parametrize("query", [
    "MATCH (a:Person)<-[r:ACTED_IN]-(b:Movie) RETURN a.name",  # ACTED_IN is defined as Person->Movie, not Person<-Movie
     "MATCH (a:Stop)<-[r:CALLS_AT]-(b:Station) RETURN a.name",  # CALLS_AT is defined as Stop->Station, not Stop<-Station
 ])
-def test_cypher_query_invalid_relationship_direction(query: str, schema: DbSchema):
-    errors = validate_cypher(query, schema)
+def test_cypher_query_invalid_relationship_direction(query: str, db_schema: DbSchema):
+    errors = validate_cypher(query, db_schema)
     assert len(errors) > 0
 
 @pytest.mark.parametrize("query", [
     "MATCH (a:Person)-[r:KNOWS]->(b:Person) WHERE r.role = 'friend' RETURN a.name",  # KNOWS doesn't have a 'role' property, but ACTED_IN does
     "MATCH (a:Station)-[r:LINK]->(b:Station) WHERE r.duration = 10 RETURN a.name"  # LINK doesn't have a 'duration' property, and doesn't exist on any rel or node
 ])
-def test_cypher_query_invalid_relationship_property(query: str, schema: DbSchema):
-    errors = validate_cypher(query, schema)
+def test_cypher_query_invalid_relationship_property(query: str, db_schema: DbSchema):
+    errors = validate_cypher(query, db_schema)
+    assert len(errors) > 0
+
+@pytest.fixture(scope="session")
+def parsed(request):
+    """Parse each query once for all tests that use it"""
+    return parse_query(request.param)
+
+@pytest.mark.parametrize("parsed", [
+    "MATCH (a:Person)-[r:KNOWS]->(b:Person) RETURN a.height",
+    "MATCH (a:Person)-[r:FOLLOWS]->(b:Person) RETURN a.name",
+    "MATCH (a:User) RETURN a.name",
+    "MATCH (a:Person) WHERE a.age = '30' RETURN a.name",
+    "MATCH (a:Person)<-[r:ACTED_IN]-(b:Movie) RETURN a.name",
+    "MATCH (a:Person)-[r:KNOWS]->(b:Person) WHERE r.role = 'friend' RETURN a.name",
+], indirect=True)
+def test_validate_parsed_invalid(parsed, db_schema: DbSchema, schema_json):
+    errors = validate_parsed(parsed, db_schema)
     assert len(errors) > 0
+    assert errors == validate_cypher(parsed.query, db_schema)
+    assert validate_parsed(parsed, schema_json) == errors
 
-def test_complex_multiline_with_context_aware_validation(schema: DbSchema):
+def test_parsed_query_is_write():
+    for query in ["MATCH (n:Person) RETURN n", "MATCH (n:Person) RETURN n CREATE (m:Person)"]:
+        assert parse_query(query).is_write == is_write(query)
+    assert parse_query("MATCH (n:Person) RETURN n CREATE (m:Person)").is_write is True
+
+def test_complex_multiline_with_context_aware_validation(db_schema: DbSchema):
     """Test context-aware relationship property validation in complex multiline query with WITH clauses"""
     # This query should fail because r.role doesn't exist on KNOWS relationships (only on ACTED_IN)
     query = """
@@ -148,7 +124,7 @@ def test_complex_multiline_with_context_aware_validation(schema: DbSchema):
     RETURN a.name, b.name, m.title
     """
     
-    errors = validate_cypher(query, schema)
+    errors = validate_cypher(query, db_schema)
     
     # Should have exactly 1 error: r.role is invalid for KNOWS relationship
     assert len(errors) == 1
@@ -157,7 +133,7 @@ def test_complex_multiline_with_context_aware_validation(schema: DbSchema):
     # Should complain about r.role being invalid (r is bound to KNOWS relationship)
     assert any("r.role" in msg or ("r" in msg and "role" in msg) for msg in error_messages)
     
-def test_complex_multiline_valid_context_aware(schema: DbSchema):
+def test_complex_multiline_valid_context_aware(db_schema: DbSchema):
     """Test that the same query structure works when using correct relationship properties"""
     # This query should pass - using r.since (valid for KNOWS) and r2.role (valid for ACTED_IN)
     query = """
@@ -171,38 +147,43 @@ def test_complex_multiline_valid_context_aware(schema: DbSchema):
     """
     
     # Should pass now that we use valid Cypher syntax (r.since IS NOT NULL)
-    result = validate_cypher(query, schema)
+    result = validate_cypher(query, db_schema)
     assert len(result) == 0  # Should pass with valid temporal property check
 
-@pytest.mark.parametrize("query", get_valid_cypher_queries())
-def test_valid_queries(query: str, schema: DbSchema):
-    assert len(validate_cypher(query, schema)) == 0
-       
-@pytest.mark.parametrize("query", get_valid_qpp_cypher_queries())
-def test_valid_qpps(query: str, schema: DbSchema):
-    assert len(validate_cypher(query, schema)) == 0
+def test_valid_queries(db_schema: DbSchema, valid_cypher_queries):
+    results = has_valid_cypher_batch(valid_cypher_queries, db_schema)
+    assert [q for q, ok in zip(valid_cypher_queries, results) if not ok] == []
+
+def test_valid_qpps(db_schema: DbSchema, valid_qpp_cypher_queries):
+    results = has_valid_cypher_batch(valid_qpp_cypher_queries, db_schema)
+    assert [q for q, ok in zip(valid_qpp_cypher_queries, results) if not ok] == []
 
-def test_basic_validation_valid(schema: DbSchema):
+def test_has_valid_cypher_batch(db_schema: DbSchema):
+    queries = ["MATCH (a:Person) RETURN a.name", "MATCH (a:User) RETURN a.name"]
+    assert has_valid_cypher_batch(queries, db_schema) == [True, False]
+    assert has_valid_cypher_batch([], db_schema) == []
+
+def test_basic_validation_valid(db_schema: DbSchema):
     query = "MATCH (p:Person) RETURN p.name"
-    assert len(validate_cypher(query, schema)) == 0
+    assert len(validate_cypher(query, db_schema)) == 0
 
-def test_relationship_pattern_valid(schema: DbSchema):
+def test_relationship_pattern_valid(db_schema: DbSchema):
     query = "MATCH (a:Person)-[r:KNOWS {since: 2020}]->(b:Person) RETURN a.name, r.since"
-    assert len(validate_cypher(query, schema)) == 0
+    assert len(validate_cypher(query, db_schema)) == 0
 
-def test_quantified_path_pattern_valid(schema: DbSchema):
+def test_quantified_path_pattern_valid(db_schema: DbSchema):
     query = """
     MATCH ((a:Stop)-[:NEXT]->(b:Stop)){1,3}
     RETURN a.departs
     """
-    assert len(validate_cypher(query, schema)) == 0
+    assert len(validate_cypher(query, db_schema)) == 0
 
-def test_merge_clause_valid(schema: DbSchema):
+def test_merge_clause_valid(db_schema: DbSchema):
     query = "MERGE (a:Person {name: 'Alice'}) ON CREATE SET a.created = true"
-    assert len(validate_cypher(query, schema)) == 0
+    assert len(validate_cypher(query, db_schema)) == 0
 
 @pytest.mark.skip(reason="Known issue: Rust validation bug with multiple MATCH clauses causing integer overflow")
-def test_path_variable_with_predicate_valid(schema: DbSchema):
+def test_path_variable_with_predicate_valid(db_schema: DbSchema):
     query = """
     MATCH (bfr:Station),
           (ndl:Station)
@@ -210,55 +191,98 @@ def test_path_variable_with_predicate_valid(schema: DbSchema):
     WHERE bfr.name = 'test'
     RETURN bfr.name
     """
-    assert len(validate_cypher(query, schema)) == 0
+    assert len(validate_cypher(query, db_schema)) == 0
 
-def test_with_clause_valid(schema: DbSchema):
+def test_with_clause_valid(db_schema: DbSchema):
     query = "MATCH (a:Person) WITH a RETURN a.name"
-    assert len(validate_cypher(query, schema)) == 0
+    assert len(validate_cypher(query, db_schema)) == 0
 
-def test_with_clause_alias_valid(schema: DbSchema):
+def test_with_clause_alias_valid(db_schema: DbSchema):
     query = "MATCH (a:Person) WITH a AS b RETURN b.name"
-    assert len(validate_cypher(query, schema)) == 0
+    assert len(validate_cypher(query, db_schema)) == 0
 
-def test_with_clause_wildcard_valid(schema: DbSchema):
+def test_with_clause_wildcard_valid(db_schema: DbSchema):
     query = "MATCH (a:Person) WITH * RETURN a.name"
-    assert len(validate_cypher(query, schema)) == 0
+    assert len(validate_cypher(query, db_schema)) == 0
 
-def test_with_clause_invalid_variable(schema: DbSchema):
+def test_with_clause_invalid_variable(db_schema: DbSchema):
     query = "MATCH (a:Person) WITH b RETURN b.name"
-    errors = validate_cypher(query, schema)
+    errors = validate_cypher(query, db_schema)
     assert errors and any("Undefined variable" in e for e in errors)
 
-def test_with_clause_invalid_alias_expression(schema: DbSchema):
+def test_with_clause_invalid_alias_expression(db_schema: DbSchema):
     query = "MATCH (a:Person) WITH b AS c RETURN c.name"
-    errors = validate_cypher(query, schema)
+    errors = validate_cypher(query, db_schema)
     assert errors and any("Undefined variable" in e for e in errors)
 
-def test_invalid_node_label(schema):
-    errors = validate_cypher("MATCH (a:User) RETURN a.name", schema)
+def test_invalid_node_label(db_schema):
+    errors = validate_cypher("MATCH (a:User) RETURN a.name", db_schema)
     assert len(errors) > 0
     assert any("Invalid node label" in error for error in errors)
 
-def test_invalid_relationship_type(schema):
-    errors = validate_cypher("MATCH (a:Person)-[r:FOLLOWS]->(b:Person) RETURN a.name", schema)
+def test_invalid_relationship_type(db_schema):
+    errors = validate_cypher("MATCH (a:Person)-[r:FOLLOWS]->(b:Person) RETURN a.name", db_schema)
     assert len(errors) > 0
     assert any("Invalid relationship type" in error for error in errors)
 
-def test_invalid_node_property(schema):
-    errors = validate_cypher("MATCH (a:Person) RETURN a.invalid_prop", schema)
+def test_invalid_node_property(db_schema):
+    errors = validate_cypher("MATCH (a:Person) RETURN a.invalid_prop", db_schema)
     assert len(errors) > 0
     assert any("Invalid property access" in error for error in errors)
 
-def test_invalid_relationship_property(schema):
-    errors = validate_cypher("MATCH (a:Person)-[r:KNOWS]->(b:Person) RETURN r.invalid_prop", schema)
+def test_invalid_relationship_property(db_schema):
+    errors = validate_cypher("MATCH (a:Person)-[r:KNOWS]->(b:Person) RETURN r.invalid_prop", db_schema)
     assert len(errors) > 0
     assert any("Invalid property access" in error for error in errors)
 
-def test_invalid_property_access(schema):
-    errors = validate_cypher("MATCH (a:Person) RETURN a.height", schema)
+def test_invalid_property_access(db_schema):
+    errors = validate_cypher("MATCH (a:Person) RETURN a.height", db_schema)
     assert len(errors) > 0
     assert any("Invalid property access" in error for error in errors)
 
+def test_json_schema_string(schema_json):
+    # The second call reuses the schema parsed by the first
+    assert validate_cypher("MATCH (a:Person) RETURN a.name", schema_json) == []
+    assert len(validate_cypher("MATCH (a:User) RETURN a.name", schema_json)) > 0
+
+def test_invalid_schema_argument():
+    with pytest.raises(TypeError):
+        validate_cypher("MATCH (a:Person) RETURN a.name", 42)
+
+def test_repeated_validation_uses_cache(db_schema: DbSchema):
+    query = "MATCH (a:Person) RETURN a.height"
+    first = validate_cypher(query, db_schema)
+    assert validate_cypher(query, db_schema) == first
+    clear_validation_cache()
+    assert validate_cypher(query, db_schema) == first
+
+def test_cache_matches_query_text(db_schema: DbSchema):
+    # Equal queries built separately are distinct str objects with the same hash
+    query = "MATCH (a:Person) RETURN a." + "height"
+    same_query = "".join(["MATCH (a:Person) RETURN a.", "height"])
+    assert validate_cypher(query, db_schema) == validate_cypher(same_query, db_schema)
+    assert validate_cypher("MATCH (a:Person) RETURN a.name", db_schema) == []
+
+def test_validate_cypher_batch(db_schema: DbSchema, valid_cypher_queries):
+    queries = valid_cypher_queries + ["MATCH (a:User) RETURN a.name"]
+    results = validate_cypher_batch(queries, db_schema)
+    assert results == [validate_cypher(q, db_schema) for q in queries]
+    assert all(errors == [] for errors in results[:-1])
+    assert len(results[-1]) > 0
+
+def test_has_valid_cypher(db_schema: DbSchema):
+    assert has_valid_cypher("MATCH (a:Person) RETURN a.name", db_schema)
+    assert not has_valid_cypher("MATCH (a:User)-[:LIKES]->(b:Thing) RETURN a.height", db_schema)
+    assert not has_valid_cypher("MATCH (a:Person RETURN a.name", db_schema)
+
+def test_get_validation_errors(db_schema: DbSchema):
+    query = "MATCH (a:User) RETURN a.name"
+    errors = get_validation_errors(query, db_schema)
+    assert [e.code for e in errors] == ["InvalidNodeLabel"]
+    assert [str(e) for e in errors] == validate_cypher(query, db_schema)
+    assert errors[0].message == str(errors[0])
+    assert get_validation_errors("MATCH (a:Person) RETURN a.name", db_schema) == []
+
 def test_direct_invalid_node_label():
     from cypher_guard import InvalidNodeLabel
     import pytest
@@ -0,0 +1,67 @@
+#!/bin/bash
+
+# Profile-guided build of the Python extension
+# Usage: ./scripts/pgo-build.sh
+#
+# Builds an instrumented wheel, trains it on the Python validation tests
+# (the same query corpus end users send), then rebuilds the wheel with the
+# merged profile. Requires llvm-profdata: rustup component add llvm-tools-preview
+
+set -e
+
+# Colors for output
+RED='\033[0;31m'
+GREEN='\033[0;32m'
+BLUE='\033[0;34m'
+NC='\033[0m' # No Color
+
+print_info() {
+    echo -e "${BLUE}[INFO]${NC} $1"
+}
+
+print_success() {
+    echo -e "${GREEN}[SUCCESS]${NC} $1"
+}
+
+print_error() {
+    echo -e "${RED}[ERROR]${NC} $1"
+}
+
+PGO_DIR="${PGO_DIR:-/tmp/cypher-guard-pgo}"
+
+# Prefer the llvm-profdata shipped with the active toolchain, its profile
+# format matches rustc's LLVM version
+LLVM_PROFDATA="$(find "$(rustc --print sysroot)" -name llvm-profdata -type f 2>/dev/null | head -1)"
+if [ -z "$LLVM_PROFDATA" ]; then
+    LLVM_PROFDATA="$(command -v llvm-profdata || true)"
+fi
+if [ -z "$LLVM_PROFDATA" ]; then
+    print_error "llvm-profdata not found. Run: rustup component add llvm-tools-preview"
+    exit 1
+fi
+
+install_wheel() {
+    WHEEL_FILE=$(find target/wheels/ -name "cypher_guard-*.whl" -type f | head -1)
+    uv pip install --reinstall-package cypher-guard "$WHEEL_FILE"
+}
+
+rm -rf "$PGO_DIR" target/wheels/
+mkdir -p "$PGO_DIR"
+uv sync --no-install-project
+
+print_info "Building instrumented wheel..."
+RUSTFLAGS="-Cprofile-generate=$PGO_DIR" uv run maturin build --release
+install_wheel
+
+print_info "Training on the validation tests..."
+uv run --no-sync pytest rust/python_bindings/tests/unit/test_validation.py -q
+
+print_info "Merging profiles..."
+"$LLVM_PROFDATA" merge -o "$PGO_DIR/merged.profdata" "$PGO_DIR"
+
+print_info "Building optimized wheel..."
+rm -rf target/wheels/
+RUSTFLAGS="-Cprofile-use=$PGO_DIR/merged.profdata" uv run maturin build --release
+install_wheel
+
+print_success "PGO wheel installed from target/wheels/"